@@ -0,0 +1,87 @@
+from typing import Dict, Iterator, List, Tuple
+
+from chess.data import PieceColor, Position, BOARD_POSITIONS, BOARD_SIZE
+
+SQUARE_COUNT = BOARD_SIZE * BOARD_SIZE
+ROOK_DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+BISHOP_DIRECTIONS = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+QUEEN_DIRECTIONS = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+KNIGHT_OFFSETS = [(-1, -2), (1, -2), (-2, -1), (2, -1), (-2, 1), (2, 1), (-1, 2), (1, 2)]
+KING_OFFSETS = QUEEN_DIRECTIONS
+PAWN_DIRECTION_BY_COLOR = {PieceColor.WHITE: 1, PieceColor.BLACK: -1}
+
+POSITIONS = BOARD_POSITIONS
+
+
+def square_bit(square: int) -> int:
+    return 1 << square
+
+
+def iterate_squares(bitboard: int) -> Iterator[int]:
+    while bitboard:
+        lowest_bit = bitboard & -bitboard
+        yield lowest_bit.bit_length() - 1
+        bitboard ^= lowest_bit
+
+
+def squares_mask(positions) -> int:
+    mask = 0
+    for position in positions:
+        mask |= square_bit(position.row * BOARD_SIZE + position.col)
+    return mask
+
+
+def offset_targets(offsets: List[Tuple[int, int]]) -> List[Tuple[Position, ...]]:
+    return [
+        tuple(target for target in (position.offset(row=row, col=col) for row, col in offsets) if target is not None)
+        for position in POSITIONS
+    ]
+
+
+def build_rays(direction: Tuple[int, int]) -> List[Tuple[Position, ...]]:
+    rays = []
+    for position in POSITIONS:
+        ray = []
+        target = position.offset(row=direction[0], col=direction[1])
+        while target is not None:
+            ray.append(target)
+            target = target.offset(row=direction[0], col=direction[1])
+        rays.append(tuple(ray))
+    return rays
+
+
+KNIGHT_TARGETS = offset_targets(KNIGHT_OFFSETS)
+KING_TARGETS = offset_targets(KING_OFFSETS)
+PAWN_ATTACK_TARGETS = {color: offset_targets([(direction, -1), (direction, 1)]) for color, direction in PAWN_DIRECTION_BY_COLOR.items()}
+RAYS: Dict[Tuple[int, int], List[Tuple[Position, ...]]] = {direction: build_rays(direction) for direction in QUEEN_DIRECTIONS}
+
+KNIGHT_ATTACK_MASKS = [squares_mask(targets) for targets in KNIGHT_TARGETS]
+KING_ATTACK_MASKS = [squares_mask(targets) for targets in KING_TARGETS]
+PAWN_ATTACK_MASKS = {color: [squares_mask(targets) for targets in targets_by_square] for color, targets_by_square in PAWN_ATTACK_TARGETS.items()}
+RAY_MASKS = {direction: [squares_mask(ray) for ray in rays] for direction, rays in RAYS.items()}
+
+
+def build_between_and_line_masks() -> Tuple[List[List[int]], List[List[int]]]:
+    between = [[0] * SQUARE_COUNT for _ in range(SQUARE_COUNT)]
+    line = [[0] * SQUARE_COUNT for _ in range(SQUARE_COUNT)]
+    for square in range(SQUARE_COUNT):
+        for direction, rays in RAYS.items():
+            opposite_ray_mask = RAY_MASKS[(-direction[0], -direction[1])][square]
+            between_mask = 0
+            for target in rays[square]:
+                target_square = target.row * BOARD_SIZE + target.col
+                between[square][target_square] = between_mask
+                line[square][target_square] = RAY_MASKS[direction][square] | opposite_ray_mask | square_bit(square)
+                between_mask |= square_bit(target_square)
+    return between, line
+
+
+BETWEEN_MASKS, LINE_MASKS = build_between_and_line_masks()
+
+
+def between_mask(source: int, target: int) -> int:
+    return BETWEEN_MASKS[source][target]
+
+
+def line_mask(source: int, target: int) -> int:
+    return LINE_MASKS[source][target]
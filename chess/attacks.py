@@ -0,0 +1,72 @@
+from typing import Iterator, List, Optional, Tuple
+
+from chess.attack_tables import KNIGHT_ATTACK_MASKS, KING_ATTACK_MASKS, PAWN_ATTACK_MASKS, POSITIONS, iterate_squares
+from chess.board import Board
+from chess.data import PieceColor, PieceName, Position, square_from_position
+from chess.magic_bitboards import rook_attacks, bishop_attacks
+
+ROOK_ATTACKER_NAMES = (PieceName.ROOK, PieceName.QUEEN)
+BISHOP_ATTACKER_NAMES = (PieceName.BISHOP, PieceName.QUEEN)
+
+
+def iterate_attacker_masks(square: int, by_color: PieceColor, occupancy: int) -> Iterator[Tuple[Tuple[PieceName, ...], int]]:
+    yield (PieceName.PAWN,), PAWN_ATTACK_MASKS[by_color.opposite_color()][square] & occupancy
+    yield (PieceName.NIGHT,), KNIGHT_ATTACK_MASKS[square] & occupancy
+    yield (PieceName.KING,), KING_ATTACK_MASKS[square] & occupancy
+    yield BISHOP_ATTACKER_NAMES, bishop_attacks(square, occupancy) & occupancy
+    yield ROOK_ATTACKER_NAMES, rook_attacks(square, occupancy) & occupancy
+
+
+def is_square_attacked(board: Board, square: int, by_color: PieceColor, occupancy: Optional[int] = None) -> bool:
+    occupancy = board.get_occupancy() if occupancy is None else occupancy
+    for attacker_names, mask in iterate_attacker_masks(square, by_color, occupancy):
+        for attacker_square in iterate_squares(mask):
+            piece = board.get_piece(POSITIONS[attacker_square])
+            if piece.color == by_color and piece.name in attacker_names:
+                return True
+    return False
+
+
+def find_attacker(board: Board, mask: int, by_color: PieceColor, attacker_names: Tuple[PieceName, ...]) -> Optional[Tuple[int, PieceName]]:
+    for attacker_square in iterate_squares(mask):
+        piece = board.get_piece(POSITIONS[attacker_square])
+        if piece.color == by_color and piece.name in attacker_names:
+            return attacker_square, piece.name
+    return None
+
+
+def least_valuable_attacker(board: Board, square: int, by_color: PieceColor, occupancy: int) -> Optional[Tuple[int, PieceName]]:
+    attacker = (find_attacker(board, PAWN_ATTACK_MASKS[by_color.opposite_color()][square] & occupancy, by_color, (PieceName.PAWN,)) or
+                find_attacker(board, KNIGHT_ATTACK_MASKS[square] & occupancy, by_color, (PieceName.NIGHT,)))
+    if attacker is not None:
+        return attacker
+    bishop_mask = bishop_attacks(square, occupancy) & occupancy
+    attacker = find_attacker(board, bishop_mask, by_color, (PieceName.BISHOP,))
+    if attacker is not None:
+        return attacker
+    rook_mask = rook_attacks(square, occupancy) & occupancy
+    return (find_attacker(board, rook_mask, by_color, (PieceName.ROOK,)) or
+            find_attacker(board, rook_mask | bishop_mask, by_color, (PieceName.QUEEN,)) or
+            find_attacker(board, KING_ATTACK_MASKS[square] & occupancy, by_color, (PieceName.KING,)))
+
+
+def attackers(board: Board, square: int, by_color: PieceColor) -> List[Position]:
+    result = []
+    for attacker_names, mask in iterate_attacker_masks(square, by_color, board.get_occupancy()):
+        for attacker_square in iterate_squares(mask):
+            piece = board.get_piece(POSITIONS[attacker_square])
+            if piece.color == by_color and piece.name in attacker_names:
+                result.append(POSITIONS[attacker_square])
+    return result
+
+
+def checkers(board: Board, color: PieceColor) -> List[Position]:
+    king_positions = board.get_piece_position_by_name(PieceName.KING, color)
+    if len(king_positions) == 0:
+        return []
+    return attackers(board, square_from_position(king_positions[0]), color.opposite_color())
+
+
+def is_king_attacked(board: Board, color: PieceColor) -> bool:
+    king_positions = board.get_piece_position_by_name(PieceName.KING, color)
+    return any(is_square_attacked(board, square_from_position(position), color.opposite_color()) for position in king_positions)
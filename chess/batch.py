@@ -0,0 +1,126 @@
+import argparse
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Sequence
+
+from chess.board import Board, START_FEN, fen_board_factory, to_piece_positions
+from chess.data import PieceColor, PieceName, square_from_position, BOARD_SIZE
+from chess.evaluation import evaluate
+from chess.game_manager import GameManager
+from chess.piece_square_tables import PIECE_SQUARE_VALUES
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SQUARE_COUNT = BOARD_SIZE * BOARD_SIZE
+PIECE_NAME_COUNT = len(PieceName)
+EMPTY_CODE = 0
+
+
+def require_numpy():
+    if numpy is None:
+        raise ImportError('numpy is required for batch evaluation, install it with "pip install numpy"')
+
+
+def piece_code(color: PieceColor, piece_name: PieceName) -> int:
+    return (piece_name.value + 1) * (1 if color == PieceColor.WHITE else -1)
+
+
+@lru_cache(maxsize=None)
+def build_score_table():
+    require_numpy()
+    table = numpy.zeros((2 * PIECE_NAME_COUNT + 1, SQUARE_COUNT), dtype=numpy.int32)
+    for color in PieceColor:
+        for piece_name in PieceName:
+            table[piece_code(color, piece_name) + PIECE_NAME_COUNT] = PIECE_SQUARE_VALUES[color.value][piece_name.value]
+    return table
+
+
+@dataclass(frozen=True)
+class BatchEvaluation:
+    scores: 'numpy.ndarray'
+    legal_move_counts: 'numpy.ndarray'
+
+
+def encode_boards(boards: Sequence[Board]):
+    require_numpy()
+    encoded = numpy.zeros((len(boards), SQUARE_COUNT), dtype=numpy.int8)
+    for index, board in enumerate(boards):
+        row = encoded[index]
+        for position, piece in board.iterate_pieces():
+            row[square_from_position(position)] = piece_code(piece.color, piece.name)
+    return encoded
+
+
+def encode_situations(situations: Iterable[Dict[str, str]]):
+    require_numpy()
+    rows = []
+    for situation in situations:
+        row = [EMPTY_CODE] * SQUARE_COUNT
+        for position, piece in to_piece_positions(situation).items():
+            row[square_from_position(position)] = piece_code(piece.color, piece.name)
+        rows.append(row)
+    return numpy.array(rows, dtype=numpy.int8).reshape(len(rows), SQUARE_COUNT)
+
+
+def to_planes(encoded):
+    require_numpy()
+    codes = numpy.array([piece_code(color, piece_name) for color in PieceColor for piece_name in PieceName], dtype=numpy.int8)
+    return encoded[:, numpy.newaxis, :] == codes[numpy.newaxis, :, numpy.newaxis]
+
+
+def evaluate_encoded(encoded, colors: Sequence[PieceColor] = None):
+    require_numpy()
+    table = build_score_table()
+    scores = table[encoded.astype(numpy.intp) + PIECE_NAME_COUNT, numpy.arange(SQUARE_COUNT)].sum(axis=1)
+    if colors is not None:
+        scores *= numpy.array([1 if color == PieceColor.WHITE else -1 for color in colors], dtype=numpy.int32)
+    return scores
+
+
+def count_legal_moves(boards: Sequence[Board]) -> List[int]:
+    return [len(GameManager(board, board.color_to_move).generate_legal_moves(board, board.color_to_move)) for board in boards]
+
+
+def evaluate_boards(boards: Sequence[Board], with_legal_move_counts: bool = True) -> BatchEvaluation:
+    """Read the incrementally maintained board.evaluation into one NumPy array; evaluate_encoded scores pre-encoded arrays."""
+    require_numpy()
+    white = PieceColor.WHITE
+    scores = numpy.array([board.evaluation if board.color_to_move is white else -board.evaluation for board in boards], dtype=numpy.int32)
+    legal_move_counts = count_legal_moves(boards) if with_legal_move_counts else []
+    return BatchEvaluation(scores=scores, legal_move_counts=numpy.array(legal_move_counts, dtype=numpy.int32))
+
+
+def time_evaluation(name: str, board_count: int, function: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f'{name:<12} {elapsed * 1000:>10.2f}ms {int(board_count / elapsed) if elapsed > 0 else 0:>12} boards/s')
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare batch evaluation with a per-board loop')
+    parser.add_argument('--boards', type=int, default=10000)
+    parser.add_argument('--fen', default=START_FEN)
+    parser.add_argument('--bitboard', action='store_true', help='use the BitBoard backend')
+    args = parser.parse_args()
+
+    board_type = Board
+    if args.bitboard:
+        from chess.bitboard import BitBoard
+        board_type = BitBoard
+
+    boards = [fen_board_factory(args.fen, board_type) for _ in range(args.boards)]
+    colors = [board.color_to_move for board in boards]
+    time_evaluation('batch', len(boards), lambda: evaluate_boards(boards, with_legal_move_counts=False))
+    time_evaluation('encoded', len(boards), lambda: evaluate_encoded(encode_boards(boards), colors))
+    time_evaluation('per-board', len(boards), lambda: [evaluate(board, board.color_to_move) for board in boards])
+    time_evaluation('recomputed', len(boards), lambda: [board.compute_evaluation() for board in boards])
+
+
+if __name__ == '__main__':
+    main()
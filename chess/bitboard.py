@@ -0,0 +1,91 @@
+from typing import Dict, List, Optional, Tuple
+
+from chess.attack_tables import iterate_squares
+from chess.board import Board, board_factory
+from chess.data import Position, Piece, PieceColor, PieceName, square_from_position, position_from_square, BOARD_POSITIONS, BOARD_SIZE
+
+SQUARE_COUNT = BOARD_SIZE * BOARD_SIZE
+PIECE_NAME_COUNT = len(PieceName)
+
+
+def bitboard_index(color: PieceColor, piece_name: PieceName) -> int:
+    return color.value * PIECE_NAME_COUNT + piece_name.value
+
+
+class BitBoard(Board):
+    bitboards: List[int]
+    occupancy: List[int]
+    squares: List[Optional[Piece]]
+
+    @property
+    def piece_positions(self) -> Dict[Position, Piece]:
+        return dict(self.iterate_pieces())
+
+    @piece_positions.setter
+    def piece_positions(self, positions: Dict[Position, Piece]):
+        self.bitboards = [0] * (len(PieceColor) * PIECE_NAME_COUNT)
+        self.occupancy = [0] * len(PieceColor)
+        self.occupied = 0
+        self.squares = [None] * SQUARE_COUNT
+        for position, piece in positions.items():
+            self.store_piece(position, piece)
+
+    def copy(self):
+        board = BitBoard({}, self.pieces_taken.copy(), self.color_to_move, self.castling_rights,
+                         self.en_passant_position, self.halfmove_clock, self.fullmove_number)
+        board.bitboards = self.bitboards.copy()
+        board.occupancy = self.occupancy.copy()
+        board.squares = self.squares.copy()
+        board.occupied = self.occupied
+        board.hash = self.hash
+        board.evaluation = self.evaluation
+        return board
+
+    def iterate_pieces(self) -> List[Tuple[Position, Piece]]:
+        return [(position, piece) for position, piece in zip(BOARD_POSITIONS, self.squares) if piece is not None]
+
+    def compute_occupancy(self) -> int:
+        return self.occupied
+
+    def get_piece(self, position: Position):
+        if position is None or not position.belong_to_board():
+            return None
+        return self.squares[square_from_position(position)]
+
+    def store_piece(self, position: Position, piece: Piece):
+        square = square_from_position(position)
+        mask = 1 << square
+        self.bitboards[bitboard_index(piece.color, piece.name)] |= mask
+        self.occupancy[piece.color.value] |= mask
+        self.occupied |= mask
+        self.squares[square] = piece
+
+    def discard_piece(self, position: Position) -> Piece:
+        square = square_from_position(position)
+        piece = self.squares[square]
+        if piece is None:
+            raise KeyError(position)
+        mask = ~(1 << square)
+        self.bitboards[bitboard_index(piece.color, piece.name)] &= mask
+        self.occupancy[piece.color.value] &= mask
+        self.occupied &= mask
+        self.squares[square] = None
+        return piece
+
+    def get_bitboard(self, color: PieceColor, piece_name: PieceName) -> int:
+        return self.bitboards[bitboard_index(color, piece_name)]
+
+    def get_occupancy(self, color: Optional[PieceColor] = None) -> int:
+        if color is None:
+            return self.occupied
+        return self.occupancy[color.value]
+
+    def get_pieces_position(self, color: PieceColor) -> Dict[Position, Piece]:
+        return {position_from_square(square): self.squares[square] for square in iterate_squares(self.occupancy[color.value])}
+
+    def get_piece_position_by_name(self, piece_name: PieceName, color: PieceColor) -> List[Position]:
+        return [position_from_square(square) for square in iterate_squares(self.get_bitboard(color, piece_name))]
+
+
+def bitboard_factory(situation: Dict[str, str] = None) -> BitBoard:
+    return board_factory(situation, board_type=BitBoard)
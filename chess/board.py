@@ -1,47 +1,230 @@
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Tuple, Type
 
-from chess.data import Position, Piece, position_factory, piece_factory, PieceColor, Move, PieceName, INITIAL_KING_ROW_BY_COLOR
+from chess.data import Position, Piece, position_factory, piece_factory, position_from_square, square_from_position, position_at, piece_of, PieceColor, Move, MoveUndo, PieceName, INITIAL_KING_ROW_BY_COLOR, BOARD_SIZE
+from chess.piece_square_tables import piece_square_value
+from chess.zobrist import piece_key, castling_key, en_passant_key, side_key, SIDE_KEY
+
+LEFT_CASTLING_RIGHT_BY_COLOR = {PieceColor.WHITE: 1, PieceColor.BLACK: 4}
+RIGHT_CASTLING_RIGHT_BY_COLOR = {PieceColor.WHITE: 2, PieceColor.BLACK: 8}
+ALL_CASTLING_RIGHTS = 15
+CASTLING_RIGHTS_KEPT_BY_POSITION = {
+    position_at(col=0, row=0): ALL_CASTLING_RIGHTS & ~LEFT_CASTLING_RIGHT_BY_COLOR[PieceColor.WHITE],
+    position_at(col=4, row=0): ALL_CASTLING_RIGHTS & ~(LEFT_CASTLING_RIGHT_BY_COLOR[PieceColor.WHITE] | RIGHT_CASTLING_RIGHT_BY_COLOR[PieceColor.WHITE]),
+    position_at(col=7, row=0): ALL_CASTLING_RIGHTS & ~RIGHT_CASTLING_RIGHT_BY_COLOR[PieceColor.WHITE],
+    position_at(col=0, row=7): ALL_CASTLING_RIGHTS & ~LEFT_CASTLING_RIGHT_BY_COLOR[PieceColor.BLACK],
+    position_at(col=4, row=7): ALL_CASTLING_RIGHTS & ~(LEFT_CASTLING_RIGHT_BY_COLOR[PieceColor.BLACK] | RIGHT_CASTLING_RIGHT_BY_COLOR[PieceColor.BLACK]),
+    position_at(col=7, row=7): ALL_CASTLING_RIGHTS & ~RIGHT_CASTLING_RIGHT_BY_COLOR[PieceColor.BLACK],
+}
+
+START_FEN = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+PIECE_BY_FEN_CHAR = {
+    (str(name).upper() if color == PieceColor.WHITE else str(name)): piece_of(color, name)
+    for color in PieceColor for name in PieceName
+}
+FEN_CHAR_BY_PIECE = {piece: char for char, piece in PIECE_BY_FEN_CHAR.items()}
+CASTLING_RIGHT_BY_FEN_CHAR = {
+    'K': RIGHT_CASTLING_RIGHT_BY_COLOR[PieceColor.WHITE],
+    'Q': LEFT_CASTLING_RIGHT_BY_COLOR[PieceColor.WHITE],
+    'k': RIGHT_CASTLING_RIGHT_BY_COLOR[PieceColor.BLACK],
+    'q': LEFT_CASTLING_RIGHT_BY_COLOR[PieceColor.BLACK],
+}
+FEN_POSITIONS = [position_from_square(square) for square in range(BOARD_SIZE * BOARD_SIZE)]
+EN_PASSANT_POSITION_BY_FEN = {str(position): position for position in FEN_POSITIONS if position.row in (2, BOARD_SIZE - 3)}
 
 
 class Board:
     piece_positions: Dict[Position, Piece]
     pieces_taken: List[Piece]
+    color_to_move: PieceColor
+    castling_rights: int
+    en_passant_position: Optional[Position]
+    halfmove_clock: int
+    fullmove_number: int
+    hash: int
+    evaluation: int
+    occupied: int
 
-    def __init__(self, positions: Dict[Position, Piece], pieces_taken: List[Piece] = []):
+    def __init__(
+            self,
+            positions: Dict[Position, Piece],
+            pieces_taken: List[Piece] = None,
+            color_to_move: PieceColor = PieceColor.WHITE,
+            castling_rights: Optional[int] = None,
+            en_passant_position: Optional[Position] = None,
+            halfmove_clock: int = 0,
+            fullmove_number: int = 1,
+    ):
+        self.hash = 0
+        self.evaluation = 0
+        self.occupied = 0
         self.piece_positions = positions
-        self.pieces_taken = pieces_taken
+        self.occupied = self.compute_occupancy()
+        self.pieces_taken = [] if pieces_taken is None else pieces_taken
+        self.color_to_move = color_to_move
+        self.castling_rights = self.get_initial_castling_rights() if castling_rights is None else castling_rights
+        self.en_passant_position = en_passant_position
+        self.halfmove_clock = halfmove_clock
+        self.fullmove_number = fullmove_number
+        self.hash = self.compute_hash()
+        self.evaluation = self.compute_evaluation()
 
     def copy(self):
-        return Board(self.piece_positions.copy(), self.pieces_taken)
+        return Board(self.piece_positions.copy(), self.pieces_taken.copy(), self.color_to_move, self.castling_rights,
+                     self.en_passant_position, self.halfmove_clock, self.fullmove_number)
 
     def get_piece(self, position: Position):
         return self.piece_positions[position] if position in self.piece_positions else None
 
+    def put_piece(self, position: Position, piece: Piece):
+        if self.get_piece(position) is not None:
+            self.remove_piece(position)
+        self.hash ^= piece_key(piece, position)
+        self.evaluation += piece_square_value(piece, position)
+        self.store_piece(position, piece)
+
+    def remove_piece(self, position: Position) -> Piece:
+        piece = self.discard_piece(position)
+        self.hash ^= piece_key(piece, position)
+        self.evaluation -= piece_square_value(piece, position)
+        return piece
+
+    def store_piece(self, position: Position, piece: Piece):
+        self.piece_positions[position] = piece
+        self.occupied |= 1 << square_from_position(position)
+
+    def discard_piece(self, position: Position) -> Piece:
+        self.occupied &= ~(1 << square_from_position(position))
+        return self.piece_positions.pop(position)
+
+    def iterate_pieces(self) -> Iterable[Tuple[Position, Piece]]:
+        return self.piece_positions.items()
+
+    def compute_occupancy(self) -> int:
+        occupied = 0
+        for position in self.piece_positions:
+            occupied |= 1 << square_from_position(position)
+        return occupied
+
+    def get_occupancy(self, color: Optional[PieceColor] = None) -> int:
+        if color is None:
+            return self.occupied
+        occupied = 0
+        for position, piece in self.piece_positions.items():
+            if piece.color == color:
+                occupied |= 1 << square_from_position(position)
+        return occupied
+
+    def get_initial_castling_rights(self) -> int:
+        castling_rights = 0
+        for color in PieceColor:
+            row = INITIAL_KING_ROW_BY_COLOR[color]
+            if self.get_piece(position_at(col=4, row=row)) != piece_of(color, PieceName.KING):
+                continue
+            if self.get_piece(position_at(col=0, row=row)) == piece_of(color, PieceName.ROOK):
+                castling_rights |= LEFT_CASTLING_RIGHT_BY_COLOR[color]
+            if self.get_piece(position_at(col=7, row=row)) == piece_of(color, PieceName.ROOK):
+                castling_rights |= RIGHT_CASTLING_RIGHT_BY_COLOR[color]
+        return castling_rights
+
+    def compute_hash(self) -> int:
+        result = side_key(self.color_to_move) ^ castling_key(self.castling_rights) ^ self.get_en_passant_key()
+        for position, piece in self.iterate_pieces():
+            result ^= piece_key(piece, position)
+        return result
+
+    def compute_evaluation(self) -> int:
+        return sum(piece_square_value(piece, position) for position, piece in self.iterate_pieces())
+
+    def is_en_passant_capturable(self) -> bool:
+        en_passant_position = self.en_passant_position
+        if en_passant_position is None:
+            return False
+        pawn = piece_of(self.color_to_move, PieceName.PAWN)
+        pawn_row = en_passant_position.row - (1 if self.color_to_move == PieceColor.WHITE else -1)
+        for col in (en_passant_position.col - 1, en_passant_position.col + 1):
+            if 0 <= col < BOARD_SIZE and self.get_piece(position_at(col=col, row=pawn_row)) == pawn:
+                return True
+        return False
+
+    def get_en_passant_key(self) -> int:
+        return en_passant_key(self.en_passant_position) if self.is_en_passant_capturable() else 0
+
+    def set_color_to_move(self, color: PieceColor):
+        if self.color_to_move != color:
+            self.hash ^= self.get_en_passant_key()
+            self.color_to_move = color
+            self.hash ^= SIDE_KEY ^ self.get_en_passant_key()
+
     def move(self, move: Move):
-        if move.source not in self.piece_positions:
+        piece = self.get_piece(move.source)
+        if piece is None:
             raise ValueError(f'No piece found in {move.source} on the board')
+        rook_move = castling_rook_move(move, piece.color)
+        if rook_move is not None and self.get_piece(rook_move[0]) is None:
+            raise ValueError(f'No rook found in {rook_move[0]} to castle')
+
+        self.hash ^= self.get_en_passant_key()
+        self.remove_piece(move.source)
+        piece_taken_position = move.piece_taken_position if move.piece_taken_position is not None else move.target
+        is_capture = self.get_piece(piece_taken_position) is not None
+        if is_capture: self.pieces_taken.append(self.remove_piece(piece_taken_position))
+        self.put_piece(move.target, piece if move.promotion is None else piece_of(piece.color, move.promotion))
 
-        piece = self.piece_positions[move.source]
-        if move.piece_taken_position is not None: del self.piece_positions[move.piece_taken_position]
-        del self.piece_positions[move.source]
-        if move.target in self.piece_positions: self.pieces_taken.append(self.piece_positions[move.target])
-        self.piece_positions[move.target] = piece
+        if rook_move is not None:
+            self.put_piece(rook_move[1], self.remove_piece(rook_move[0]))
 
-        if move.is_left_castling:
-            del self.piece_positions[Position(col=0, row=INITIAL_KING_ROW_BY_COLOR[piece.color])]
-            self.piece_positions[Position(col=3, row=INITIAL_KING_ROW_BY_COLOR[piece.color])] = Piece(piece.color, PieceName.ROOK)
+        self.en_passant_position = position_at(col=move.source.col, row=(move.source.row + move.target.row) // 2) if move.is_two_step_pawn_move else None
+        castling_rights = (self.castling_rights &
+                           CASTLING_RIGHTS_KEPT_BY_POSITION.get(move.source, ALL_CASTLING_RIGHTS) &
+                           CASTLING_RIGHTS_KEPT_BY_POSITION.get(move.target, ALL_CASTLING_RIGHTS))
+        self.hash ^= castling_key(self.castling_rights) ^ castling_key(castling_rights)
+        self.castling_rights = castling_rights
+        self.halfmove_clock = 0 if is_capture or piece.name == PieceName.PAWN else self.halfmove_clock + 1
+        if piece.color == PieceColor.BLACK: self.fullmove_number += 1
+        self.color_to_move = self.color_to_move.opposite_color()
+        self.hash ^= SIDE_KEY ^ self.get_en_passant_key()
 
-        if move.is_right_castling:
-            del self.piece_positions[Position(col=7, row=INITIAL_KING_ROW_BY_COLOR[piece.color])]
-            self.piece_positions[Position(col=5, row=INITIAL_KING_ROW_BY_COLOR[piece.color])] = Piece(piece.color, PieceName.ROOK)
+    def make_move(self, move: Move) -> MoveUndo:
+        piece_taken_position = move.piece_taken_position if move.piece_taken_position is not None else move.target
+        undo = MoveUndo(
+            move=move,
+            piece_moved=self.get_piece(move.source),
+            piece_taken=self.get_piece(piece_taken_position),
+            piece_taken_position=piece_taken_position,
+            castling_rights=self.castling_rights,
+            en_passant_position=self.en_passant_position,
+            halfmove_clock=self.halfmove_clock,
+            hash=self.hash,
+        )
+        self.move(move)
+        return undo
+
+    def unmake_move(self, undo: MoveUndo):
+        move = undo.move
+        rook_move = castling_rook_move(move, undo.piece_moved.color)
+        if rook_move is not None:
+            self.put_piece(rook_move[0], self.remove_piece(rook_move[1]))
+
+        self.remove_piece(move.target)
+        self.put_piece(move.source, undo.piece_moved)
+        if undo.piece_taken is not None:
+            self.pieces_taken.pop()
+            self.put_piece(undo.piece_taken_position, undo.piece_taken)
+        self.color_to_move = self.color_to_move.opposite_color()
+        self.castling_rights = undo.castling_rights
+        self.en_passant_position = undo.en_passant_position
+        self.halfmove_clock = undo.halfmove_clock
+        if undo.piece_moved.color == PieceColor.BLACK: self.fullmove_number -= 1
+        self.hash = undo.hash
 
     def get_pieces_taken(self, color: PieceColor):
         return [piece for piece in self.pieces_taken if piece.color == color]
 
     def promote(self, position, piece_name):
-        if self.piece_positions[position] is None:
+        if self.get_piece(position) is None:
             raise ValueError(f'Position {position} as no piece')
-        self.piece_positions[position] = piece_name
+        self.remove_piece(position)
+        self.put_piece(position, piece_name)
 
     def get_pieces_position(self, color: PieceColor) -> Dict[Position, Piece]:
         return {k: v for k, v in self.piece_positions.items() if v.color == color}
@@ -49,16 +232,101 @@ class Board:
     def get_piece_position_by_name(self, piece_name: PieceName, color: PieceColor) -> List[Position]:
         return [position for position, piece in self.piece_positions.items() if piece.name == piece_name and piece.color == color]
 
+    def to_fen(self) -> str:
+        piece_positions = dict(self.iterate_pieces())
+        rows = []
+        for row in range(BOARD_SIZE - 1, -1, -1):
+            fen_row = ''
+            empty_count = 0
+            for position in FEN_POSITIONS[row * BOARD_SIZE:(row + 1) * BOARD_SIZE]:
+                piece = piece_positions.get(position)
+                if piece is None:
+                    empty_count += 1
+                    continue
+                if empty_count > 0:
+                    fen_row += str(empty_count)
+                    empty_count = 0
+                fen_row += FEN_CHAR_BY_PIECE[piece]
+            rows.append(fen_row + (str(empty_count) if empty_count > 0 else ''))
+        castling = ''.join(char for char, castling_right in CASTLING_RIGHT_BY_FEN_CHAR.items() if self.castling_rights & castling_right)
+        return ' '.join([
+            '/'.join(rows),
+            'w' if self.color_to_move == PieceColor.WHITE else 'b',
+            castling if castling else '-',
+            '-' if self.en_passant_position is None else str(self.en_passant_position),
+            str(self.halfmove_clock),
+            str(self.fullmove_number),
+        ])
+
+
+def castling_rook_move(move: Move, color: PieceColor) -> Optional[Tuple[Position, Position]]:
+    row = INITIAL_KING_ROW_BY_COLOR[color]
+    if move.is_left_castling:
+        return position_at(col=0, row=row), position_at(col=3, row=row)
+    if move.is_right_castling:
+        return position_at(col=7, row=row), position_at(col=5, row=row)
+    return None
+
 
 def to_piece_positions(situation: Dict[str, str]) -> Dict[Position, Piece]:
     return {position_factory(k): piece_factory(v) for k, v in situation.items()}
 
 
-def board_factory(situation: Dict[str, str] = None):
+def board_factory(situation: Dict[str, str] = None, board_type: Type[Board] = Board):
     my_situation = to_piece_positions({
         'a1': 'wr', 'b1': 'wn', 'c1': 'wb', 'd1': 'wq', 'e1': 'wk', 'f1': 'wb', 'g1': 'wn', 'h1': 'wr',
         'a2': 'wp', 'b2': 'wp', 'c2': 'wp', 'd2': 'wp', 'e2': 'wp', 'f2': 'wp', 'g2': 'wp', 'h2': 'wp',
         'a7': 'bp', 'b7': 'bp', 'c7': 'bp', 'd7': 'bp', 'e7': 'bp', 'f7': 'bp', 'g7': 'bp', 'h7': 'bp',
         'a8': 'br', 'b8': 'bn', 'c8': 'bb', 'd8': 'bq', 'e8': 'bk', 'f8': 'bb', 'g8': 'bn', 'h8': 'br'
     }) if situation is None else to_piece_positions(situation)
-    return Board(positions=my_situation)
+    return board_type(positions=my_situation)
+
+
+def fen_board_factory(fen: str = START_FEN, board_type: Type[Board] = Board):
+    fields = fen.split()
+    if len(fields) < 4:
+        raise ValueError(f'{fen} is not a valid FEN: expected at least 4 fields')
+
+    positions = {}
+    square = (BOARD_SIZE - 1) * BOARD_SIZE
+    col = 0
+    for char in fields[0]:
+        if char == '/':
+            if col != BOARD_SIZE:
+                raise ValueError(f'{fen} is not a valid FEN: row of {col} squares')
+            square -= 2 * BOARD_SIZE
+            col = 0
+        elif '1' <= char <= '8':
+            square += ord(char) - 48
+            col += ord(char) - 48
+        else:
+            piece = PIECE_BY_FEN_CHAR.get(char)
+            if piece is None or col >= BOARD_SIZE:
+                raise ValueError(f'{fen} is not a valid FEN: unexpected {char}')
+            positions[FEN_POSITIONS[square]] = piece
+            square += 1
+            col += 1
+    if square != BOARD_SIZE or col != BOARD_SIZE:
+        raise ValueError(f'{fen} is not a valid FEN: expected 8 rows of 8 squares')
+
+    if fields[1] not in ('w', 'b'):
+        raise ValueError(f'{fen} is not a valid FEN: unknown side to move {fields[1]}')
+    castling_rights = 0
+    if fields[2] != '-':
+        for char in fields[2]:
+            if char not in CASTLING_RIGHT_BY_FEN_CHAR:
+                raise ValueError(f'{fen} is not a valid FEN: unknown castling right {char}')
+            castling_rights |= CASTLING_RIGHT_BY_FEN_CHAR[char]
+    if fields[3] != '-' and fields[3] not in EN_PASSANT_POSITION_BY_FEN:
+        raise ValueError(f'{fen} is not a valid FEN: invalid en passant position {fields[3]}')
+    for clock in fields[4:6]:
+        if not clock.isdigit():
+            raise ValueError(f'{fen} is not a valid FEN: invalid clock {clock}')
+    return board_type(
+        positions=positions,
+        color_to_move=PieceColor.WHITE if fields[1] == 'w' else PieceColor.BLACK,
+        castling_rights=castling_rights,
+        en_passant_position=EN_PASSANT_POSITION_BY_FEN.get(fields[3]),
+        halfmove_clock=int(fields[4]) if len(fields) > 4 else 0,
+        fullmove_number=int(fields[5]) if len(fields) > 5 else 1,
+    )
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 
 class PieceColor(Enum):
@@ -56,14 +56,25 @@ def piece_name_from_str(value: str):
 
 @dataclass(frozen=True)
 class Position:
+    __slots__ = ('col', 'row')
     col: int
     row: int
 
     def __str__(self):
         return chr(self.col + 97) + str(self.row + 1)
 
-    def offset(self, col: int = 0, row: int = 0):
-        return Position(self.col + col, self.row + row)
+    def __hash__(self):
+        return self.row * BOARD_SIZE + self.col
+
+    def __reduce__(self):
+        return position_at, (self.col, self.row)
+
+    def offset(self, col: int = 0, row: int = 0) -> Optional['Position']:
+        target_col = self.col + col
+        target_row = self.row + row
+        if BOARD_SIZE > target_col >= 0 and BOARD_SIZE > target_row >= 0:
+            return BOARD_POSITIONS[target_row * BOARD_SIZE + target_col]
+        return None
 
     def belong_to_board(self) -> bool:
         return BOARD_SIZE > self.col >= 0 and BOARD_SIZE > self.row >= 0
@@ -73,17 +84,32 @@ class Position:
 
 
 def position_factory(info: str):
-    return Position(
-        col=ord(info[0]) - ord('a'),
-        row=int(info[1]) - 1
-    )
+    return position_at(col=ord(info[0]) - ord('a'), row=int(info[1]) - 1)
+
+
+def position_at(col: int, row: int) -> Position:
+    if BOARD_SIZE > col >= 0 and BOARD_SIZE > row >= 0:
+        return BOARD_POSITIONS[row * BOARD_SIZE + col]
+    return Position(col=col, row=row)
+
+
+def square_from_position(position: Position) -> int:
+    return position.row * BOARD_SIZE + position.col
+
+
+def position_from_square(square: int) -> Position:
+    return BOARD_POSITIONS[square]
 
 
 @dataclass(frozen=True)
 class Piece:
+    __slots__ = ('color', 'name')
     color: PieceColor
     name: PieceName
 
+    def __reduce__(self):
+        return piece_of, (self.color, self.name)
+
     def icon(self):
         return self.name.name[0].upper()
 
@@ -103,16 +129,35 @@ class Move:
     is_right_casting_broken: bool = False
     is_left_castling: bool = False
     is_right_castling: bool = False
+    promotion: Optional[PieceName] = None
+
+    def to_uci(self) -> str:
+        return str(self.source) + str(self.target) + ('' if self.promotion is None else str(self.promotion))
+
+
+@dataclass(frozen=True)
+class MoveUndo:
+    move: Move
+    piece_moved: Piece
+    piece_taken: Optional[Piece] = None
+    piece_taken_position: Optional[Position] = None
+    castling_rights: int = 0
+    en_passant_position: Optional[Position] = None
+    halfmove_clock: int = 0
+    hash: int = 0
 
 
 def piece_factory(info: str):
-    return Piece(
-        color=piece_color_from_str(info[0]),
-        name=piece_name_from_str(info[1])
-    )
+    return piece_of(piece_color_from_str(info[0]), piece_name_from_str(info[1]))
+
+
+def piece_of(color: PieceColor, name: PieceName) -> Piece:
+    return PIECE_BY_COLOR_AND_NAME[(color, name)]
 
 
 BOARD_SIZE = 8
+BOARD_POSITIONS: List[Position] = [Position(col=square % BOARD_SIZE, row=square // BOARD_SIZE) for square in range(BOARD_SIZE * BOARD_SIZE)]
+PIECE_BY_COLOR_AND_NAME: Dict[Tuple[PieceColor, PieceName], Piece] = {(color, name): Piece(color, name) for color in PieceColor for name in PieceName}
 SQUARE_SIZE = 60
 
 INITIAL_PAWN_ROW_BY_COLOR = {PieceColor.BLACK: 6, PieceColor.WHITE: 1}
@@ -0,0 +1,6 @@
+from chess.board import Board
+from chess.data import PieceColor
+
+
+def evaluate(board: Board, color: PieceColor) -> int:
+    return board.evaluation if color == PieceColor.WHITE else -board.evaluation
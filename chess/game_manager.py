@@ -1,7 +1,18 @@
-from typing import List, Optional, Set
+from array import array
+from typing import Dict, List, Optional, Set, Tuple, Type
 
-from chess.board import Board
-from chess.data import PieceColor, Position, PieceName, Piece, Move, INITIAL_PAWN_ROW_BY_COLOR, INITIAL_KING_ROW_BY_COLOR
+from chess.board import Board, LEFT_CASTLING_RIGHT_BY_COLOR, RIGHT_CASTLING_RIGHT_BY_COLOR, fen_board_factory
+from chess.attack_tables import ROOK_DIRECTIONS, BISHOP_DIRECTIONS, QUEEN_DIRECTIONS, KNIGHT_TARGETS, KING_TARGETS, PAWN_ATTACK_TARGETS, RAYS, POSITIONS, iterate_squares
+from chess.data import PieceColor, Position, PieceName, Piece, Move, INITIAL_PAWN_ROW_BY_COLOR, INITIAL_KING_ROW_BY_COLOR, BOARD_SIZE, square_from_position, position_at, piece_of
+from chess.attacks import is_square_attacked, is_king_attacked
+from chess.packed_move import EN_PASSANT_FLAG, MOVE_LIST_TYPECODE, SQUARE_MASK, TARGET_SHIFT, PackedMove, pack, unpack_moves
+from chess.magic_bitboards import rook_attacks, bishop_attacks, queen_attacks
+
+SLIDING_DIRECTIONS_BY_NAME = {PieceName.BISHOP: BISHOP_DIRECTIONS, PieceName.ROOK: ROOK_DIRECTIONS, PieceName.QUEEN: QUEEN_DIRECTIONS}
+SLIDING_ATTACKS_BY_NAME = {PieceName.BISHOP: bishop_attacks, PieceName.ROOK: rook_attacks, PieceName.QUEEN: queen_attacks}
+PROMOTION_PIECE_NAMES = [PieceName.QUEEN, PieceName.ROOK, PieceName.BISHOP, PieceName.NIGHT]
+# (is_left_castling, rook column, columns that must be empty, columns crossed by the king)
+CASTLINGS = [(True, 0, (1, 2, 3), (3, 2)), (False, 7, (5, 6), (5, 6))]
 
 
 class GameManager:
@@ -9,12 +20,14 @@ class GameManager:
     current_player: PieceColor
     selected_position: Position = None
     selected_piece: Piece = None
-    move_history: List[Move] = []
+    move_history: List[Move]
     piece_to_promote_position: Optional[Position] = None
 
     def __init__(self, board: Board, current_player: PieceColor = PieceColor.WHITE):
         self.current_player = current_player
         self.board = board
+        self.board.set_color_to_move(current_player)
+        self.move_history = []
 
     def get_selected_position(self):
         return self.selected_position
@@ -43,12 +56,14 @@ class GameManager:
         if move is None:
             raise ValueError(f"Target position is not in authorized moves: \n\t{str("\n\t".join([str(authorized_move) for authorized_move in authorized_moves]))}")
 
-        self.board.move(move=move)
-        self.move_history.append(move)
+        self.play(move)
         self.select_position(None)
         if move.piece_moved.name == PieceName.PAWN and move.target.is_last_position(move.piece_moved.color):
             self.piece_to_promote_position = move.target
 
+    def play(self, move: Move):
+        self.board.move(move=move)
+        self.move_history.append(move)
         self.current_player = PieceColor.BLACK if self.current_player == PieceColor.WHITE else PieceColor.WHITE
 
     def select_position(self, position: Optional[Position]):
@@ -56,16 +71,16 @@ class GameManager:
         self.selected_piece = self.board.get_piece(self.selected_position)
 
     def get_authorized_target_position(self) -> List[Position]:
-        moves = self.get_authorized_moves()
-        for move in moves.copy():
-            cloned_board = self.board.copy()
-            try:
-                cloned_board.move(move)
-                if self.is_king_threated(cloned_board, king_color=self.current_player):
-                    moves.remove(move)
-            except:
-                moves.remove(move)
-        return [move.target for move in moves]
+        return [move.target for move in self.get_authorized_moves() if self.is_legal_move(move)]
+
+    def is_legal_move(self, move: Move) -> bool:
+        try:
+            undo = self.board.make_move(move)
+        except ValueError:
+            return False
+        is_legal = not self.is_king_threated(self.board, king_color=self.current_player)
+        self.board.unmake_move(undo)
+        return is_legal
 
     def get_authorized_moves(self):
         selected_piece = self.get_selected_piece()
@@ -87,218 +102,82 @@ class GameManager:
 
     def manage_pawn_moves(self, board: Board, position: Position = None) -> List[Move]:
         my_position = position if position is not None else self.selected_position
-        selected_piece = self.board.get_piece(my_position)
-        direction = 1 if selected_piece.color == PieceColor.WHITE else -1
-        is_initial_position = INITIAL_PAWN_ROW_BY_COLOR[selected_piece.color] == self.selected_position.row
+        piece = board.get_piece(my_position)
+        direction = 1 if piece.color == PieceColor.WHITE else -1
         result = []
-        self.add_if_offset_position_has_no_piece(board=board, position=my_position, result=result, row=direction)
-        if is_initial_position: self.add_if_offset_position_has_no_piece(board=board, position=my_position, result=result, row=direction * 2, is_two_step_pawn_move=True)
-        self.add_if_offset_position_has_opponent_piece(board=board, position=my_position, result=result, row=direction, col=1)
-        self.add_if_offset_position_has_opponent_piece(board=board, position=my_position, result=result, row=direction, col=-1)
-        previous_move = self.move_history[-1] if len(self.move_history) > 0 else None
-        if previous_move is not None and previous_move.is_two_step_pawn_move:
-            en_passant_position = previous_move.target.offset(row=direction)
-            if (my_position.offset(row=direction, col=1) == en_passant_position or
-                    my_position.offset(row=direction, col=-1) == en_passant_position):
-                result.append(self.move_factory(
-                    target=en_passant_position,
-                    piece_taken=previous_move.piece_moved,
-                    piece_taken_position=previous_move.target,
-                ))
+        target = my_position.offset(row=direction)
+        if target is not None and board.get_piece(target) is None:
+            result.append(self.move_factory(target, source=my_position, piece_moved=piece))
+            two_step_target = target.offset(row=direction)
+            if my_position.row == INITIAL_PAWN_ROW_BY_COLOR[piece.color] and board.get_piece(two_step_target) is None:
+                result.append(self.move_factory(two_step_target, source=my_position, piece_moved=piece, is_two_step_pawn_move=True))
+        for target in PAWN_ATTACK_TARGETS[piece.color][square_from_position(my_position)]:
+            piece_taken = board.get_piece(target)
+            if piece_taken is not None and piece_taken.color != piece.color:
+                result.append(self.move_factory(target, piece_taken, source=my_position, piece_moved=piece))
+            elif target == board.en_passant_position:
+                piece_taken_position = position_at(col=target.col, row=my_position.row)
+                piece_taken = board.get_piece(piece_taken_position)
+                if piece_taken is not None and piece_taken.color != piece.color:
+                    result.append(self.move_factory(target, piece_taken, piece_taken_position=piece_taken_position, source=my_position, piece_moved=piece))
         return result
 
     def manage_pawn_threats(self, position: Position, color: PieceColor) -> List[Position]:
-        direction = 1 if color == PieceColor.WHITE else -1
-        return [
-            position.offset(row=direction, col=1),
-            position.offset(row=direction, col=-1),
-        ]
+        return list(PAWN_ATTACK_TARGETS[color][square_from_position(position)])
 
     def manage_knight_moves(self, board: Board, position: Position = None) -> List[Move]:
         my_position = position if position is not None else self.selected_position
+        piece = board.get_piece(my_position)
         result = []
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=-1, col=-2)
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=1, col=-2)
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=-2, col=-1)
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=2, col=-1)
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=-2, col=1)
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=2, col=1)
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=-1, col=2)
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=1, col=2)
+        for target in KNIGHT_TARGETS[square_from_position(my_position)]:
+            piece_taken = board.get_piece(target)
+            if piece_taken is None or piece_taken.color != piece.color:
+                result.append(self.move_factory(target, piece_taken, source=my_position, piece_moved=piece))
         return result
 
     def manage_knight_threats(self, position: Position) -> List[Position]:
-        positions = [
-            position.offset(row=-1, col=-2),
-            position.offset(row=1, col=-2),
-            position.offset(row=-2, col=-1),
-            position.offset(row=2, col=-1),
-            position.offset(row=-2, col=1),
-            position.offset(row=2, col=1),
-            position.offset(row=-1, col=2),
-            position.offset(row=1, col=2),
-        ]
-        print(f"knight threats ({str(position)}): {[str(pos) for pos in positions]}")
-        return positions
+        return list(KNIGHT_TARGETS[square_from_position(position)])
 
     def manage_rook_moves(self, board: Board, position: Position = None) -> List[Move]:
-        my_position = position if position is not None else self.selected_position
-        piece = board.get_piece(my_position)
-        result = []
-        is_left_rook_move = Position(INITIAL_KING_ROW_BY_COLOR[piece.color], 0) == my_position
-        is_right_rook_move = Position(INITIAL_KING_ROW_BY_COLOR[piece.color], 7) == my_position
-        for row_offset in range(1, 8):
-            has_found_piece_or_edge = self.add_if_offset_position_has_not_current_color_piece(
-                board=board,
-                position=my_position,
-                result=result,
-                row=row_offset,
-                is_left_break_castling=is_left_rook_move,
-                is_right_break_castling=is_right_rook_move,
-            )
-            if has_found_piece_or_edge: break
-        for row_offset in range(-1, -8, -1):
-            has_found_piece_or_edge = self.add_if_offset_position_has_not_current_color_piece(
-                board=board,
-                position=my_position,
-                result=result,
-                row=row_offset,
-                is_left_break_castling=is_left_rook_move,
-                is_right_break_castling=is_right_rook_move,
-            )
-            if has_found_piece_or_edge: break
-        for col_offset in range(1, 8):
-            has_found_piece_or_edge = self.add_if_offset_position_has_not_current_color_piece(
-                board=board,
-                position=my_position,
-                result=result,
-                col=col_offset,
-                is_left_break_castling=is_left_rook_move,
-                is_right_break_castling=is_right_rook_move,
-            )
-            if has_found_piece_or_edge: break
-        for col_offset in range(-1, -8, -1):
-            has_found_piece_or_edge = self.add_if_offset_position_has_not_current_color_piece(
-                board=board,
-                position=my_position,
-                result=result,
-                col=col_offset,
-                is_left_break_castling=is_left_rook_move,
-                is_right_break_castling=is_right_rook_move,
-            )
-            if has_found_piece_or_edge: break
-
-        return result
+        return self.manage_sliding_moves(board, position if position is not None else self.selected_position, PieceName.ROOK)
+
+    def manage_sliding_moves(self, board: Board, position: Position, piece_name: PieceName) -> List[Move]:
+        result = array(MOVE_LIST_TYPECODE)
+        self.add_sliding_move_codes(board, position, piece_of(board.get_piece(position).color, piece_name), result)
+        return unpack_moves(result)
+
+    def add_sliding_move_codes(self, board: Board, position: Position, piece: Piece, result: array):
+        king_row = INITIAL_KING_ROW_BY_COLOR[piece.color]
+        is_left_rook_move = piece.name == PieceName.ROOK and position == position_at(col=0, row=king_row)
+        is_right_rook_move = piece.name == PieceName.ROOK and position == position_at(col=7, row=king_row)
+        for square in iterate_squares(SLIDING_ATTACKS_BY_NAME[piece.name](square_from_position(position), board.get_occupancy())):
+            target = POSITIONS[square]
+            piece_taken = board.get_piece(target)
+            if piece_taken is None or piece_taken.color != piece.color:
+                result.append(pack(position, target, piece, piece_taken,
+                                   is_left_castling_broken=is_left_rook_move, is_right_castling_broken=is_right_rook_move))
 
     def manage_rook_threat(self, board: Board, position: Position = None) -> List[Position]:
-        result = []
-        for row_offset in range(1, 8):
-            offset_position = position.offset(row=row_offset)
-            if not offset_position.belong_to_board():
-                break
-            result.append(offset_position)
-            if board.get_piece(offset_position) is not None:
-                break
-        for row_offset in range(-1, -8, -1):
-            offset_position = position.offset(row=row_offset)
-            if not offset_position.belong_to_board():
-                break
-            result.append(offset_position)
-            if board.get_piece(offset_position) is not None:
-                break
-        for col_offset in range(1, 8):
-            offset_position = position.offset(col=col_offset)
-            if not offset_position.belong_to_board():
-                break
-            result.append(offset_position)
-            if board.get_piece(offset_position) is not None:
-                break
-        for col_offset in range(-1, -8, -1):
-            offset_position = position.offset(col=col_offset)
-            if not offset_position.belong_to_board():
-                break
-            result.append(offset_position)
-            if board.get_piece(offset_position) is not None:
-                break
+        return self.get_sliding_threat(board, position, ROOK_DIRECTIONS)
 
+    def get_sliding_threat(self, board: Board, position: Position, directions: List[Tuple[int, int]]) -> List[Position]:
+        result = []
+        square = square_from_position(position)
+        for direction in directions:
+            for offset_position in RAYS[direction][square]:
+                result.append(offset_position)
+                if board.get_piece(offset_position) is not None:
+                    break
         return result
 
     def manage_bishop_moves(self, board: Board, position: Position = None) -> List[Move]:
-        my_position = position if position is not None else self.selected_position
-        result = []
-        for diag_offset in range(1, 8):
-            has_found_piece_or_edge = self.add_if_offset_position_has_not_current_color_piece(
-                board=board,
-                position=my_position,
-                result=result,
-                row=diag_offset,
-                col=diag_offset)
-            if has_found_piece_or_edge: break
-        for diag_offset in range(1, 8):
-            has_found_piece_or_edge = self.add_if_offset_position_has_not_current_color_piece(
-                board=board,
-                position=my_position,
-                result=result,
-                row=diag_offset,
-                col=-diag_offset)
-            if has_found_piece_or_edge: break
-        for diag_offset in range(1, 8):
-            has_found_piece_or_edge = self.add_if_offset_position_has_not_current_color_piece(
-                board=board,
-                position=my_position,
-                result=result,
-                row=-diag_offset,
-                col=diag_offset)
-            if has_found_piece_or_edge: break
-        for diag_offset in range(1, 8):
-            has_found_piece_or_edge = self.add_if_offset_position_has_not_current_color_piece(
-                board=board,
-                position=my_position,
-                result=result,
-                row=-diag_offset,
-                col=-diag_offset)
-            if has_found_piece_or_edge: break
-        return result
+        return self.manage_sliding_moves(board, position if position is not None else self.selected_position, PieceName.BISHOP)
 
     def manage_bishop_threat(self, board: Board, position: Position = None) -> List[Position]:
-        result = []
-        for offset in range(1, 8):
-            offset_position = position.offset(col=offset, row=offset)
-            if not offset_position.belong_to_board():
-                break
-            result.append(offset_position)
-            if board.get_piece(offset_position) is not None:
-                break
-        for offset in range(1, 8):
-            offset_position = position.offset(col=offset, row=-offset)
-            if not offset_position.belong_to_board():
-                break
-            result.append(offset_position)
-            if board.get_piece(offset_position) is not None:
-                break
-        for offset in range(1, 8):
-            offset_position = position.offset(col=-offset, row=offset)
-            if not offset_position.belong_to_board():
-                break
-            result.append(offset_position)
-            if board.get_piece(offset_position) is not None:
-                break
-        for offset in range(1, 8):
-            offset_position = position.offset(col=-offset, row=-offset)
-            if not offset_position.belong_to_board():
-                break
-            result.append(offset_position)
-            if board.get_piece(offset_position) is not None:
-                break
-
-        return result
+        return self.get_sliding_threat(board, position, BISHOP_DIRECTIONS)
 
     def manage_queen_moves(self, board: Board, position: Position = None) -> List[Move]:
-        my_position = position if position is not None else self.selected_position
-        result = []
-        result.extend(self.manage_bishop_moves(board=board, position=my_position))
-        result.extend(self.manage_rook_moves(board=board, position=my_position))
-        return result
+        return self.manage_sliding_moves(board, position if position is not None else self.selected_position, PieceName.QUEEN)
 
     def manage_queen_threat(self, board: Board, position: Position = None) -> List[Position]:
         result = []
@@ -308,134 +187,17 @@ class GameManager:
 
     def manage_king_moves(self, board: Board, position: Position = None) -> List[Move]:
         my_position = position if position is not None else self.selected_position
-        selected_piece = self.board.get_piece(my_position)
-        result = []
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=1, col=0, is_break_castling=True)
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=-1, col=0, is_break_castling=True)
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=0, col=1, is_break_castling=True)
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=0, col=-1, is_break_castling=True)
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=1, col=1, is_break_castling=True)
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=1, col=-1, is_break_castling=True)
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=-1, col=1, is_break_castling=True)
-        self.add_if_offset_position_has_not_current_color_piece(board=board, position=my_position, result=result, row=-1, col=-1, is_break_castling=True)
-        _, filtered_position = self.filter_position_threated(
-            board=self.board,
-            positions=[move.target for move in result],
-            color=selected_piece.color.opposite_color()
-        )
-
-        final_moves = [move for move in result if move.target in filtered_position]
-        if (my_position == Position(row=INITIAL_KING_ROW_BY_COLOR[self.current_player], col=4)):
-            if (
-                    board.get_piece(Position(row=INITIAL_KING_ROW_BY_COLOR[self.current_player], col=1)) is None and
-                    board.get_piece(Position(row=INITIAL_KING_ROW_BY_COLOR[self.current_player], col=2)) is None and
-                    board.get_piece(Position(row=INITIAL_KING_ROW_BY_COLOR[self.current_player], col=3)) is None and
-                    len([move for move in self.move_history if move.piece_moved.color == selected_piece.color and move.is_left_castling_broken]) == 0
-            ):
-                final_moves.append(self.move_factory(Position(row=INITIAL_KING_ROW_BY_COLOR[self.current_player], col=2), is_left_castling=True))
-            if (
-                    board.get_piece(Position(row=INITIAL_KING_ROW_BY_COLOR[self.current_player], col=5)) is None and
-                    board.get_piece(Position(row=INITIAL_KING_ROW_BY_COLOR[self.current_player], col=6)) is None and
-                    len([move for move in self.move_history if move.piece_moved.color == selected_piece.color and move.is_right_casting_broken]) == 0
-            ):
-                final_moves.append(self.move_factory(Position(row=INITIAL_KING_ROW_BY_COLOR[self.current_player], col=6), is_right_castling=True))
-        return final_moves
+        color = board.get_piece(my_position).color
+        result = array(MOVE_LIST_TYPECODE)
+        self.add_legal_king_move_codes(board, my_position, color, self.is_in_check(board, color), result)
+        return unpack_moves(result)
 
     def manage_king_threat(self, position: Position = None) -> List[Position]:
-        result = [
-            position.offset(row=1, col=0),
-            position.offset(row=-1, col=0),
-            position.offset(row=0, col=1),
-            position.offset(row=0, col=-1),
-            position.offset(row=1, col=1),
-            position.offset(row=1, col=-1),
-            position.offset(row=-1, col=1),
-            position.offset(row=-1, col=-1),
-        ]
-        return result
+        return list(KING_TARGETS[square_from_position(position)])
 
     def keep_two_step_information(self, col: int, color: PieceColor):
         self.en_passant_info_of_previous_move = (col, color)
 
-    def add_if_offset_position_has_no_piece(self, board: Board, position: Position, result: List[Move], row: int = 0, col: int = 0, is_two_step_pawn_move: bool = False) -> bool:
-        if (self.is_offset_belong_to_board(position=position, row=row, col=col) and
-                not self.is_offset_position_has_piece_between(board=board, position=position, row=row, col=col)):
-            target_position = position.offset(row=row, col=col)
-            result.append(self.move_factory(
-                target=target_position,
-                piece_taken=self.board.get_piece(target_position),
-                is_two_step_pawn_move=is_two_step_pawn_move
-            ))
-        return (self.is_offset_position_has_piece(board=board, position=position, row=row, col=col) or
-                not self.is_offset_belong_to_board(position=position, row=row, col=col))
-
-    def add_if_offset_position_has_not_current_color_piece(
-            self,
-            board: Board,
-            position: Position,
-            result: List[Move],
-            row: int = 0,
-            col: int = 0,
-            is_two_step_pawn_move: bool = False,
-            is_left_break_castling: bool = False,
-            is_right_break_castling: bool = False,
-            is_break_castling: bool = False,
-    ) -> bool:
-        if (self.is_offset_belong_to_board(position=position, row=row, col=col) and
-                self.is_offset_belong_to_board(position=position, row=row, col=col) and
-                not self.is_offset_position_has_current_color_piece(board=board, position=position, row=row, col=col)):
-            target_position = position.offset(row=row, col=col)
-            result.append(
-                self.move_factory(
-                    target_position, self.board.get_piece(target_position),
-                    is_two_step_pawn_move=is_two_step_pawn_move,
-                    is_left_castling_broken=is_break_castling or is_left_break_castling,
-                    is_right_castling_broken=is_break_castling or is_right_break_castling,
-                ))
-        return (self.is_offset_position_has_piece(board=board, position=position, row=row, col=col) or
-                not self.is_offset_belong_to_board(position=position, row=row, col=col))
-
-    def add_if_offset_position_has_opponent_piece(self, board: Board, position: Position, result: List[Move], row: int = 0, col: int = 0, is_two_step_pawn_move: bool = False) -> bool:
-        if (self.is_offset_belong_to_board(position=position, row=row, col=col) and
-                self.is_offset_position_has_opponent_piece(board=board, position=position, row=row, col=col)):
-            target_position = position.offset(row=row, col=col)
-            result.append(self.move_factory(target_position, self.board.get_piece(target_position), is_two_step_pawn_move=is_two_step_pawn_move))
-        return (self.is_offset_position_has_piece(board=board, position=position, row=row, col=col) or
-                not self.is_offset_belong_to_board(position=position, row=row, col=col))
-
-    def is_offset_position_has_piece_between(self, board: Board, position: Position, row: int = 0, col: int = 0) -> bool:
-        if row != 0:
-            step = 1 if row > 0 else -1
-            for i in range(0, row, step):
-                if board.get_piece(position.offset(row=i + step, col=col)) is not None: return True
-        if col != 0:
-            step = 1 if col > 0 else -1
-            for i in range(0, col, step):
-                if board.get_piece(position.offset(row=row, col=i + step)) is not None: return True
-        return False
-
-    def is_offset_position_has_selected_color_piece(self, board: Board, position: Position, row: int = 0, col: int = 0) -> bool:
-        piece = board.get_piece(position)
-        piece_on_offset_position = board.get_piece(position.offset(row=row, col=col))
-        return piece_on_offset_position is not None and piece_on_offset_position.color == piece.color
-
-    def is_offset_position_has_opponent_piece(self, board: Board, position: Position, row: int = 0, col: int = 0) -> bool:
-        piece = board.get_piece(position)
-        piece_on_offset_position = board.get_piece(position.offset(row=row, col=col))
-        return piece_on_offset_position is not None and piece_on_offset_position.color != piece.color
-
-    def is_offset_position_has_current_color_piece(self, board: Board, position: Position, row: int = 0, col: int = 0) -> bool:
-        piece = board.get_piece(position)
-        piece_on_offset_position = board.get_piece(position.offset(row=row, col=col))
-        return piece_on_offset_position is not None and piece_on_offset_position.color == piece.color
-
-    def is_offset_position_has_piece(self, board: Board, position: Position, row: int = 0, col: int = 0) -> bool:
-        piece_on_offset_position = board.get_piece(position.offset(row=row, col=col))
-        return piece_on_offset_position is not None
-
-    def is_offset_belong_to_board(self, position: Position, row: int = 0, col: int = 0):
-        return position.offset(row=row, col=col).belong_to_board()
-
     def move_factory(
             self,
             target: Position,
@@ -446,57 +208,199 @@ class GameManager:
             is_right_castling: bool = False,
             is_left_castling_broken: bool = False,
             is_right_castling_broken: bool = False,
+            source: Optional[Position] = None,
+            piece_moved: Optional[Piece] = None,
+            promotion: Optional[PieceName] = None,
     ) -> Move:
-        my_piece_taken_position = None if piece_taken is None else target
-        my_piece_taken_position = piece_taken_position if piece_taken_position is not None else my_piece_taken_position
         return Move(
-            source=self.get_selected_position(),
+            source=self.get_selected_position() if source is None else source,
             target=target,
-            piece_moved=self.get_selected_piece(),
+            piece_moved=self.get_selected_piece() if piece_moved is None else piece_moved,
+            piece_taken_position=target if piece_taken is not None and piece_taken_position is None else piece_taken_position,
             piece_taken=piece_taken,
-            piece_taken_position=my_piece_taken_position,
             is_two_step_pawn_move=is_two_step_pawn_move,
-            is_left_castling=is_left_castling,
-            is_right_castling=is_right_castling,
             is_left_castling_broken=is_left_castling_broken,
             is_right_casting_broken=is_right_castling_broken,
+            is_left_castling=is_left_castling,
+            is_right_castling=is_right_castling,
+            promotion=promotion,
         )
 
     def is_waiting_promotion_info(self):
         return self.piece_to_promote_position is not None
 
     def promote_to(self, piece_name):
-        self.board.promote(self.piece_to_promote_position, Piece(self.current_player.opposite_color(), piece_name))
+        self.board.promote(self.piece_to_promote_position, piece_of(self.current_player.opposite_color(), piece_name))
         self.piece_to_promote_position = None
 
     def filter_position_threated(self, positions: List[Position], color: PieceColor, board: Board) -> tuple[Set[Position], Set[Position]]:
         final_threated_positions = set()
-        final_unthreated_positions = set(positions)
-        pieces_position = board.get_pieces_position(color)
-        for position, piece in pieces_position.items():
-            threat_positions = None
-            if piece.name == PieceName.PAWN:
-                threat_positions = self.manage_pawn_threats(position, piece.color)
-            elif piece.name == PieceName.NIGHT:
-                threat_positions = self.manage_knight_threats(position)
-            elif piece.name == PieceName.ROOK:
-                threat_positions = self.manage_rook_threat(board, position)
-            elif piece.name == PieceName.BISHOP:
-                threat_positions = self.manage_bishop_threat(board, position)
-            elif piece.name == PieceName.QUEEN:
-                threat_positions = self.manage_queen_threat(board, position)
-            elif piece.name == PieceName.KING:
-                threat_positions = self.manage_king_threat(position)
-
-            for unthreated_position in final_unthreated_positions.copy():
-                if unthreated_position in threat_positions:
-                    final_threated_positions.add(unthreated_position)
-                    final_unthreated_positions.remove(unthreated_position)
-            if len(final_unthreated_positions) == 0:
-                break
+        final_unthreated_positions = set()
+        for position in positions:
+            if is_square_attacked(board, square_from_position(position), color):
+                final_threated_positions.add(position)
+            else:
+                final_unthreated_positions.add(position)
         return final_threated_positions, final_unthreated_positions
 
     def is_king_threated(self, board: Board, king_color: PieceColor):
-        positions = board.get_piece_position_by_name(PieceName.KING, king_color)
-        threated_positions, _ = self.filter_position_threated(board=board, positions=positions, color=king_color.opposite_color())
-        return len(threated_positions) != 0
+        return is_king_attacked(board, king_color)
+
+    def has_castling_right(self, board: Board, color: PieceColor, is_left_castling: bool) -> bool:
+        castling_right = LEFT_CASTLING_RIGHT_BY_COLOR[color] if is_left_castling else RIGHT_CASTLING_RIGHT_BY_COLOR[color]
+        return board.castling_rights & castling_right != 0
+
+    def to_fen(self) -> str:
+        return self.board.to_fen()
+
+    def is_in_check(self, board: Board, color: PieceColor) -> bool:
+        return is_king_attacked(board, color)
+
+    def generate_legal_moves(self, board: Board, color: PieceColor) -> List[Move]:
+        return unpack_moves(self.generate_legal_move_codes(board, color))
+
+    def generate_legal_move_codes(self, board: Board, color: PieceColor) -> array:
+        king_positions = board.get_piece_position_by_name(PieceName.KING, color)
+        king_position = king_positions[0] if len(king_positions) > 0 else None
+        checkers, evasion_positions, pin_lines = self.get_checkers_and_pins(board, king_position, color)
+        result = array(MOVE_LIST_TYPECODE)
+        if king_position is not None:
+            self.add_legal_king_move_codes(board, king_position, color, len(checkers) > 0, result)
+        if len(checkers) > 1:
+            return result
+
+        for position, piece in board.get_pieces_position(color).items():
+            if piece.name == PieceName.KING:
+                continue
+            pin_line = pin_lines.get(position)
+            for code in self.generate_pseudo_legal_move_codes(board, position, piece):
+                if code & EN_PASSANT_FLAG:
+                    if self.is_en_passant_legal(board, PackedMove(code), color, king_position):
+                        result.append(code)
+                elif pin_line is None and evasion_positions is None:
+                    result.append(code)
+                else:
+                    target = POSITIONS[code >> TARGET_SHIFT & SQUARE_MASK]
+                    if (pin_line is None or target in pin_line) and (evasion_positions is None or target in evasion_positions):
+                        result.append(code)
+        return result
+
+    def get_checkers_and_pins(self, board: Board, king_position: Optional[Position], color: PieceColor) -> Tuple[List[Position], Optional[Set[Position]], Dict[Position, Set[Position]]]:
+        checkers = []
+        evasion_positions = set()
+        pin_lines = {}
+        if king_position is None:
+            return checkers, None, pin_lines
+
+        opponent_color = color.opposite_color()
+        king_square = square_from_position(king_position)
+        for position in KNIGHT_TARGETS[king_square]:
+            if board.get_piece(position) == piece_of(opponent_color, PieceName.NIGHT):
+                checkers.append(position)
+                evasion_positions.add(position)
+        for position in PAWN_ATTACK_TARGETS[color][king_square]:
+            if board.get_piece(position) == piece_of(opponent_color, PieceName.PAWN):
+                checkers.append(position)
+                evasion_positions.add(position)
+
+        for direction in QUEEN_DIRECTIONS:
+            slider_names = (PieceName.ROOK, PieceName.QUEEN) if direction[0] == 0 or direction[1] == 0 else (PieceName.BISHOP, PieceName.QUEEN)
+            line = []
+            pinned_position = None
+            for position in RAYS[direction][king_square]:
+                line.append(position)
+                piece = board.get_piece(position)
+                if piece is not None:
+                    if piece.color == color:
+                        if pinned_position is not None:
+                            break
+                        pinned_position = position
+                    else:
+                        if piece.name in slider_names:
+                            if pinned_position is None:
+                                checkers.append(position)
+                                evasion_positions.update(line)
+                            else:
+                                pin_lines[pinned_position] = set(line)
+                        break
+        return checkers, evasion_positions if len(checkers) > 0 else None, pin_lines
+
+    def add_legal_king_move_codes(self, board: Board, king_position: Position, color: PieceColor, is_in_check: bool, result: array):
+        king = board.get_piece(king_position)
+        king_square = square_from_position(king_position)
+        occupancy = board.get_occupancy() & ~(1 << king_square)
+        opponent_color = color.opposite_color()
+        for target in KING_TARGETS[king_square]:
+            if is_square_attacked(board, square_from_position(target), opponent_color, occupancy):
+                continue
+            piece_taken = board.get_piece(target)
+            if piece_taken is None or piece_taken.color != color:
+                result.append(pack(king_position, target, king, piece_taken, is_left_castling_broken=True, is_right_castling_broken=True))
+
+        king_row = INITIAL_KING_ROW_BY_COLOR[color]
+        if is_in_check or king_position != position_at(col=4, row=king_row):
+            return
+        for is_left_castling, rook_col, empty_cols, crossed_cols in CASTLINGS:
+            if (self.has_castling_right(board, color, is_left_castling) and
+                    board.get_piece(position_at(col=rook_col, row=king_row)) == piece_of(color, PieceName.ROOK) and
+                    all(board.get_piece(position_at(col=col, row=king_row)) is None for col in empty_cols) and
+                    not any(is_square_attacked(board, king_row * BOARD_SIZE + col, opponent_color, occupancy) for col in crossed_cols)):
+                result.append(pack(
+                    king_position, position_at(col=crossed_cols[-1], row=king_row), king,
+                    is_left_castling=is_left_castling, is_right_castling=not is_left_castling,
+                    is_left_castling_broken=True, is_right_castling_broken=True,
+                ))
+
+    def generate_pseudo_legal_move_codes(self, board: Board, position: Position, piece: Piece) -> array:
+        result = array(MOVE_LIST_TYPECODE)
+        if piece.name == PieceName.PAWN:
+            self.add_pseudo_legal_pawn_move_codes(board, position, piece, result)
+        elif piece.name == PieceName.NIGHT:
+            for target in KNIGHT_TARGETS[square_from_position(position)]:
+                piece_taken = board.get_piece(target)
+                if piece_taken is None or piece_taken.color != piece.color:
+                    result.append(pack(position, target, piece, piece_taken))
+        else:
+            self.add_sliding_move_codes(board, position, piece, result)
+        return result
+
+    def add_pseudo_legal_pawn_move_codes(self, board: Board, position: Position, piece: Piece, result: array):
+        direction = 1 if piece.color == PieceColor.WHITE else -1
+        target = position.offset(row=direction)
+        if target is not None and board.get_piece(target) is None:
+            self.add_pawn_move_codes(position, piece, target, None, result)
+            two_step_target = target.offset(row=direction)
+            if position.row == INITIAL_PAWN_ROW_BY_COLOR[piece.color] and board.get_piece(two_step_target) is None:
+                result.append(pack(position, two_step_target, piece, is_two_step_pawn_move=True))
+        for target in PAWN_ATTACK_TARGETS[piece.color][square_from_position(position)]:
+            piece_taken = board.get_piece(target)
+            if piece_taken is not None and piece_taken.color != piece.color:
+                self.add_pawn_move_codes(position, piece, target, piece_taken, result)
+
+        en_passant_position = board.en_passant_position
+        if (en_passant_position is not None and en_passant_position.row == position.row + direction and
+                abs(en_passant_position.col - position.col) == 1):
+            piece_taken_position = position_at(col=en_passant_position.col, row=position.row)
+            piece_taken = board.get_piece(piece_taken_position)
+            if piece_taken is not None and piece_taken.color != piece.color:
+                result.append(pack(position, en_passant_position, piece, piece_taken, piece_taken_position))
+
+    def add_pawn_move_codes(self, position: Position, piece: Piece, target: Position, piece_taken: Optional[Piece], result: array):
+        if target.is_last_position(piece.color):
+            for piece_name in PROMOTION_PIECE_NAMES:
+                result.append(pack(position, target, piece, piece_taken, promotion=piece_name))
+        else:
+            result.append(pack(position, target, piece, piece_taken))
+
+    def is_en_passant_legal(self, board: Board, move: Move, color: PieceColor, king_position: Optional[Position]) -> bool:
+        if king_position is None:
+            return True
+        undo = board.make_move(move)
+        is_legal = not is_square_attacked(board, square_from_position(king_position), color.opposite_color())
+        board.unmake_move(undo)
+        return is_legal
+
+
+def fen_game_manager_factory(fen: str, board_type: Type[Board] = Board) -> GameManager:
+    board = fen_board_factory(fen, board_type)
+    return GameManager(board, current_player=board.color_to_move)
@@ -0,0 +1,171 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterable, List, Optional, Type
+
+from chess.board import Board, START_FEN
+from chess.data import Move, PieceName, square_from_position, position_from_square
+from chess.game_manager import GameManager, fen_game_manager_factory
+
+NORMAL_FLAG = 0
+PROMOTION_FLAG = 1
+EN_PASSANT_FLAG = 2
+CASTLING_FLAG = 3
+PROMOTION_PIECE_NAMES = [PieceName.NIGHT, PieceName.BISHOP, PieceName.ROOK, PieceName.QUEEN]
+PROMOTION_CODE_BY_PIECE_NAME = {piece_name: code for code, piece_name in enumerate(PROMOTION_PIECE_NAMES)}
+
+MAGIC = b'CHGR'
+VERSION = 1
+HEADER = struct.Struct('<4sH')
+GAME_HEADER = struct.Struct('<HI')
+FOOTER = struct.Struct('<QQ4s')
+
+
+def encode_move(move: Move) -> int:
+    code = square_from_position(move.source) | square_from_position(move.target) << 6
+    if move.promotion is not None:
+        return code | PROMOTION_CODE_BY_PIECE_NAME[move.promotion] << 12 | PROMOTION_FLAG << 14
+    if move.piece_taken_position is not None and move.piece_taken_position != move.target:
+        return code | EN_PASSANT_FLAG << 14
+    if move.is_left_castling or move.is_right_castling:
+        return code | CASTLING_FLAG << 14
+    return code
+
+
+def decode_move(manager: GameManager, code: int) -> Move:
+    source = position_from_square(code & 0x3F)
+    target = position_from_square(code >> 6 & 0x3F)
+    promotion = PROMOTION_PIECE_NAMES[code >> 12 & 0x3] if code >> 14 == PROMOTION_FLAG else None
+    for move in manager.generate_legal_moves(manager.board, manager.current_player):
+        if move.source == source and move.target == target and move.promotion == promotion:
+            return move
+    raise ValueError(f'{code:#06x} is not a legal move in {manager.to_fen()}')
+
+
+def encode_moves(moves: Iterable[Move]) -> array:
+    return array('H', (encode_move(move) for move in moves))
+
+
+def decode_moves(codes: Iterable[int], fen: str = START_FEN, board_type: Type[Board] = Board) -> List[Move]:
+    manager = fen_game_manager_factory(fen, board_type=board_type)
+    moves = []
+    for code in codes:
+        move = decode_move(manager, code)
+        manager.play(move)
+        moves.append(move)
+    return moves
+
+
+def to_little_endian(codes: array) -> bytes:
+    if sys.byteorder == 'little':
+        return codes.tobytes()
+    codes = array('H', codes)
+    codes.byteswap()
+    return codes.tobytes()
+
+
+def from_little_endian(data) -> array:
+    codes = array('H')
+    codes.frombytes(data)
+    if sys.byteorder != 'little':
+        codes.byteswap()
+    return codes
+
+
+class GameRecordWriter:
+    file: BinaryIO
+    offsets: array
+
+    def __init__(self, path: str):
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION))
+        self.offsets = array('Q')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_game(self, moves: Iterable[Move], fen: str = START_FEN):
+        self.write_codes(encode_moves(moves), fen)
+
+    def write_codes(self, codes: array, fen: str = START_FEN):
+        fen_data = b'' if fen == START_FEN else fen.encode('ascii')
+        self.offsets.append(self.file.tell())
+        self.file.write(GAME_HEADER.pack(len(fen_data), len(codes)))
+        self.file.write(fen_data)
+        self.file.write(to_little_endian(codes))
+
+    def close(self):
+        if self.file.closed:
+            return
+        index_offset = self.file.tell()
+        offsets = array('Q', self.offsets)
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+        self.file.write(offsets.tobytes())
+        self.file.write(FOOTER.pack(index_offset, len(self.offsets), MAGIC))
+        self.file.close()
+
+
+class GameRecordReader:
+    file: BinaryIO
+    data: Optional[mmap.mmap]
+    offsets: array
+    board_type: Type[Board]
+
+    def __init__(self, path: str, board_type: Type[Board] = Board):
+        self.board_type = board_type
+        self.file = open(path, 'rb')
+        if os.fstat(self.file.fileno()).st_size < HEADER.size + FOOTER.size:
+            self.file.close()
+            raise ValueError(f'{path} is not a game record file')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = HEADER.unpack_from(self.data, 0)
+        index_offset, game_count, footer_magic = FOOTER.unpack_from(self.data, len(self.data) - FOOTER.size)
+        if magic != MAGIC or footer_magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f'{path} is not a game record file')
+        self.offsets = array('Q')
+        self.offsets.frombytes(self.data[index_offset:index_offset + game_count * self.offsets.itemsize])
+        if sys.byteorder != 'little':
+            self.offsets.byteswap()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index: int) -> List[Move]:
+        return decode_moves(self.read_codes(index), self.read_fen(index), board_type=self.board_type)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def close(self):
+        if self.data is not None:
+            self.data.close()
+            self.data = None
+        self.file.close()
+
+    def read_fen(self, index: int) -> str:
+        offset = self.offsets[index]
+        fen_length, _ = GAME_HEADER.unpack_from(self.data, offset)
+        if fen_length == 0:
+            return START_FEN
+        start = offset + GAME_HEADER.size
+        return self.data[start:start + fen_length].decode('ascii')
+
+    def read_codes(self, index: int) -> array:
+        offset = self.offsets[index]
+        fen_length, move_count = GAME_HEADER.unpack_from(self.data, offset)
+        start = offset + GAME_HEADER.size + fen_length
+        return from_little_endian(self.data[start:start + 2 * move_count])
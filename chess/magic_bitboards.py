@@ -0,0 +1,192 @@
+import os
+import random
+import struct
+import sys
+from array import array
+from typing import List, Optional, Tuple
+
+from chess.attack_tables import ROOK_DIRECTIONS, BISHOP_DIRECTIONS, RAYS, SQUARE_COUNT, squares_mask
+
+ROOK_MAGICS = [
+    0x0380002A1281C000, 0x0200102302408200, 0x3480200289100080, 0x0480100208008004,
+    0x0280080180040002, 0x0600100600040831, 0x0400300401084082, 0x1A00020040810024,
+    0x0082002080420101, 0x0202002080410200, 0x0210801000200882, 0x2408801000080080,
+    0x5090800800840080, 0x0222000488908200, 0x0004001002080104, 0x0C20800080005900,
+    0x924380800820C011, 0x0040484010002000, 0x0020008020801000, 0x1020808010000804,
+    0x0402850008009100, 0x8054008002008004, 0x400004005F100802, 0x00C65A0004164A81,
+    0x0C00408200210200, 0x041002C240002000, 0x0020004100210010, 0x0600100080080082,
+    0xC208008880040080, 0x0400020080040080, 0xE000420400614810, 0x0020008200104104,
+    0x0800804000800038, 0x0290002008400048, 0x2080200282801000, 0x0C1600100A004120,
+    0xC100800800800402, 0x04A0020080800400, 0x0208480184000210, 0x1801010082000044,
+    0x1000400080008024, 0x100120100040C000, 0xA025002002450010, 0xC240080010008080,
+    0x842B010801050010, 0x0080040002008080, 0x0040821001840008, 0x0000412040920004,
+    0x0421400680002480, 0x0100400080200080, 0x0018801042002200, 0x0800480080100280,
+    0x0685800402080080, 0x0089008400020900, 0x5044302802018400, 0x0200005084110200,
+    0x0020310080012441, 0x0000204104120086, 0x00004010800A2202, 0x2002082010000501,
+    0x0002006010440882, 0x8002004150381402, 0x050004A502181004, 0xC200002081004402,
+]
+BISHOP_MAGICS = [
+    0x0020202210404086, 0x0082480101020000, 0x00044902120000A0, 0x8008285302400064,
+    0x8002021000008100, 0x040288200A000000, 0x0080440208400840, 0x1B02010042022000,
+    0x4080C14808008080, 0x3200901031090021, 0x0080086808488000, 0x48150404218C2200,
+    0x2000040504409000, 0x0040084110100900, 0x0002040101082042, 0x8E00202108088408,
+    0x00040A0810041800, 0x0002A00802140408, 0x8088041008881013, 0x9000800802094032,
+    0x544400CE01215008, 0x0804212200900800, 0x0041001401280200, 0x4100800100411090,
+    0x000EA80C41886800, 0x000A1800B1010808, 0x0805100021040820, 0x4021080344004010,
+    0x2102840008802000, 0x0810010040240101, 0x0084004000882408, 0x0000848401004840,
+    0x2028201000044408, 0x000090484004A800, 0x4041040100A88800, 0x0010C20080180082,
+    0x0021100400008020, 0x0002174501020088, 0x8085040404093300, 0xC048044840090500,
+    0x1811010920204000, 0x02C2085B0C014820, 0x0000082488007000, 0x8004020122088400,
+    0x00403A0202005412, 0x8C40080089010020, 0x020408009400A100, 0x0402008101029208,
+    0x2004008404208000, 0x08008080A8208000, 0x0201004A08040804, 0xA12000020A020002,
+    0x8004113102022104, 0x0262040408120200, 0x08D002B001120000, 0x2810042804822481,
+    0x0030110410122814, 0x8082042684100800, 0x00C0201210840400, 0x681440000C208810,
+    0x4400000120042400, 0x0022022060420224, 0x0100102008010050, 0x0002200200821081,
+]
+
+FULL_MASK = (1 << 64) - 1
+CACHE_MAGIC = b'CHMG'
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct('<4sHI')
+MAGIC_CACHE_ENVIRONMENT_VARIABLE = 'CHESS_MAGIC_CACHE'
+
+
+def relevant_occupancy_mask(square: int, directions: List[Tuple[int, int]]) -> int:
+    return squares_mask(position for direction in directions for position in RAYS[direction][square][:-1])
+
+
+def sliding_attacks(square: int, occupancy: int, directions: List[Tuple[int, int]]) -> int:
+    attacks = 0
+    for direction in directions:
+        for position in RAYS[direction][square]:
+            bit = 1 << (position.row * 8 + position.col)
+            attacks |= bit
+            if occupancy & bit:
+                break
+    return attacks
+
+
+def iterate_subsets(mask: int):
+    subset = 0
+    while True:
+        yield subset
+        subset = (subset - mask) & mask
+        if subset == 0:
+            return
+
+
+def find_magic(square: int, directions: List[Tuple[int, int]], rng: random.Random) -> int:
+    mask = relevant_occupancy_mask(square, directions)
+    shift = 64 - bin(mask).count('1')
+    occupancies = list(iterate_subsets(mask))
+    attacks = [sliding_attacks(square, occupancy, directions) for occupancy in occupancies]
+    while True:
+        magic = rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+        if bin((mask * magic) & 0xFF00000000000000).count('1') < 6:
+            continue
+        table = {}
+        for occupancy, attack in zip(occupancies, attacks):
+            index = ((occupancy * magic) & FULL_MASK) >> shift
+            if table.setdefault(index, attack) != attack:
+                break
+        else:
+            return magic
+
+
+class MagicTable:
+    entries: List[Tuple[int, int, int, int]]
+    attacks: array
+
+    def __init__(self, magics: List[int], directions: List[Tuple[int, int]], attacks: Optional[array] = None):
+        self.entries = []
+        offset = 0
+        for square in range(SQUARE_COUNT):
+            mask = relevant_occupancy_mask(square, directions)
+            shift = 64 - bin(mask).count('1')
+            self.entries.append((mask, magics[square], shift, offset))
+            offset += 1 << (64 - shift)
+        if attacks is not None and len(attacks) == offset:
+            self.attacks = attacks
+            return
+        self.attacks = array('Q', bytes(8 * offset))
+        for square, (mask, magic, shift, offset) in enumerate(self.entries):
+            for occupancy in iterate_subsets(mask):
+                self.attacks[offset + (((occupancy * magic) & FULL_MASK) >> shift)] = sliding_attacks(square, occupancy, directions)
+
+    def get_attacks(self, square: int, occupancy: int) -> int:
+        mask, magic, shift, offset = self.entries[square]
+        return self.attacks[offset + ((((occupancy & mask) * magic) & FULL_MASK) >> shift)]
+
+
+rook_table: Optional[MagicTable] = None
+bishop_table: Optional[MagicTable] = None
+
+
+def read_cache(cache_path: str) -> Optional[array]:
+    try:
+        with open(cache_path, 'rb') as file:
+            magic, version, count = CACHE_HEADER.unpack(file.read(CACHE_HEADER.size))
+            if magic != CACHE_MAGIC or version != CACHE_VERSION:
+                return None
+            attacks = array('Q')
+            attacks.frombytes(file.read(count * attacks.itemsize))
+    except (OSError, struct.error, ValueError):
+        return None
+    if len(attacks) != count:
+        return None
+    if sys.byteorder != 'little':
+        attacks.byteswap()
+    return attacks
+
+
+def write_cache(cache_path: str, attacks: array) -> bool:
+    data = array('Q', attacks)
+    if sys.byteorder != 'little':
+        data.byteswap()
+    temporary_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        with open(temporary_path, 'wb') as file:
+            file.write(CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, len(data)))
+            file.write(data.tobytes())
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        return False
+    return True
+
+
+def init_magic_tables(cache_path: Optional[str] = None):
+    global rook_table, bishop_table
+    cache_path = os.environ.get(MAGIC_CACHE_ENVIRONMENT_VARIABLE) if cache_path is None else cache_path
+    cached_attacks = read_cache(cache_path) if cache_path is not None else None
+    rook_attacks_cache = bishop_attacks_cache = None
+    if cached_attacks is not None:
+        rook_size = sum(1 << bin(relevant_occupancy_mask(square, ROOK_DIRECTIONS)).count('1') for square in range(SQUARE_COUNT))
+        rook_attacks_cache = cached_attacks[:rook_size]
+        bishop_attacks_cache = cached_attacks[rook_size:]
+    rook_table = MagicTable(ROOK_MAGICS, ROOK_DIRECTIONS, rook_attacks_cache)
+    bishop_table = MagicTable(BISHOP_MAGICS, BISHOP_DIRECTIONS, bishop_attacks_cache)
+    if cache_path is not None and (rook_table.attacks is not rook_attacks_cache or bishop_table.attacks is not bishop_attacks_cache):
+        write_cache(cache_path, rook_table.attacks + bishop_table.attacks)
+
+
+def ensure_magic_tables():
+    if rook_table is None or bishop_table is None:
+        init_magic_tables()
+
+
+def rook_attacks(square: int, occupancy: int) -> int:
+    if rook_table is None:
+        init_magic_tables()
+    return rook_table.get_attacks(square, occupancy)
+
+
+def bishop_attacks(square: int, occupancy: int) -> int:
+    if bishop_table is None:
+        init_magic_tables()
+    return bishop_table.get_attacks(square, occupancy)
+
+
+def queen_attacks(square: int, occupancy: int) -> int:
+    return rook_attacks(square, occupancy) | bishop_attacks(square, occupancy)
@@ -0,0 +1,123 @@
+from array import array
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from chess.board import Board
+from chess.data import PieceColor
+from chess.packed_move import PIECE_MOVED_SHIFT, PIECE_NAME_MASK, PIECE_TAKEN_SHIFT, PROMOTION_SHIFT, MOVE_KEY_MASK, SQUARE_MASK, TARGET_SHIFT
+from chess.static_exchange import is_losing_capture
+
+KILLER_SLOT_COUNT = 2
+SQUARE_COUNT = 64
+HISTORY_SIZE = 2 * SQUARE_COUNT * SQUARE_COUNT
+MAX_HISTORY_SCORE = 1 << 24
+PIECE_NAME_COUNT = 6
+PROMOTION_SCORE = PIECE_NAME_COUNT * 8
+
+
+def mvv_lva_score(code: int) -> int:
+    piece_taken_code = code >> PIECE_TAKEN_SHIFT & PIECE_NAME_MASK
+    promotion_code = code >> PROMOTION_SHIFT & PIECE_NAME_MASK
+    score = PROMOTION_SCORE + promotion_code if promotion_code else 0
+    if piece_taken_code:
+        score += piece_taken_code * 8 - (code >> PIECE_MOVED_SHIFT & PIECE_NAME_MASK)
+    return score
+
+
+def is_tactical(code: int) -> bool:
+    return code >> PIECE_TAKEN_SHIFT & PIECE_NAME_MASK != 0 or code >> PROMOTION_SHIFT & PIECE_NAME_MASK != 0
+
+
+def history_index(color: PieceColor, code: int) -> int:
+    return (color.value * SQUARE_COUNT + (code & SQUARE_MASK)) * SQUARE_COUNT + (code >> TARGET_SHIFT & SQUARE_MASK)
+
+
+def iterate_best_first(scored_codes: List[Tuple[int, int]]) -> Iterator[int]:
+    for index in range(len(scored_codes)):
+        best_index = index
+        for candidate_index in range(index + 1, len(scored_codes)):
+            if scored_codes[candidate_index][0] > scored_codes[best_index][0]:
+                best_index = candidate_index
+        scored_codes[index], scored_codes[best_index] = scored_codes[best_index], scored_codes[index]
+        yield scored_codes[index][1]
+
+
+class MoveOrdering:
+    killers: List[array]
+    history: array
+
+    def __init__(self, max_ply: int):
+        self.killers = [array('I', [0]) * KILLER_SLOT_COUNT for _ in range(max_ply + 1)]
+        self.history = array('I', [0]) * HISTORY_SIZE
+
+    def clear(self):
+        for killers in self.killers:
+            killers[:] = array('I', [0]) * KILLER_SLOT_COUNT
+        self.history[:] = array('I', [0]) * HISTORY_SIZE
+
+    def new_search(self):
+        for killers in self.killers:
+            killers[:] = array('I', [0]) * KILLER_SLOT_COUNT
+        for index in range(HISTORY_SIZE):
+            self.history[index] >>= 1
+
+    def store_cutoff(self, code: int, color: PieceColor, depth: int, ply: int):
+        if is_tactical(code):
+            return
+        killers = self.killers[ply]
+        if killers[0] != code:
+            killers[1] = killers[0]
+            killers[0] = code
+        index = history_index(color, code)
+        self.history[index] = min(MAX_HISTORY_SCORE, self.history[index] + depth * depth)
+
+    def get_history_score(self, color: PieceColor, code: int) -> int:
+        return self.history[history_index(color, code)]
+
+
+class MovePicker:
+    codes: Sequence[int]
+    hash_move_key: int
+    move_ordering: MoveOrdering
+    ply: int
+    color: PieceColor
+    board: Optional[Board]
+
+    def __init__(self, codes: Sequence[int], move_ordering: MoveOrdering, ply: int, color: PieceColor, hash_move_key: Optional[int] = None,
+                 board: Optional[Board] = None):
+        self.codes = codes
+        self.board = board
+        self.move_ordering = move_ordering
+        self.ply = ply
+        self.color = color
+        self.hash_move_key = 0 if hash_move_key is None else hash_move_key
+
+    def __iter__(self) -> Iterator[int]:
+        hash_move = 0
+        tactical_moves = []
+        losing_captures = []
+        quiet_moves = []
+        for code in self.codes:
+            if self.hash_move_key != 0 and code & MOVE_KEY_MASK == self.hash_move_key:
+                hash_move = code
+            elif is_tactical(code):
+                tactical_moves.append((mvv_lva_score(code), code))
+            else:
+                quiet_moves.append(code)
+        if hash_move != 0:
+            yield hash_move
+        for code in iterate_best_first(tactical_moves):
+            if self.board is not None and is_losing_capture(self.board, code):
+                losing_captures.append(code)
+            else:
+                yield code
+
+        killers = self.move_ordering.killers[self.ply]
+        remaining_quiet_moves = []
+        for killer in killers:
+            if killer != 0 and killer != hash_move and killer in quiet_moves:
+                yield killer
+        for code in quiet_moves:
+            if code not in killers:
+                remaining_quiet_moves.append((self.move_ordering.get_history_score(self.color, code), code))
+        yield from iterate_best_first(remaining_quiet_moves)
+        yield from losing_captures
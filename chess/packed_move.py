@@ -0,0 +1,169 @@
+from array import array
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+from chess.data import Move, Piece, PieceColor, PieceName, Position, BOARD_POSITIONS, piece_of, position_at, square_from_position
+
+SQUARE_MASK = 0x3F
+PIECE_NAME_MASK = 0x7
+TARGET_SHIFT = 6
+PROMOTION_SHIFT = 12
+PIECE_MOVED_SHIFT = 15
+PIECE_MOVED_COLOR_SHIFT = 18
+PIECE_TAKEN_SHIFT = 19
+EN_PASSANT_FLAG = 1 << 22
+TWO_STEP_PAWN_MOVE_FLAG = 1 << 23
+LEFT_CASTLING_FLAG = 1 << 24
+RIGHT_CASTLING_FLAG = 1 << 25
+LEFT_CASTLING_BROKEN_FLAG = 1 << 26
+RIGHT_CASTLING_BROKEN_FLAG = 1 << 27
+MOVE_KEY_MASK = (1 << PIECE_MOVED_SHIFT) - 1
+MOVE_LIST_TYPECODE = 'I'
+MOVE_CACHE_SIZE = 1 << 16
+
+PIECE_NAMES = list(PieceName)
+
+
+class PackedMove(int):
+    __slots__ = ()
+
+    @property
+    def source_square(self) -> int:
+        return self & SQUARE_MASK
+
+    @property
+    def target_square(self) -> int:
+        return self >> TARGET_SHIFT & SQUARE_MASK
+
+    @property
+    def source(self) -> Position:
+        return BOARD_POSITIONS[self & SQUARE_MASK]
+
+    @property
+    def target(self) -> Position:
+        return BOARD_POSITIONS[self >> TARGET_SHIFT & SQUARE_MASK]
+
+    @property
+    def piece_moved(self) -> Piece:
+        return piece_of(PieceColor(self >> PIECE_MOVED_COLOR_SHIFT & 1), PIECE_NAMES[self >> PIECE_MOVED_SHIFT & PIECE_NAME_MASK])
+
+    @property
+    def piece_taken(self) -> Optional[Piece]:
+        piece_taken_code = self >> PIECE_TAKEN_SHIFT & PIECE_NAME_MASK
+        if piece_taken_code == 0:
+            return None
+        return piece_of(self.piece_moved.color.opposite_color(), PIECE_NAMES[piece_taken_code - 1])
+
+    @property
+    def piece_taken_position(self) -> Optional[Position]:
+        if self & EN_PASSANT_FLAG:
+            return position_at(col=self.target.col, row=self.source.row)
+        return self.target if self >> PIECE_TAKEN_SHIFT & PIECE_NAME_MASK else None
+
+    @property
+    def promotion(self) -> Optional[PieceName]:
+        promotion_code = self >> PROMOTION_SHIFT & PIECE_NAME_MASK
+        return PIECE_NAMES[promotion_code] if promotion_code else None
+
+    @property
+    def is_two_step_pawn_move(self) -> bool:
+        return self & TWO_STEP_PAWN_MOVE_FLAG != 0
+
+    @property
+    def is_left_castling(self) -> bool:
+        return self & LEFT_CASTLING_FLAG != 0
+
+    @property
+    def is_right_castling(self) -> bool:
+        return self & RIGHT_CASTLING_FLAG != 0
+
+    @property
+    def is_left_castling_broken(self) -> bool:
+        return self & LEFT_CASTLING_BROKEN_FLAG != 0
+
+    @property
+    def is_right_casting_broken(self) -> bool:
+        return self & RIGHT_CASTLING_BROKEN_FLAG != 0
+
+    @property
+    def is_capture(self) -> bool:
+        return self >> PIECE_TAKEN_SHIFT & PIECE_NAME_MASK != 0
+
+    @property
+    def key(self) -> int:
+        return self & MOVE_KEY_MASK
+
+    def to_move(self) -> Move:
+        return unpack_move(self)
+
+    def to_uci(self) -> str:
+        promotion = self.promotion
+        return str(self.source) + str(self.target) + ('' if promotion is None else str(promotion))
+
+
+def pack_move(move: Move) -> PackedMove:
+    return PackedMove(pack(
+        move.source, move.target, move.piece_moved, move.piece_taken, move.piece_taken_position, move.promotion,
+        move.is_two_step_pawn_move, move.is_left_castling, move.is_right_castling,
+        move.is_left_castling_broken, move.is_right_casting_broken,
+    ))
+
+
+def pack(
+        source: Position,
+        target: Position,
+        piece_moved: Piece,
+        piece_taken: Optional[Piece] = None,
+        piece_taken_position: Optional[Position] = None,
+        promotion: Optional[PieceName] = None,
+        is_two_step_pawn_move: bool = False,
+        is_left_castling: bool = False,
+        is_right_castling: bool = False,
+        is_left_castling_broken: bool = False,
+        is_right_castling_broken: bool = False,
+) -> int:
+    code = (square_from_position(source) | square_from_position(target) << TARGET_SHIFT |
+            piece_moved.name.value << PIECE_MOVED_SHIFT | piece_moved.color.value << PIECE_MOVED_COLOR_SHIFT)
+    if promotion is not None:
+        code |= promotion.value << PROMOTION_SHIFT
+    if piece_taken is not None:
+        code |= (piece_taken.name.value + 1) << PIECE_TAKEN_SHIFT
+        if piece_taken_position is not None and piece_taken_position != target:
+            code |= EN_PASSANT_FLAG
+    if is_two_step_pawn_move:
+        code |= TWO_STEP_PAWN_MOVE_FLAG
+    if is_left_castling:
+        code |= LEFT_CASTLING_FLAG
+    if is_right_castling:
+        code |= RIGHT_CASTLING_FLAG
+    if is_left_castling_broken:
+        code |= LEFT_CASTLING_BROKEN_FLAG
+    if is_right_castling_broken:
+        code |= RIGHT_CASTLING_BROKEN_FLAG
+    return code
+
+
+@lru_cache(maxsize=MOVE_CACHE_SIZE)
+def unpack_move(code: int) -> Move:
+    packed_move = PackedMove(code)
+    return Move(
+        source=packed_move.source,
+        target=packed_move.target,
+        piece_moved=packed_move.piece_moved,
+        piece_taken_position=packed_move.piece_taken_position,
+        piece_taken=packed_move.piece_taken,
+        is_two_step_pawn_move=packed_move.is_two_step_pawn_move,
+        is_left_castling_broken=packed_move.is_left_castling_broken,
+        is_right_casting_broken=packed_move.is_right_casting_broken,
+        is_left_castling=packed_move.is_left_castling,
+        is_right_castling=packed_move.is_right_castling,
+        promotion=packed_move.promotion,
+    )
+
+
+def pack_moves(moves: Iterable[Move]) -> array:
+    return array(MOVE_LIST_TYPECODE, (pack_move(move) for move in moves))
+
+
+def unpack_moves(codes: Iterable[int]) -> List[Move]:
+    return [unpack_move(code) for code in codes]
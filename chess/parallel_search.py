@@ -0,0 +1,124 @@
+import multiprocessing
+import os
+import queue
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import replace
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Iterable, List, Optional
+
+from chess.board import Board
+from chess.data import PieceColor
+from chess.search import SearchEngine, SearchLimits, SearchResult
+from chess.transposition import TranspositionTable, shared_transposition_table
+
+worker_transposition_table: Optional[TranspositionTable] = None
+worker_stop_event = None
+worker_iterations = None
+ITERATION_POLL_SECONDS = 0.05
+
+
+def init_search_worker(shared_memory: SharedMemory, size_mb: int, stop_event, iterations):
+    global worker_transposition_table, worker_stop_event, worker_iterations
+    worker_transposition_table = TranspositionTable(size_mb, shared_memory)
+    worker_stop_event = stop_event
+    worker_iterations = iterations
+
+
+def search_worker(board: Board, color: PieceColor, limits: SearchLimits, generation: int, helper_index: int,
+                  position_hashes: List[int], report_iterations: bool = False) -> SearchResult:
+    worker_transposition_table.generation = generation
+    engine = SearchEngine(board, color, worker_transposition_table, stop_event=worker_stop_event, helper_index=helper_index)
+    engine.position_hashes = list(position_hashes)
+    if not report_iterations:
+        return engine.search(limits)
+    try:
+        return engine.search(limits, on_iteration=worker_iterations.put)
+    finally:
+        worker_iterations.put(None)
+
+
+class ParallelSearchEngine:
+    board: Board
+    color: PieceColor
+    threads: int
+    transposition_table: TranspositionTable
+    position_hashes: List[int]
+
+    def __init__(self, board: Board, color: PieceColor, threads: int = None, hash_size_mb: int = 16):
+        self.board = board
+        self.color = color
+        self.threads = os.cpu_count() if threads is None else threads
+        self.position_hashes = []
+        self.transposition_table = shared_transposition_table(hash_size_mb)
+        self.stop_event = multiprocessing.Event()
+        self.iterations = multiprocessing.Queue()
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.threads,
+            initializer=init_search_worker,
+            initargs=(self.transposition_table.shared_memory, hash_size_mb, self.stop_event, self.iterations),
+        )
+        for future in [self.executor.submit(os.getpid) for _ in range(self.threads)]:
+            future.result()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.stop_event.set()
+        self.executor.shutdown()
+        self.iterations.close()
+        shared_memory = self.transposition_table.shared_memory
+        self.transposition_table.close()
+        shared_memory.unlink()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def set_position(self, board: Board, color: PieceColor, position_hashes: Iterable[int] = ()):
+        self.board = board
+        self.color = color
+        self.position_hashes = list(position_hashes)
+
+    def report_iterations(self, future: Future, on_iteration: Callable[[SearchResult], None]):
+        while True:
+            try:
+                result = self.iterations.get(timeout=ITERATION_POLL_SECONDS)
+            except queue.Empty:
+                if future.done() and future.exception() is not None:
+                    return
+                continue
+            if result is None:
+                return
+            on_iteration(result)
+
+    def search(self, limits: SearchLimits = SearchLimits(), on_iteration: Callable[[SearchResult], None] = None) -> SearchResult:
+        start_time = time.perf_counter()
+        self.stop_event.clear()
+        worker_limits = limits if limits.nodes is None else replace(limits, nodes=max(1, limits.nodes // self.threads))
+        generation = self.transposition_table.generation
+        futures = [
+            self.executor.submit(search_worker, self.board, self.color, worker_limits, generation, helper_index,
+                                 self.position_hashes, on_iteration is not None and helper_index == 0)
+            for helper_index in range(self.threads)
+        ]
+        self.transposition_table.new_search()
+
+        if on_iteration is not None:
+            self.report_iterations(futures[0], on_iteration)
+        main_result = futures[0].result()
+        self.stop_event.set()
+        results = [main_result] + [future.result() for future in futures[1:]]
+        best_result = main_result
+        for result in results[1:]:
+            if result.best_move is not None and result.depth > best_result.depth:
+                best_result = result
+        return replace(best_result, nodes=sum(result.nodes for result in results), elapsed=time.perf_counter() - start_time)
+
+
+def parallel_search(board: Board, color: PieceColor, limits: SearchLimits = SearchLimits(), threads: int = None, hash_size_mb: int = 16) -> SearchResult:
+    with ParallelSearchEngine(board, color, threads, hash_size_mb) as engine:
+        return engine.search(limits)
@@ -0,0 +1,119 @@
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Dict, List
+
+from chess.board import Board, START_FEN
+from chess.game_manager import GameManager, fen_game_manager_factory
+from chess.magic_bitboards import ensure_magic_tables
+
+
+@dataclass(frozen=True)
+class ReferencePosition:
+    name: str
+    fen: str
+    node_counts: List[int]
+
+
+REFERENCE_POSITIONS = [
+    ReferencePosition('start', START_FEN, [20, 400, 8902, 197281, 4865609]),
+    ReferencePosition('kiwipete', 'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1', [48, 2039, 97862, 4085603]),
+    ReferencePosition('en_passant', '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1', [14, 191, 2812, 43238, 674624]),
+    ReferencePosition('castling', 'r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1', [6, 264, 9467, 422333]),
+    ReferencePosition('promotion', 'rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8', [44, 1486, 62379, 2103487]),
+]
+
+
+def reference_position_manager(reference_position: ReferencePosition, board_type=Board) -> GameManager:
+    return fen_game_manager_factory(reference_position.fen, board_type=board_type)
+
+
+def perft(manager: GameManager, depth: int) -> int:
+    if depth == 0:
+        return 1
+    moves = manager.generate_legal_moves(manager.board, manager.current_player)
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        undo = manager.board.make_move(move)
+        manager.move_history.append(move)
+        manager.current_player = manager.current_player.opposite_color()
+        nodes += perft(manager, depth - 1)
+        manager.current_player = manager.current_player.opposite_color()
+        manager.move_history.pop()
+        manager.board.unmake_move(undo)
+    return nodes
+
+
+def divide(manager: GameManager, depth: int) -> Dict[str, int]:
+    result = {}
+    for move in manager.generate_legal_moves(manager.board, manager.current_player):
+        undo = manager.board.make_move(move)
+        manager.move_history.append(move)
+        manager.current_player = manager.current_player.opposite_color()
+        result[move.to_uci()] = perft(manager, depth - 1)
+        manager.current_player = manager.current_player.opposite_color()
+        manager.move_history.pop()
+        manager.board.unmake_move(undo)
+    return result
+
+
+def run_benchmark(max_depth: int, names: List[str] = None, board_type=Board) -> bool:
+    is_success = True
+    ensure_magic_tables()
+    for reference_position in REFERENCE_POSITIONS:
+        if names and reference_position.name not in names:
+            continue
+        for depth in range(1, min(max_depth, len(reference_position.node_counts)) + 1):
+            manager = reference_position_manager(reference_position, board_type=board_type)
+            start = time.perf_counter()
+            nodes = perft(manager, depth)
+            elapsed = time.perf_counter() - start
+            expected = reference_position.node_counts[depth - 1]
+            status = 'ok' if nodes == expected else f'KO (expected {expected})'
+            is_success = is_success and nodes == expected
+            print(f'{reference_position.name:<12} depth {depth}: {nodes:>10} nodes {elapsed:8.3f}s {nodes / max(elapsed, 1e-9):>10.0f} nodes/s {status}')
+    return is_success
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Perft correctness and speed benchmark')
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--position', action='append', choices=[position.name for position in REFERENCE_POSITIONS])
+    parser.add_argument('--divide', action='store_true', help='print the node count below each root move')
+    parser.add_argument('--bitboard', action='store_true', help='use the BitBoard backend')
+    parser.add_argument('--fen', help='divide an arbitrary FEN position instead of the reference positions')
+    args = parser.parse_args()
+
+    board_type = Board
+    if args.bitboard:
+        from chess.bitboard import BitBoard
+        board_type = BitBoard
+
+    if args.fen is not None:
+        result = divide(fen_game_manager_factory(args.fen, board_type=board_type), args.depth)
+        for move, nodes in sorted(result.items()):
+            print(f'{move}: {nodes}')
+        print(f'total: {sum(result.values())}')
+        return
+
+    if args.divide:
+        for reference_position in REFERENCE_POSITIONS:
+            if args.position and reference_position.name not in args.position:
+                continue
+            manager = reference_position_manager(reference_position, board_type=board_type)
+            result = divide(manager, args.depth)
+            print(f'{reference_position.name} depth {args.depth}')
+            for move, nodes in sorted(result.items()):
+                print(f'{move}: {nodes}')
+            print(f'total: {sum(result.values())}')
+        return
+
+    if not run_benchmark(args.depth, args.position, board_type=board_type):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+import mmap
+import os
+import re
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from chess.board import Board, START_FEN
+from chess.data import Move, PieceName, position_factory, piece_name_from_str
+from chess.game_manager import GameManager, fen_game_manager_factory
+
+HEADER_PATTERN = re.compile(r'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+MOVETEXT_TOKEN_PATTERN = re.compile(r'\{[^}]*\}|;[^\n]*|\$\d+|\(|\)|1-0|0-1|1/2-1/2|\*|\d+\.+|[^\s(){};$]+')
+SAN_PATTERN = re.compile(r'([NBRQK])?([a-h])?([1-8])?x?([a-h][1-8])(?:=?([NBRQ]))?[+#]?[!?]*')
+IS_LEFT_CASTLING_BY_SAN = {'O-O': False, 'O-O-O': True, '0-0': False, '0-0-0': True}
+RESULTS = {'1-0', '0-1', '1/2-1/2', '*'}
+PGN_ENCODING = 'utf-8'
+
+
+class PgnError(ValueError):
+    pass
+
+
+def iterate_game_texts(path: str, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            end = len(data) if end is None else end
+            data.seek(start)
+            game_offset = None
+            has_movetext = False
+            while data.tell() < len(data):
+                line_offset = data.tell()
+                line = data.readline().strip()
+                if not line or line.startswith(b'%'):
+                    continue
+                if line.startswith(b'[') and has_movetext:
+                    yield game_offset, data[game_offset:line_offset].decode(PGN_ENCODING, errors='replace')
+                    game_offset = None
+                    has_movetext = False
+                if game_offset is None:
+                    if line_offset >= end:
+                        return
+                    game_offset = line_offset
+                if not line.startswith(b'['):
+                    has_movetext = True
+            if game_offset is not None:
+                yield game_offset, data[game_offset:].decode(PGN_ENCODING, errors='replace')
+
+
+def parse_headers(text: str) -> Dict[str, str]:
+    headers = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line.startswith('['):
+            continue
+        match = HEADER_PATTERN.match(line)
+        if match is not None:
+            headers[match.group(1)] = match.group(2).replace('\\"', '"').replace('\\\\', '\\')
+    return headers
+
+
+def iterate_sans(text: str) -> Iterator[str]:
+    movetext = '\n'.join(line for line in text.splitlines() if not line.lstrip().startswith('['))
+    variation_depth = 0
+    for token in MOVETEXT_TOKEN_PATTERN.findall(movetext):
+        if token == '(':
+            variation_depth += 1
+        elif token == ')':
+            variation_depth -= 1
+        elif variation_depth > 0 or token[0] in '{;$' or (token[0].isdigit() and token.endswith('.')):
+            continue
+        elif token in RESULTS:
+            return
+        else:
+            yield token
+
+
+def parse_san(manager: GameManager, san: str) -> Move:
+    moves = manager.generate_legal_moves(manager.board, manager.current_player)
+    castling = san.rstrip('+#!?')
+    if castling in IS_LEFT_CASTLING_BY_SAN:
+        is_left_castling = IS_LEFT_CASTLING_BY_SAN[castling]
+        candidates = [move for move in moves if (move.is_left_castling if is_left_castling else move.is_right_castling)]
+    else:
+        match = SAN_PATTERN.fullmatch(san)
+        if match is None:
+            raise PgnError(f'{san} is not a valid SAN move')
+        piece_letter, source_col, source_row, target, promotion = match.groups()
+        piece_name = PieceName.PAWN if piece_letter is None else piece_name_from_str(piece_letter.lower())
+        target = position_factory(target)
+        promotion = None if promotion is None else piece_name_from_str(promotion.lower())
+        candidates = [
+            move for move in moves
+            if move.target == target and move.piece_moved.name == piece_name and move.promotion == promotion and
+            (source_col is None or move.source.col == ord(source_col) - ord('a')) and
+            (source_row is None or move.source.row == int(source_row) - 1)
+        ]
+    if len(candidates) != 1:
+        raise PgnError(f'{san} is {"ambiguous" if len(candidates) > 1 else "illegal"} for {manager.current_player.name}')
+    return candidates[0]
+
+
+def pgn_game_manager_factory(headers: Dict[str, str], board_type: Type[Board] = Board) -> GameManager:
+    return fen_game_manager_factory(headers.get('FEN', START_FEN), board_type=board_type)
+
+
+def read_game(text: str, board_type: Type[Board] = Board) -> Tuple[Dict[str, str], List[Move]]:
+    headers = parse_headers(text)
+    manager = pgn_game_manager_factory(headers, board_type=board_type)
+    moves = []
+    for san in iterate_sans(text):
+        move = parse_san(manager, san)
+        manager.play(move)
+        moves.append(move)
+    return headers, moves
+
+
+def read_games(path: str, board_type: Type[Board] = Board, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[Dict[str, str], List[Move]]]:
+    for _, text in iterate_game_texts(path, start, end):
+        yield read_game(text, board_type=board_type)
+
+
+def read_legal_games(
+        path: str,
+        board_type: Type[Board] = Board,
+        on_illegal_game: Callable[[int, ValueError], None] = None,
+) -> Iterator[Tuple[Dict[str, str], List[Move]]]:
+    for offset, text in iterate_game_texts(path):
+        try:
+            game = read_game(text, board_type=board_type)
+        except ValueError as error:
+            if on_illegal_game is not None:
+                on_illegal_game(offset, error)
+            continue
+        yield game
+
+
+def print_illegal_game(offset: int, error: ValueError):
+    print(f'skipping illegal game at byte {offset}: {error}')
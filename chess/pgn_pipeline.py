@@ -0,0 +1,146 @@
+import argparse
+import mmap
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Type
+
+from chess.board import Board
+from chess.pgn import iterate_game_texts, read_game
+
+SHARDS_BY_PROCESS = 4
+GAME_START_PATTERN = re.compile(rb'\n[ \t\r]*\n[ \t]*\[')
+
+
+@dataclass
+class ReplayStatistics:
+    games: int = 0
+    moves: int = 0
+    illegal_games: int = 0
+    results: Dict[str, int] = field(default_factory=dict)
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+    game_time: float = 0
+    slowest_game_time: float = 0
+    slowest_game_offset: Optional[int] = None
+    elapsed: float = 0
+
+    def add_game(self, offset: int, result: str, move_count: int, game_time: float):
+        self.games += 1
+        self.moves += move_count
+        self.results[result] = self.results.get(result, 0) + 1
+        self.game_time += game_time
+        if game_time > self.slowest_game_time:
+            self.slowest_game_time = game_time
+            self.slowest_game_offset = offset
+
+    def add_error(self, offset: int, message: str, game_time: float):
+        self.illegal_games += 1
+        self.errors.append((offset, message))
+        self.add_game(offset, 'illegal', 0, game_time)
+
+    def merge(self, other: 'ReplayStatistics'):
+        self.games += other.games
+        self.moves += other.moves
+        self.illegal_games += other.illegal_games
+        for result, count in other.results.items():
+            self.results[result] = self.results.get(result, 0) + count
+        self.errors.extend(other.errors)
+        self.game_time += other.game_time
+        if other.slowest_game_time > self.slowest_game_time:
+            self.slowest_game_time = other.slowest_game_time
+            self.slowest_game_offset = other.slowest_game_offset
+
+    def games_per_second(self) -> int:
+        return int(self.games / self.elapsed) if self.elapsed > 0 else 0
+
+    def average_game_time(self) -> float:
+        return self.game_time / self.games if self.games > 0 else 0
+
+
+def read_game_offsets(path: str) -> List[int]:
+    return [offset for offset, _ in iterate_game_texts(path)]
+
+
+def find_game_starts(path: str, split_count: int) -> List[int]:
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            starts = [0]
+            for index in range(1, max(1, split_count)):
+                match = GAME_START_PATTERN.search(data, max(starts[-1], size * index // split_count - 1))
+                if match is None:
+                    break
+                if match.end() - 1 > starts[-1]:
+                    starts.append(match.end() - 1)
+            return starts
+
+
+def split_shards(offsets: List[int], shard_count: int) -> List[Tuple[int, Optional[int]]]:
+    shard_size = max(1, -(-len(offsets) // max(1, shard_count)))
+    starts = offsets[::shard_size]
+    return [(start, starts[index + 1] if index + 1 < len(starts) else None) for index, start in enumerate(starts)]
+
+
+def replay_shard(path: str, start: int, end: Optional[int], board_type: Type[Board] = Board) -> ReplayStatistics:
+    statistics = ReplayStatistics()
+    for offset, text in iterate_game_texts(path, start, end):
+        game_start = time.perf_counter()
+        try:
+            headers, moves = read_game(text, board_type=board_type)
+        except ValueError as error:
+            statistics.add_error(offset, str(error), time.perf_counter() - game_start)
+            continue
+        statistics.add_game(offset, headers.get('Result', '*'), len(moves), time.perf_counter() - game_start)
+    return statistics
+
+
+def replay_pgn(path: str, processes: int = None, board_type: Type[Board] = Board) -> ReplayStatistics:
+    start_time = time.perf_counter()
+    processes = os.cpu_count() if processes is None else processes
+    shard_count = max(1, processes) * SHARDS_BY_PROCESS
+    shards = split_shards(find_game_starts(path, shard_count), shard_count)
+    statistics = ReplayStatistics()
+    if processes <= 1:
+        for start, end in shards:
+            statistics.merge(replay_shard(path, start, end, board_type))
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(replay_shard, path, start, end, board_type) for start, end in shards]
+            for future in futures:
+                statistics.merge(future.result())
+    statistics.errors.sort()
+    statistics.elapsed = time.perf_counter() - start_time
+    return statistics
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay and validate every game of a PGN archive')
+    parser.add_argument('path')
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--bitboard', action='store_true', help='use the BitBoard backend')
+    args = parser.parse_args()
+
+    board_type = Board
+    if args.bitboard:
+        from chess.bitboard import BitBoard
+        board_type = BitBoard
+
+    statistics = replay_pgn(args.path, args.processes, board_type)
+    print(f'{statistics.games} games, {statistics.moves} moves, {statistics.illegal_games} illegal games')
+    for result, count in sorted(statistics.results.items()):
+        print(f'{result:<8} {count:>10}')
+    for offset, message in statistics.errors:
+        print(f'illegal game at byte {offset}: {message}')
+    print(f'average {statistics.average_game_time() * 1000:.2f}ms per game, '
+          f'slowest {statistics.slowest_game_time * 1000:.2f}ms at byte {statistics.slowest_game_offset}')
+    print(f'{statistics.elapsed:.3f}s {statistics.games_per_second()} games/s')
+    if statistics.illegal_games > 0:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
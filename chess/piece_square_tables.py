@@ -0,0 +1,94 @@
+from chess.data import Piece, PieceColor, PieceName, Position, square_from_position, BOARD_SIZE
+
+PIECE_VALUES = {
+    PieceName.PAWN: 100,
+    PieceName.NIGHT: 320,
+    PieceName.BISHOP: 330,
+    PieceName.ROOK: 500,
+    PieceName.QUEEN: 900,
+    PieceName.KING: 0,
+}
+
+# Tables are written from white's point of view, row 8 first, as seen on a diagram.
+PIECE_SQUARE_TABLES = {
+    PieceName.PAWN: [
+        0, 0, 0, 0, 0, 0, 0, 0,
+        50, 50, 50, 50, 50, 50, 50, 50,
+        10, 10, 20, 30, 30, 20, 10, 10,
+        5, 5, 10, 25, 25, 10, 5, 5,
+        0, 0, 0, 20, 20, 0, 0, 0,
+        5, -5, -10, 0, 0, -10, -5, 5,
+        5, 10, 10, -20, -20, 10, 10, 5,
+        0, 0, 0, 0, 0, 0, 0, 0,
+    ],
+    PieceName.NIGHT: [
+        -50, -40, -30, -30, -30, -30, -40, -50,
+        -40, -20, 0, 0, 0, 0, -20, -40,
+        -30, 0, 10, 15, 15, 10, 0, -30,
+        -30, 5, 15, 20, 20, 15, 5, -30,
+        -30, 0, 15, 20, 20, 15, 0, -30,
+        -30, 5, 10, 15, 15, 10, 5, -30,
+        -40, -20, 0, 5, 5, 0, -20, -40,
+        -50, -40, -30, -30, -30, -30, -40, -50,
+    ],
+    PieceName.BISHOP: [
+        -20, -10, -10, -10, -10, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 10, 10, 5, 0, -10,
+        -10, 5, 5, 10, 10, 5, 5, -10,
+        -10, 0, 10, 10, 10, 10, 0, -10,
+        -10, 10, 10, 10, 10, 10, 10, -10,
+        -10, 5, 0, 0, 0, 0, 5, -10,
+        -20, -10, -10, -10, -10, -10, -10, -20,
+    ],
+    PieceName.ROOK: [
+        0, 0, 0, 0, 0, 0, 0, 0,
+        5, 10, 10, 10, 10, 10, 10, 5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        0, 0, 0, 5, 5, 0, 0, 0,
+    ],
+    PieceName.QUEEN: [
+        -20, -10, -10, -5, -5, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 5, 5, 5, 0, -10,
+        -5, 0, 5, 5, 5, 5, 0, -5,
+        0, 0, 5, 5, 5, 5, 0, -5,
+        -10, 5, 5, 5, 5, 5, 0, -10,
+        -10, 0, 5, 0, 0, 0, 0, -10,
+        -20, -10, -10, -5, -5, -10, -10, -20,
+    ],
+    PieceName.KING: [
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -20, -30, -30, -40, -40, -30, -30, -20,
+        -10, -20, -20, -20, -20, -20, -20, -10,
+        20, 20, 0, 0, 0, 0, 20, 20,
+        20, 30, 10, 0, 0, 10, 30, 20,
+    ],
+}
+
+
+def table_index(square: int, color: PieceColor) -> int:
+    row, col = divmod(square, BOARD_SIZE)
+    return (BOARD_SIZE - 1 - row) * BOARD_SIZE + col if color == PieceColor.WHITE else row * BOARD_SIZE + col
+
+
+# Signed score of a piece on a square from white's point of view, material included.
+PIECE_SQUARE_VALUES = [
+    [
+        [(1 if color == PieceColor.WHITE else -1) * (PIECE_VALUES[name] + PIECE_SQUARE_TABLES[name][table_index(square, color)])
+         for square in range(BOARD_SIZE * BOARD_SIZE)]
+        for name in PieceName
+    ]
+    for color in PieceColor
+]
+
+
+def piece_square_value(piece: Piece, position: Position) -> int:
+    return PIECE_SQUARE_VALUES[piece.color.value][piece.name.value][square_from_position(position)]
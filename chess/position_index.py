@@ -0,0 +1,191 @@
+import argparse
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from chess.board import Board, fen_board_factory
+from chess.data import Move
+from chess.game_record import encode_move
+from chess.pgn import pgn_game_manager_factory, print_illegal_game, read_legal_games
+
+RECORD = struct.Struct('<QIHBx')
+HASH = struct.Struct('<Q')
+NO_MOVE = 0
+RESULTS = ['1-0', '1/2-1/2', '0-1', '*']
+RESULT_CODE_BY_RESULT = {result: code for code, result in enumerate(RESULTS)}
+CHUNK_RECORDS = 1 << 20
+READ_RECORDS = 1 << 12
+
+
+@dataclass(frozen=True)
+class PositionStatistics:
+    hash: int
+    games: List[int] = field(default_factory=list)
+    move_counts: Dict[int, int] = field(default_factory=dict)
+    result_counts: Dict[str, int] = field(default_factory=dict)
+
+    def occurrences(self) -> int:
+        return sum(self.move_counts.values())
+
+
+def iterate_game_records(game_index: int, headers: Dict[str, str], moves: List[Move], board_type: Type[Board] = Board) -> Iterator[Tuple[int, int, int, int]]:
+    manager = pgn_game_manager_factory(headers, board_type=board_type)
+    result_code = RESULT_CODE_BY_RESULT.get(headers.get('Result', '*'), RESULT_CODE_BY_RESULT['*'])
+    for move in moves:
+        yield manager.board.hash, game_index, encode_move(move), result_code
+        manager.play(move)
+    yield manager.board.hash, game_index, NO_MOVE, result_code
+
+
+def write_sorted_run(records: List[Tuple[int, int, int, int]], file: BinaryIO):
+    records.sort(key=lambda record: record[0])
+    buffer = bytearray(RECORD.size * len(records))
+    for index, record in enumerate(records):
+        RECORD.pack_into(buffer, index * RECORD.size, *record)
+    file.write(buffer)
+
+
+def iterate_run(file: BinaryIO) -> Iterator[Tuple[int, int, int, int]]:
+    file.seek(0)
+    while True:
+        data = file.read(RECORD.size * READ_RECORDS)
+        if not data:
+            return
+        yield from RECORD.iter_unpack(data)
+
+
+def build_position_index(
+        games: Iterable[Tuple[Dict[str, str], List[Move]]],
+        path: str,
+        chunk_records: int = CHUNK_RECORDS,
+        board_type: Type[Board] = Board,
+) -> int:
+    runs = []
+    records = []
+    record_count = 0
+    try:
+        for game_index, (headers, moves) in enumerate(games):
+            records.extend(iterate_game_records(game_index, headers, moves, board_type))
+            if len(records) >= chunk_records:
+                run = tempfile.TemporaryFile()
+                write_sorted_run(records, run)
+                runs.append(run)
+                record_count += len(records)
+                records = []
+        record_count += len(records)
+        with open(path, 'wb') as file:
+            if len(runs) == 0:
+                write_sorted_run(records, file)
+                return record_count
+            records.sort(key=lambda record: record[0])
+            buffer = bytearray()
+            for record in heapq.merge(*(iterate_run(run) for run in runs), records, key=lambda record: record[0]):
+                buffer += RECORD.pack(*record)
+                if len(buffer) >= RECORD.size * READ_RECORDS:
+                    file.write(buffer)
+                    buffer = bytearray()
+            file.write(buffer)
+        return record_count
+    finally:
+        for run in runs:
+            run.close()
+
+
+class PositionIndex:
+    file: BinaryIO
+    data: Optional[mmap.mmap]
+    record_count: int
+
+    def __init__(self, path: str):
+        self.file = open(path, 'rb')
+        size = os.fstat(self.file.fileno()).st_size
+        if size % RECORD.size != 0:
+            self.file.close()
+            raise ValueError(f'{path} is not a position index file')
+        self.record_count = size // RECORD.size
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size > 0 else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def close(self):
+        if self.data is not None:
+            self.data.close()
+            self.data = None
+        self.file.close()
+
+    def get_hash(self, index: int) -> int:
+        return HASH.unpack_from(self.data, index * RECORD.size)[0]
+
+    def find_first(self, hash: int) -> int:
+        low = 0
+        high = self.record_count
+        while low < high:
+            middle = (low + high) // 2
+            if self.get_hash(middle) < hash:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def iterate_records(self, hash: int) -> Iterator[Tuple[int, int, int, int]]:
+        index = self.find_first(hash)
+        while index < self.record_count:
+            record = RECORD.unpack_from(self.data, index * RECORD.size)
+            if record[0] != hash:
+                return
+            yield record
+            index += 1
+
+    def lookup(self, hash: int) -> PositionStatistics:
+        result_code_by_game = {}
+        move_counts = {}
+        for _, game_index, move_code, result_code in self.iterate_records(hash):
+            result_code_by_game[game_index] = result_code
+            move_counts[move_code] = move_counts.get(move_code, 0) + 1
+        result_counts = {}
+        for result_code in result_code_by_game.values():
+            result_counts[RESULTS[result_code]] = result_counts.get(RESULTS[result_code], 0) + 1
+        return PositionStatistics(hash, sorted(result_code_by_game), move_counts, result_counts)
+
+    def probe(self, board: Board) -> PositionStatistics:
+        return self.lookup(board.hash)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or probe a position index')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build_parser = subparsers.add_parser('build')
+    build_parser.add_argument('pgn_path')
+    build_parser.add_argument('index_path')
+    probe_parser = subparsers.add_parser('probe')
+    probe_parser.add_argument('index_path')
+    probe_parser.add_argument('fen')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command == 'build':
+        record_count = build_position_index(read_legal_games(args.pgn_path, on_illegal_game=print_illegal_game), args.index_path)
+        print(f'{record_count} positions indexed in {time.perf_counter() - start:.3f}s')
+        return
+
+    with PositionIndex(args.index_path) as index:
+        statistics = index.probe(fen_board_factory(args.fen))
+    print(f'{statistics.occurrences()} occurrences in {len(statistics.games)} games, {(time.perf_counter() - start) * 1000:.3f}ms')
+    for result, count in sorted(statistics.result_counts.items()):
+        print(f'{result:<8} {count:>10}')
+
+
+if __name__ == '__main__':
+    main()
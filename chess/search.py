@@ -0,0 +1,281 @@
+import time
+from dataclasses import dataclass, field, replace
+from threading import Event
+from typing import Callable, List, Optional
+
+from chess.board import Board
+from chess.data import Move, MoveUndo, PieceColor
+from chess.evaluation import evaluate
+from chess.game_manager import GameManager
+from chess.move_ordering import MoveOrdering, MovePicker, is_tactical
+from chess.packed_move import MOVE_KEY_MASK, unpack_move
+from chess.polyglot import PolyglotBook
+from chess.static_exchange import capture_gain, is_losing_capture
+from chess.transposition import TranspositionTable, Bound
+
+MAX_DEPTH = 64
+MATE_SCORE = 100000
+INFINITE_SCORE = 1000000
+CHECK_TIME_EVERY_NODES = 64
+DELTA_MARGIN = 200
+
+
+class SearchStopped(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class SearchLimits:
+    depth: int = MAX_DEPTH
+    nodes: Optional[int] = None
+    time: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    best_move: Optional[Move]
+    score: int
+    depth: int
+    nodes: int
+    elapsed: float
+    principal_variation: List[Move] = field(default_factory=list)
+
+    def nodes_per_second(self) -> int:
+        return int(self.nodes / self.elapsed) if self.elapsed > 0 else 0
+
+
+def is_mate_score(score: int) -> bool:
+    return abs(score) >= MATE_SCORE - MAX_DEPTH
+
+
+def score_to_transposition(score: int, ply: int) -> int:
+    if is_mate_score(score):
+        return score + ply if score > 0 else score - ply
+    return score
+
+
+def score_from_transposition(score: int, ply: int) -> int:
+    if is_mate_score(score):
+        return score - ply if score > 0 else score + ply
+    return score
+
+
+class SearchEngine:
+    board: Board
+    manager: GameManager
+    transposition_table: TranspositionTable
+    limits: SearchLimits
+    nodes: int
+    start_time: float
+    is_stopped: bool
+    principal_variations: List[List[Move]]
+    position_hashes: List[int]
+    stop_event: Optional[Event]
+    helper_index: int
+    book: Optional[PolyglotBook]
+    move_ordering: MoveOrdering
+
+    def __init__(
+            self,
+            board: Board,
+            color: PieceColor,
+            transposition_table: Optional[TranspositionTable] = None,
+            stop_event: Optional[Event] = None,
+            helper_index: int = 0,
+            book: Optional[PolyglotBook] = None,
+    ):
+        self.board = board
+        self.manager = GameManager(board, current_player=color)
+        self.transposition_table = TranspositionTable() if transposition_table is None else transposition_table
+        self.stop_event = stop_event
+        self.helper_index = helper_index
+        self.book = book
+        self.move_ordering = MoveOrdering(MAX_DEPTH)
+        self.limits = SearchLimits()
+        self.nodes = 0
+        self.start_time = 0
+        self.is_stopped = False
+        self.principal_variations = [[] for _ in range(MAX_DEPTH + 1)]
+        self.position_hashes = []
+
+    def stop(self):
+        self.is_stopped = True
+
+    def search(self, limits: SearchLimits = SearchLimits(), on_iteration: Callable[[SearchResult], None] = None) -> SearchResult:
+        self.limits = limits
+        self.nodes = 0
+        self.start_time = time.perf_counter()
+        self.is_stopped = False
+        if self.book is not None:
+            book_move = self.book.best_move(self.manager)
+            if book_move is not None:
+                return SearchResult(best_move=book_move, score=0, depth=0, nodes=0,
+                                    elapsed=time.perf_counter() - self.start_time, principal_variation=[book_move])
+        self.transposition_table.new_search()
+        self.move_ordering.new_search()
+        result = SearchResult(best_move=None, score=0, depth=0, nodes=0, elapsed=0)
+
+        for depth in range(1, min(limits.depth, MAX_DEPTH) + 1):
+            try:
+                score = self.negamax(depth, -INFINITE_SCORE, INFINITE_SCORE, 0)
+            except SearchStopped:
+                if result.best_move is None and len(self.principal_variations[0]) > 0:
+                    result = self.build_result(result.score, depth)
+                result = replace(result, nodes=self.nodes, elapsed=time.perf_counter() - self.start_time)
+                break
+            result = self.build_result(score, depth)
+            if on_iteration is not None:
+                on_iteration(result)
+            if result.best_move is None or is_mate_score(score):
+                break
+        return result
+
+    def build_result(self, score: int, depth: int) -> SearchResult:
+        principal_variation = self.extend_principal_variation(self.principal_variations[0], depth)
+        return SearchResult(
+            best_move=principal_variation[0] if len(principal_variation) > 0 else None,
+            score=score,
+            depth=depth,
+            nodes=self.nodes,
+            elapsed=time.perf_counter() - self.start_time,
+            principal_variation=principal_variation,
+        )
+
+    def extend_principal_variation(self, principal_variation: List[Move], depth: int) -> List[Move]:
+        result = []
+        undos = []
+        seen_hashes = {self.board.hash}
+        try:
+            while len(result) < depth:
+                if len(result) < len(principal_variation):
+                    move = principal_variation[len(result)]
+                else:
+                    codes = self.manager.generate_legal_move_codes(self.board, self.manager.current_player)
+                    entry = self.transposition_table.probe(self.board.hash)
+                    move_key = 0 if entry is None else entry.move_key
+                    move = next((unpack_move(code) for code in codes if move_key != 0 and code & MOVE_KEY_MASK == move_key), None)
+                    if move is None:
+                        break
+                undos.append(self.make_move(move))
+                result.append(move)
+                if self.board.hash in seen_hashes:
+                    break
+                seen_hashes.add(self.board.hash)
+        finally:
+            for undo in reversed(undos):
+                self.unmake_move(undo)
+        return result
+
+    def check_limits(self):
+        if self.is_stopped:
+            raise SearchStopped()
+        if self.limits.nodes is not None and self.nodes >= self.limits.nodes:
+            raise SearchStopped()
+        if self.nodes % CHECK_TIME_EVERY_NODES == 0:
+            if self.limits.time is not None and time.perf_counter() - self.start_time >= self.limits.time:
+                raise SearchStopped()
+            if self.stop_event is not None and self.stop_event.is_set():
+                raise SearchStopped()
+
+    def make_move(self, move: Move) -> MoveUndo:
+        self.position_hashes.append(self.board.hash)
+        undo = self.board.make_move(move)
+        self.manager.move_history.append(move)
+        self.manager.current_player = self.manager.current_player.opposite_color()
+        return undo
+
+    def unmake_move(self, undo: MoveUndo):
+        self.manager.current_player = self.manager.current_player.opposite_color()
+        self.manager.move_history.pop()
+        self.board.unmake_move(undo)
+        self.position_hashes.pop()
+
+    def negamax(self, depth: int, alpha: int, beta: int, ply: int) -> int:
+        self.check_limits()
+        self.nodes += 1
+        self.principal_variations[ply] = []
+        color = self.manager.current_player
+        if ply > 0 and self.board.hash in self.position_hashes:
+            return 0
+
+        entry = self.transposition_table.probe(self.board.hash)
+        if entry is not None and ply > 0 and entry.depth >= depth:
+            score = score_from_transposition(entry.score, ply)
+            if (entry.bound == Bound.EXACT or
+                    (entry.bound == Bound.LOWER and score >= beta) or
+                    (entry.bound == Bound.UPPER and score <= alpha)):
+                return score
+
+        if ply >= MAX_DEPTH:
+            return evaluate(self.board, color)
+        if depth == 0:
+            return self.quiescence(alpha, beta, ply)
+
+        codes = self.manager.generate_legal_move_codes(self.board, color)
+        if len(codes) == 0:
+            return -MATE_SCORE + ply if self.manager.is_in_check(self.board, color) else 0
+        if ply == 0 and self.helper_index > 0:
+            shift = self.helper_index % len(codes)
+            codes = codes[shift:] + codes[:shift]
+        original_alpha = alpha
+        best_score = -INFINITE_SCORE
+        best_code = 0
+        for code in MovePicker(codes, self.move_ordering, ply, color, None if entry is None else entry.move_key, self.board):
+            move = unpack_move(code)
+            undo = self.make_move(move)
+            try:
+                score = -self.negamax(depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                self.unmake_move(undo)
+            if score > best_score:
+                best_score = score
+                best_code = code
+            if score > alpha:
+                alpha = score
+                self.principal_variations[ply] = [move] + self.principal_variations[ply + 1]
+                if alpha >= beta:
+                    self.move_ordering.store_cutoff(code, color, depth, ply)
+                    break
+
+        bound = Bound.UPPER if best_score <= original_alpha else Bound.LOWER if best_score >= beta else Bound.EXACT
+        self.transposition_table.store(self.board.hash, depth, score_to_transposition(best_score, ply), bound, best_code & MOVE_KEY_MASK)
+        return best_score
+
+    def quiescence(self, alpha: int, beta: int, ply: int) -> int:
+        self.check_limits()
+        self.nodes += 1
+        color = self.manager.current_player
+        if ply >= MAX_DEPTH:
+            return evaluate(self.board, color)
+
+        is_in_check = self.manager.is_in_check(self.board, color)
+        best_score = -INFINITE_SCORE
+        if not is_in_check:
+            best_score = evaluate(self.board, color)
+            if best_score >= beta:
+                return best_score
+            alpha = max(alpha, best_score)
+
+        codes = self.manager.generate_legal_move_codes(self.board, color)
+        if is_in_check and len(codes) == 0:
+            return -MATE_SCORE + ply
+        if not is_in_check:
+            codes = [code for code in codes if is_tactical(code) and best_score + capture_gain(code) + DELTA_MARGIN > alpha and
+                     not is_losing_capture(self.board, code)]
+        for code in MovePicker(codes, self.move_ordering, ply, color):
+            undo = self.make_move(unpack_move(code))
+            try:
+                score = -self.quiescence(-beta, -alpha, ply + 1)
+            finally:
+                self.unmake_move(undo)
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        return best_score
+
+
+def search(board: Board, color: PieceColor, limits: SearchLimits = SearchLimits(), book: Optional[PolyglotBook] = None) -> SearchResult:
+    return SearchEngine(board, color, book=book).search(limits)
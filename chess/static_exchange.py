@@ -0,0 +1,58 @@
+from typing import List
+
+from chess.attacks import least_valuable_attacker
+from chess.board import Board
+from chess.data import PieceColor, PieceName
+from chess.packed_move import (
+    EN_PASSANT_FLAG, PIECE_MOVED_COLOR_SHIFT, PIECE_MOVED_SHIFT, PIECE_NAME_MASK, PIECE_TAKEN_SHIFT, PROMOTION_SHIFT,
+    SQUARE_MASK, TARGET_SHIFT,
+)
+from chess.piece_square_tables import PIECE_VALUES
+
+KING_EXCHANGE_VALUE = 20000
+EXCHANGE_VALUES: List[int] = [KING_EXCHANGE_VALUE if piece_name == PieceName.KING else PIECE_VALUES[piece_name] for piece_name in PieceName]
+
+
+def capture_gain(code: int) -> int:
+    piece_taken_code = code >> PIECE_TAKEN_SHIFT & PIECE_NAME_MASK
+    promotion_code = code >> PROMOTION_SHIFT & PIECE_NAME_MASK
+    gain = EXCHANGE_VALUES[piece_taken_code - 1] if piece_taken_code else 0
+    if promotion_code:
+        gain += EXCHANGE_VALUES[promotion_code] - EXCHANGE_VALUES[PieceName.PAWN.value]
+    return gain
+
+
+def static_exchange_evaluation(board: Board, code: int) -> int:
+    source = code & SQUARE_MASK
+    target = code >> TARGET_SHIFT & SQUARE_MASK
+    promotion_code = code >> PROMOTION_SHIFT & PIECE_NAME_MASK
+    attacker_value = EXCHANGE_VALUES[promotion_code if promotion_code else code >> PIECE_MOVED_SHIFT & PIECE_NAME_MASK]
+    gains = [capture_gain(code)]
+    occupancy = board.get_occupancy() & ~(1 << source)
+    if code & EN_PASSANT_FLAG:
+        occupancy &= ~(1 << (source & ~7 | target & 7))
+    color = PieceColor(code >> PIECE_MOVED_COLOR_SHIFT & 1).opposite_color()
+
+    while True:
+        attacker = least_valuable_attacker(board, target, color, occupancy)
+        if attacker is None:
+            break
+        attacker_square, attacker_name = attacker
+        gains.append(attacker_value - gains[-1])
+        if max(-gains[-2], gains[-1]) < 0:
+            gains.pop()
+            break
+        attacker_value = EXCHANGE_VALUES[attacker_name.value]
+        occupancy &= ~(1 << attacker_square)
+        color = color.opposite_color()
+
+    for index in range(len(gains) - 1, 0, -1):
+        gains[index - 1] = -max(-gains[index - 1], gains[index])
+    return gains[0]
+
+
+def is_losing_capture(board: Board, code: int) -> bool:
+    piece_taken_code = code >> PIECE_TAKEN_SHIFT & PIECE_NAME_MASK
+    if not piece_taken_code or EXCHANGE_VALUES[piece_taken_code - 1] >= EXCHANGE_VALUES[code >> PIECE_MOVED_SHIFT & PIECE_NAME_MASK]:
+        return False
+    return static_exchange_evaluation(board, code) < 0
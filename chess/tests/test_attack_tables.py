@@ -0,0 +1,44 @@
+import unittest
+
+from chess.attack_tables import KNIGHT_TARGETS, KING_TARGETS, PAWN_ATTACK_TARGETS, RAYS, KNIGHT_ATTACK_MASKS, between_mask, line_mask, squares_mask
+from chess.data import PieceColor, position_factory, square_from_position
+
+
+def square(info: str) -> int:
+    return square_from_position(position_factory(info))
+
+
+def mask(*infos: str) -> int:
+    return squares_mask(position_factory(info) for info in infos)
+
+
+class TestAttackTables(unittest.TestCase):
+
+    def test_should_keep_only_knight_targets_on_board(self):
+        self.assertCountEqual([position_factory('b3'), position_factory('c2')], KNIGHT_TARGETS[square('a1')])
+        self.assertEqual(8, len(KNIGHT_TARGETS[square('d4')]))
+        self.assertEqual(mask('b3', 'c2'), KNIGHT_ATTACK_MASKS[square('a1')])
+
+    def test_should_return_king_and_pawn_attacks(self):
+        self.assertEqual(3, len(KING_TARGETS[square('h8')]))
+        self.assertCountEqual([position_factory('d3'), position_factory('f3')], PAWN_ATTACK_TARGETS[PieceColor.WHITE][square('e2')])
+        self.assertCountEqual([position_factory('b6')], PAWN_ATTACK_TARGETS[PieceColor.BLACK][square('a7')])
+
+    def test_should_order_ray_squares_from_source_outward(self):
+        self.assertEqual([position_factory('c3'), position_factory('b2'), position_factory('a1')], list(RAYS[(-1, -1)][square('d4')]))
+        self.assertEqual((), RAYS[(0, 1)][square('h4')])
+
+    def test_should_return_squares_between_aligned_squares(self):
+        self.assertEqual(mask('b2', 'c3'), between_mask(square('a1'), square('d4')))
+        self.assertEqual(mask('e2', 'e3'), between_mask(square('e4'), square('e1')))
+        self.assertEqual(0, between_mask(square('a1'), square('b3')))
+        self.assertEqual(0, between_mask(square('a1'), square('b2')))
+
+    def test_should_return_full_line_through_aligned_squares(self):
+        self.assertEqual(mask('a4', 'b4', 'c4', 'd4', 'e4', 'f4', 'g4', 'h4'), line_mask(square('c4'), square('f4')))
+        self.assertEqual(line_mask(square('a1'), square('h8')), line_mask(square('h8'), square('b2')))
+        self.assertEqual(0, line_mask(square('a1'), square('b3')))
+
+
+if __name__ == '__main__':
+    unittest.main()
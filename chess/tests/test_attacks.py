@@ -0,0 +1,41 @@
+import unittest
+
+from chess.attacks import attackers, checkers, is_king_attacked, is_square_attacked
+from chess.board import fen_board_factory
+from chess.data import PieceColor, position_factory, square_from_position
+
+
+def square(info: str) -> int:
+    return square_from_position(position_factory(info))
+
+
+class TestAttacks(unittest.TestCase):
+
+    def test_should_detect_attacks_by_every_piece_type(self):
+        board = fen_board_factory('4k3/8/8/3p4/8/2N5/8/R3K2B w - - 0 1')
+        self.assertTrue(is_square_attacked(board, square('b5'), PieceColor.WHITE))
+        self.assertTrue(is_square_attacked(board, square('a8'), PieceColor.WHITE))
+        self.assertTrue(is_square_attacked(board, square('d5'), PieceColor.WHITE))
+        self.assertTrue(is_square_attacked(board, square('f2'), PieceColor.WHITE))
+        self.assertTrue(is_square_attacked(board, square('e4'), PieceColor.BLACK))
+        self.assertTrue(is_square_attacked(board, square('d7'), PieceColor.BLACK))
+        self.assertFalse(is_square_attacked(board, square('c5'), PieceColor.BLACK))
+        self.assertFalse(is_square_attacked(board, square('h8'), PieceColor.WHITE))
+
+    def test_should_stop_sliding_attacks_on_blockers_unless_occupancy_overridden(self):
+        board = fen_board_factory('4k3/8/8/8/8/8/4P3/4R1K1 w - - 0 1')
+        self.assertFalse(is_square_attacked(board, square('e4'), PieceColor.WHITE))
+        occupancy = board.get_occupancy() & ~(1 << square('e2'))
+        self.assertTrue(is_square_attacked(board, square('e4'), PieceColor.WHITE, occupancy))
+
+    def test_should_list_checkers(self):
+        board = fen_board_factory('4k3/8/8/8/1b6/3n4/8/4K3 w - - 0 1')
+        self.assertCountEqual([position_factory('b4'), position_factory('d3')], checkers(board, PieceColor.WHITE))
+        self.assertEqual([], checkers(board, PieceColor.BLACK))
+        self.assertTrue(is_king_attacked(board, PieceColor.WHITE))
+        self.assertFalse(is_king_attacked(board, PieceColor.BLACK))
+        self.assertEqual([position_factory('e1')], attackers(board, square('d1'), PieceColor.WHITE))
+
+
+if __name__ == '__main__':
+    unittest.main()
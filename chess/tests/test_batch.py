@@ -0,0 +1,44 @@
+import unittest
+
+from chess.batch import encode_boards, encode_situations, evaluate_encoded, evaluate_boards, to_planes, numpy
+from chess.board import board_factory
+from chess.data import PieceColor
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestBatch(unittest.TestCase):
+
+    def test_should_encode_board_as_signed_piece_codes(self):
+        encoded = encode_boards([board_factory(situation={'a1': 'wr', 'h8': 'bk'})])
+        self.assertEqual((1, 64), encoded.shape)
+        self.assertEqual(4, encoded[0, 0])
+        self.assertEqual(-6, encoded[0, 63])
+        self.assertEqual(2, numpy.count_nonzero(encoded))
+
+    def test_should_encode_situations_like_boards(self):
+        situation = {'e1': 'wk', 'd4': 'wn', 'e8': 'bk', 'c6': 'bp'}
+        numpy.testing.assert_array_equal(encode_boards([board_factory(situation)]), encode_situations([situation]))
+
+    def test_should_split_encoded_boards_into_twelve_planes(self):
+        planes = to_planes(encode_boards([board_factory()]))
+        self.assertEqual((1, 12, 64), planes.shape)
+        self.assertEqual(32, planes.sum())
+
+    def test_should_match_incremental_board_evaluation(self):
+        boards = [board_factory(), board_factory(situation={'e1': 'wk', 'd4': 'wn', 'e8': 'bk'}), board_factory(situation={'e1': 'wk', 'd8': 'bq', 'e8': 'bk'})]
+        scores = evaluate_encoded(encode_boards(boards))
+        self.assertEqual([board.evaluation for board in boards], scores.tolist())
+
+    def test_should_evaluate_from_side_to_move_and_count_legal_moves(self):
+        white_board = board_factory(situation={'e1': 'wk', 'd4': 'wn', 'e8': 'bk'})
+        black_board = board_factory(situation={'e1': 'wk', 'd4': 'wn', 'e8': 'bk'})
+        black_board.set_color_to_move(PieceColor.BLACK)
+        result = evaluate_boards([board_factory(), white_board, black_board])
+        self.assertEqual([0, white_board.evaluation, -black_board.evaluation], result.scores.tolist())
+        boards = [board_factory(), white_board, black_board]
+        numpy.testing.assert_array_equal(evaluate_encoded(encode_boards(boards), [board.color_to_move for board in boards]), result.scores)
+        self.assertEqual([20, 13, 5], result.legal_move_counts.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
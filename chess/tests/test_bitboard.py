@@ -0,0 +1,68 @@
+import unittest
+
+from chess.bitboard import bitboard_factory, BitBoard
+from chess.board import fen_board_factory, to_piece_positions
+from chess.data import PieceColor, PieceName, Piece, position_factory, piece_factory, Move
+from chess.game_manager import GameManager
+from chess.polyglot import polyglot_key
+
+
+class TestBitBoard(unittest.TestCase):
+
+    def test_should_return_white_queen_when_board_default_initialized(self):
+        board = bitboard_factory()
+        self.assertEqual('QUEEN WHITE', str(board.get_piece(position_factory('d1'))))
+        self.assertIsNone(board.get_piece(position_factory('d4')))
+
+    def test_should_keep_occupancy_masks_when_default_initialized(self):
+        board = bitboard_factory()
+        self.assertEqual(0xFFFF, board.get_occupancy(PieceColor.WHITE))
+        self.assertEqual(0xFFFF << 48, board.get_occupancy(PieceColor.BLACK))
+        self.assertEqual(1 << 4, board.get_bitboard(PieceColor.WHITE, PieceName.KING))
+
+    def test_should_update_bitboards_when_move_take_piece(self):
+        board = bitboard_factory(situation={'b7': 'bp', 'c5': 'wp'})
+        board.move(Move(position_factory('b7'), position_factory('c5'), piece_factory('bp')))
+        self.assertIsNone(board.get_piece(position_factory('b7')))
+        self.assertEqual(0, board.get_occupancy(PieceColor.WHITE))
+        self.assertEqual(1 << 34, board.get_bitboard(PieceColor.BLACK, PieceName.PAWN))
+        self.assertEqual([piece_factory('wp')], board.get_pieces_taken(PieceColor.WHITE))
+
+    def test_should_return_pieces_position_like_board(self):
+        board = bitboard_factory(situation={'b7': 'bp', 'c5': 'wp', 'e1': 'wk'})
+        self.assertEqual(to_piece_positions({'b7': 'bp'}), board.get_pieces_position(PieceColor.BLACK))
+        self.assertEqual(to_piece_positions({'b7': 'bp', 'c5': 'wp', 'e1': 'wk'}), board.piece_positions)
+        self.assertEqual([position_factory('e1')], board.get_piece_position_by_name(PieceName.KING, PieceColor.WHITE))
+
+    def test_should_iterate_pieces_and_derive_state_like_board(self):
+        fen = 'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1'
+        board = fen_board_factory(fen)
+        bitboard = fen_board_factory(fen, board_type=BitBoard)
+        self.assertEqual(dict(board.iterate_pieces()), dict(bitboard.iterate_pieces()))
+        self.assertEqual(board.compute_hash(), bitboard.compute_hash())
+        self.assertEqual(board.compute_evaluation(), bitboard.compute_evaluation())
+        self.assertEqual(polyglot_key(board), polyglot_key(bitboard))
+        self.assertEqual(fen, bitboard.to_fen())
+
+    def test_should_not_share_bitboards_when_copied(self):
+        board = bitboard_factory(situation={'b7': 'bp'})
+        cloned_board = board.copy()
+        cloned_board.move(Move(position_factory('b7'), position_factory('b6'), piece_factory('bp')))
+        self.assertIsInstance(cloned_board, BitBoard)
+        self.assertEqual('PAWN BLACK', str(board.get_piece(position_factory('b7'))))
+        self.assertIsNone(cloned_board.get_piece(position_factory('b7')))
+
+    def test_should_move_king_and_rook_when_castling_with_game_manager(self):
+        board = bitboard_factory(situation={'e1': 'wk', 'a1': 'wr', 'h1': 'wr'})
+        manager = GameManager(board=board)
+        manager.select_position(position_factory('e1'))
+        manager.move(position_factory('g1'))
+        self.assertDictEqual({
+            position_factory('g1'): Piece(PieceColor.WHITE, PieceName.KING),
+            position_factory('f1'): Piece(PieceColor.WHITE, PieceName.ROOK),
+            position_factory('a1'): Piece(PieceColor.WHITE, PieceName.ROOK),
+        }, board.get_pieces_position(PieceColor.WHITE))
+
+
+if __name__ == '__main__':
+    unittest.main()
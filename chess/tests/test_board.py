@@ -1,7 +1,8 @@
 import unittest
 
-from chess.board import Board, to_piece_positions, board_factory
-from chess.data import PieceColor, position_factory, piece_factory, Move
+from chess.board import Board, to_piece_positions, board_factory, fen_board_factory, START_FEN
+from chess.data import PieceColor, PieceName, position_factory, piece_factory, Move
+from chess.game_manager import GameManager
 
 
 class TestBoard(unittest.TestCase):
@@ -50,6 +51,159 @@ class TestBoard(unittest.TestCase):
         self.assertEqual(to_piece_positions({'b7': 'bp'}), board.get_pieces_position(PieceColor.BLACK))
         self.assertEqual(to_piece_positions({'c5': 'wp'}), board.get_pieces_position(PieceColor.WHITE))
 
+    def test_should_restore_board_when_capture_unmade(self):
+        board = board_factory(situation={'b7': 'bp', 'c5': 'wp'})
+        initial_positions = board.piece_positions.copy()
+        undo = board.make_move(Move(position_factory('b7'), position_factory('c5'), piece_factory('bp'),
+                                    piece_taken_position=position_factory('c5'), piece_taken=piece_factory('wp')))
+        self.assertEqual([piece_factory('wp')], board.get_pieces_taken(PieceColor.WHITE))
+        board.unmake_move(undo)
+        self.assertEqual(initial_positions, board.piece_positions)
+        self.assertEqual([], board.pieces_taken)
+
+    def test_should_restore_board_when_en_passant_unmade(self):
+        board = board_factory(situation={'b5': 'bp', 'c5': 'wp'})
+        initial_positions = board.piece_positions.copy()
+        undo = board.make_move(Move(position_factory('c5'), position_factory('b6'), piece_factory('wp'),
+                                    piece_taken_position=position_factory('b5'), piece_taken=piece_factory('bp')))
+        self.assertEqual(to_piece_positions({'b6': 'wp'}), board.piece_positions)
+        board.unmake_move(undo)
+        self.assertEqual(initial_positions, board.piece_positions)
+
+    def test_should_restore_rook_when_castling_unmade(self):
+        board = board_factory(situation={'e8': 'bk', 'a8': 'br'})
+        undo = board.make_move(Move(position_factory('e8'), position_factory('c8'), piece_factory('bk'), is_left_castling=True))
+        self.assertEqual(to_piece_positions({'c8': 'bk', 'd8': 'br'}), board.piece_positions)
+        board.unmake_move(undo)
+        self.assertEqual(to_piece_positions({'e8': 'bk', 'a8': 'br'}), board.piece_positions)
+
+    def test_should_restore_pawn_when_promotion_unmade(self):
+        board = board_factory(situation={'b7': 'wp', 'a8': 'br'})
+        undo = board.make_move(Move(position_factory('b7'), position_factory('a8'), piece_factory('wp'),
+                                    piece_taken=piece_factory('br'), promotion=PieceName.QUEEN))
+        self.assertEqual(to_piece_positions({'a8': 'wq'}), board.piece_positions)
+        board.unmake_move(undo)
+        self.assertEqual(to_piece_positions({'b7': 'wp', 'a8': 'br'}), board.piece_positions)
+
+    def test_should_not_move_anything_when_castling_rook_is_missing(self):
+        board = board_factory(situation={'e1': 'wk'})
+        with self.assertRaises(ValueError):
+            board.make_move(Move(position_factory('e1'), position_factory('g1'), piece_factory('wk'), is_right_castling=True))
+        self.assertEqual(to_piece_positions({'e1': 'wk'}), board.piece_positions)
+
+    def test_should_return_same_hash_when_pieces_come_back(self):
+        board = board_factory()
+        initial_hash = board.hash
+        for source, target, piece in [('g1', 'f3', 'wn'), ('g8', 'f6', 'bn'), ('f3', 'g1', 'wn'), ('f6', 'g8', 'bn')]:
+            board.move(Move(position_factory(source), position_factory(target), piece_factory(piece)))
+        self.assertEqual(initial_hash, board.hash)
+
+    def test_should_change_hash_when_side_to_move_changes(self):
+        board = board_factory()
+        initial_hash = board.hash
+        board.set_color_to_move(PieceColor.BLACK)
+        self.assertNotEqual(initial_hash, board.hash)
+        self.assertEqual(board.compute_hash(), board.hash)
+
+    def test_should_change_hash_when_castling_right_lost(self):
+        board = board_factory(situation={'e1': 'wk', 'a1': 'wr', 'e8': 'bk'})
+        initial_hash = board.hash
+        for source, target, piece in [('a1', 'a2', 'wr'), ('e8', 'e7', 'bk'), ('a2', 'a1', 'wr'), ('e7', 'e8', 'bk')]:
+            board.move(Move(position_factory(source), position_factory(target), piece_factory(piece)))
+        self.assertEqual(0, board.castling_rights)
+        self.assertNotEqual(initial_hash, board.hash)
+        self.assertEqual(board.compute_hash(), board.hash)
+
+    def test_should_keep_hash_up_to_date_when_moves_made_and_unmade(self):
+        board = board_factory()
+        manager = GameManager(board=board)
+        initial_hash = board.hash
+        for move in manager.generate_legal_moves(board, PieceColor.WHITE):
+            undo = board.make_move(move)
+            manager.move_history.append(move)
+            for answer in manager.generate_legal_moves(board, PieceColor.BLACK):
+                answer_undo = board.make_move(answer)
+                self.assertEqual(board.compute_hash(), board.hash)
+                board.unmake_move(answer_undo)
+            manager.move_history.pop()
+            board.unmake_move(undo)
+        self.assertEqual(initial_hash, board.hash)
+
+    def test_should_set_en_passant_position_when_two_step_pawn_move(self):
+        board = board_factory(situation={'e2': 'wp'})
+        board.move(Move(position_factory('e2'), position_factory('e4'), piece_factory('wp'), is_two_step_pawn_move=True))
+        self.assertEqual(position_factory('e3'), board.en_passant_position)
+        self.assertEqual(board.compute_hash(), board.hash)
+
+    def test_should_return_same_hash_when_moves_transposed(self):
+        boards = []
+        for moves in [[('e2', 'e4', 'wp'), ('e7', 'e5', 'bp'), ('g1', 'f3', 'wn')], [('g1', 'f3', 'wn'), ('e7', 'e5', 'bp'), ('e2', 'e4', 'wp')]]:
+            board = board_factory()
+            for source, target, piece in moves:
+                is_two_step_pawn_move = piece.endswith('p')
+                board.move(Move(position_factory(source), position_factory(target), piece_factory(piece), is_two_step_pawn_move=is_two_step_pawn_move))
+            boards.append(board)
+        self.assertEqual(boards[0].hash, boards[1].hash)
+        self.assertEqual(boards[1].compute_hash(), boards[1].hash)
+
+    def test_should_hash_en_passant_position_only_when_it_can_be_captured(self):
+        self.assertEqual(fen_board_factory('4k3/8/8/8/4P3/8/8/4K3 b - - 0 1').hash, fen_board_factory('4k3/8/8/8/4P3/8/8/4K3 b - e3 0 1').hash)
+        self.assertNotEqual(fen_board_factory('4k3/8/8/8/3pP3/8/8/4K3 b - - 0 1').hash, fen_board_factory('4k3/8/8/8/3pP3/8/8/4K3 b - e3 0 1').hash)
+
+    def test_should_build_initial_board_from_start_fen(self):
+        board = fen_board_factory(START_FEN)
+        self.assertEqual(board_factory().piece_positions, board.piece_positions)
+        self.assertEqual(board_factory().hash, board.hash)
+
+    def test_should_export_same_fen_when_imported(self):
+        for fen in [
+            START_FEN,
+            'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+            'rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w KQkq c6 0 2',
+            '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 b - - 12 40',
+        ]:
+            self.assertEqual(fen, fen_board_factory(fen).to_fen())
+
+    def test_should_read_state_from_fen(self):
+        board = fen_board_factory('rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR b Kq c6 3 7')
+        self.assertEqual(PieceColor.BLACK, board.color_to_move)
+        self.assertEqual(6, board.castling_rights)
+        self.assertEqual(position_factory('c6'), board.en_passant_position)
+        self.assertEqual(3, board.halfmove_clock)
+        self.assertEqual(7, board.fullmove_number)
+
+    def test_should_raise_value_error_when_fen_invalid(self):
+        for fen in [
+            '',
+            'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w KQkq - 0 1',
+            'rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1',
+            'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNX w KQkq - 0 1',
+            'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x KQkq - 0 1',
+            'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQxq - 0 1',
+            '4k3/8/8/8/8/8/8/4K3 w - z9 0 1',
+            '4k3/8/8/8/8/8/8/4K3 w - e 0 1',
+            '4k3/8/8/8/8/8/8/4K3 w - e9 0 1',
+            '4k3/8/8/8/8/8/8/4K3 w - e4 0 1',
+            '4k3/8/8/8/8/8/8/4K3 w - - x 1',
+            '4k3/8/8/8/8/8/8/4K3 w - - 0 -1',
+        ]:
+            with self.assertRaises(ValueError):
+                fen_board_factory(fen)
+
+    def test_should_update_clocks_when_moves_made_and_unmade(self):
+        board = fen_board_factory('4k3/8/8/8/8/8/4P3/4K1N1 w - - 5 9')
+        knight_undo = board.make_move(Move(position_factory('g1'), position_factory('f3'), piece_factory('wn')))
+        self.assertEqual(6, board.halfmove_clock)
+        self.assertEqual(9, board.fullmove_number)
+        king_undo = board.make_move(Move(position_factory('e8'), position_factory('d8'), piece_factory('bk')))
+        self.assertEqual(7, board.halfmove_clock)
+        self.assertEqual(10, board.fullmove_number)
+        pawn_undo = board.make_move(Move(position_factory('e2'), position_factory('e3'), piece_factory('wp')))
+        self.assertEqual(0, board.halfmove_clock)
+        for undo in (pawn_undo, king_undo, knight_undo):
+            board.unmake_move(undo)
+        self.assertEqual('4k3/8/8/8/8/8/4P3/4K1N1 w - - 5 9', board.to_fen())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,27 @@
+import pickle
 import unittest
 
-from chess.data import position_factory
+from chess.data import PieceColor, PieceName, Piece, Position, piece_factory, piece_of, position_at, position_factory, position_from_square
 
 
 class TestPosition(unittest.TestCase):
 
     def test_serialization_deserialization(self):
         self.assertEqual('a1', str(position_factory('a1')))
+
+    def test_should_intern_board_positions(self):
+        self.assertIs(position_factory('e4'), position_at(col=4, row=3))
+        self.assertIs(position_factory('e4'), position_from_square(28))
+        self.assertIs(position_factory('e5'), position_factory('e4').offset(row=1))
+        self.assertEqual(Position(col=4, row=3), position_factory('e4'))
+        self.assertIs(position_factory('e4'), pickle.loads(pickle.dumps(position_factory('e4'))))
+
+    def test_should_return_none_for_offset_off_board(self):
+        self.assertIsNone(position_factory('h4').offset(col=1))
+        self.assertIsNone(position_factory('a1').offset(row=-1))
+
+    def test_should_intern_pieces(self):
+        self.assertIs(piece_factory('wk'), piece_of(PieceColor.WHITE, PieceName.KING))
+        self.assertIs(piece_factory('bq'), pickle.loads(pickle.dumps(piece_factory('bq'))))
+        self.assertEqual(Piece(PieceColor.WHITE, PieceName.KING), piece_factory('wk'))
+        self.assertFalse(hasattr(piece_factory('wk'), '__dict__'))
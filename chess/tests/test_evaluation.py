@@ -0,0 +1,54 @@
+import unittest
+
+from chess.bitboard import bitboard_factory
+from chess.board import board_factory
+from chess.data import PieceColor, PieceName, Piece, position_factory, piece_factory, Move
+from chess.evaluation import evaluate
+from chess.game_manager import GameManager
+
+
+class TestEvaluation(unittest.TestCase):
+
+    def test_should_evaluate_start_position_as_equal(self):
+        board = board_factory()
+        self.assertEqual(0, evaluate(board, PieceColor.WHITE))
+        self.assertEqual(0, evaluate(board, PieceColor.BLACK))
+
+    def test_should_count_material_and_piece_square_bonus(self):
+        board = board_factory(situation={'e1': 'wk', 'e8': 'bk', 'd4': 'wn'})
+        self.assertEqual(320 + 20, evaluate(board, PieceColor.WHITE))
+        self.assertEqual(-340, evaluate(board, PieceColor.BLACK))
+
+    def test_should_mirror_piece_square_tables_for_black(self):
+        board = board_factory(situation={'e2': 'wp', 'e7': 'bp'})
+        self.assertEqual(0, evaluate(board, PieceColor.WHITE))
+
+    def test_should_update_evaluation_when_capture_made_and_unmade(self):
+        board = board_factory(situation={'e1': 'wk', 'e8': 'bk', 'd4': 'wn', 'e6': 'bp'})
+        initial_evaluation = board.evaluation
+        undo = board.make_move(Move(position_factory('d4'), position_factory('e6'), piece_factory('wn'), piece_taken=piece_factory('bp')))
+        self.assertEqual(board.compute_evaluation(), board.evaluation)
+        board.unmake_move(undo)
+        self.assertEqual(initial_evaluation, board.evaluation)
+
+    def test_should_update_evaluation_when_promoted(self):
+        board = bitboard_factory(situation={'e1': 'wk', 'e8': 'bk', 'a7': 'wp'})
+        manager = GameManager(board=board)
+        manager.select_position(position_factory('a7'))
+        manager.move(position_factory('a8'))
+        manager.promote_to(PieceName.QUEEN)
+        self.assertEqual(Piece(PieceColor.WHITE, PieceName.QUEEN), board.get_piece(position_factory('a8')))
+        self.assertEqual(board.compute_evaluation(), board.evaluation)
+
+    def test_should_update_evaluation_when_castling(self):
+        board = board_factory()
+        manager = GameManager(board=board)
+        for source, target in [('g1', 'f3'), ('g8', 'f6'), ('e2', 'e3'), ('e7', 'e6'), ('f1', 'e2'), ('f8', 'e7'), ('e1', 'g1')]:
+            manager.select_position(position_factory(source))
+            manager.move(position_factory(target))
+        self.assertEqual(board.compute_evaluation(), board.evaluation)
+        self.assertGreater(evaluate(board, PieceColor.WHITE), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
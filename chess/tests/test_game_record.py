@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+from chess.game_record import GameRecordReader, GameRecordWriter, decode_move, decode_moves, encode_move, encode_moves
+from chess.game_manager import fen_game_manager_factory
+from chess.pgn import iterate_sans, parse_san
+
+PROMOTION_FEN = '4k3/1P6/8/8/8/8/8/4K3 w - - 0 1'
+
+
+def play_sans(sans: str, fen: str):
+    manager = fen_game_manager_factory(fen)
+    moves = []
+    for san in iterate_sans(sans):
+        move = parse_san(manager, san)
+        manager.play(move)
+        moves.append(move)
+    return moves
+
+
+class TestGameRecord(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'games.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_should_pack_move_in_sixteen_bits(self):
+        moves = play_sans('1. e4 d5 2. exd5 c5 3. dxc6 Nf6 4. Nf3 e6 5. Be2 Be7 6. O-O', 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1')
+        codes = encode_moves(moves)
+        self.assertEqual(2, codes.itemsize)
+        self.assertTrue(all(0 <= code < 1 << 16 for code in codes))
+        self.assertEqual(2, encode_move(moves[4]) >> 14)
+        self.assertEqual(3, encode_move(moves[-1]) >> 14)
+        self.assertEqual(moves, decode_moves(codes))
+
+    def test_should_decode_promotion_piece(self):
+        manager = fen_game_manager_factory(PROMOTION_FEN)
+        move = parse_san(manager, 'b8=R')
+        self.assertEqual(move, decode_move(manager, encode_move(move)))
+
+    def test_should_raise_value_error_when_code_is_not_legal(self):
+        manager = fen_game_manager_factory(PROMOTION_FEN)
+        with self.assertRaises(ValueError):
+            decode_move(manager, 0)
+
+    def test_should_read_games_by_index(self):
+        first_game = play_sans('1. d4 d5 2. c4 e6', 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1')
+        second_game = play_sans('1. b8=N Kf7', PROMOTION_FEN)
+        with GameRecordWriter(self.path) as writer:
+            writer.write_game(first_game)
+            writer.write_game(second_game, PROMOTION_FEN)
+            writer.write_game([])
+        with GameRecordReader(self.path) as reader:
+            self.assertEqual(3, len(reader))
+            self.assertEqual(second_game, reader[1])
+            self.assertEqual(PROMOTION_FEN, reader.read_fen(1))
+            self.assertEqual(first_game, reader[0])
+            self.assertEqual([], reader[2])
+            self.assertEqual(encode_moves(first_game), reader.read_codes(0))
+
+    def test_should_raise_value_error_when_file_is_not_game_record(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a game record file at all')
+        with self.assertRaises(ValueError):
+            GameRecordReader(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import random
+import tempfile
+import unittest
+
+from chess import magic_bitboards
+from chess.attack_tables import ROOK_DIRECTIONS, BISHOP_DIRECTIONS
+from chess.magic_bitboards import rook_attacks, bishop_attacks, queen_attacks, sliding_attacks, init_magic_tables, find_magic, relevant_occupancy_mask
+
+
+class TestMagicBitboards(unittest.TestCase):
+
+    def test_should_match_ray_walk_for_random_occupancies(self):
+        rng = random.Random(0)
+        for _ in range(2000):
+            square = rng.randrange(64)
+            occupancy = rng.getrandbits(64) & rng.getrandbits(64)
+            self.assertEqual(sliding_attacks(square, occupancy, ROOK_DIRECTIONS), rook_attacks(square, occupancy))
+            self.assertEqual(sliding_attacks(square, occupancy, BISHOP_DIRECTIONS), bishop_attacks(square, occupancy))
+            self.assertEqual(rook_attacks(square, occupancy) | bishop_attacks(square, occupancy), queen_attacks(square, occupancy))
+
+    def test_should_stop_rook_attacks_on_first_blocker(self):
+        self.assertEqual(0x0000_0000_0000_010E, rook_attacks(0, 1 << 3 | 1 << 8))
+
+    def test_should_exclude_board_edges_from_relevant_occupancy(self):
+        self.assertEqual(12, bin(relevant_occupancy_mask(0, ROOK_DIRECTIONS)).count('1'))
+        self.assertEqual(9, bin(relevant_occupancy_mask(27, BISHOP_DIRECTIONS)).count('1'))
+
+    def test_should_find_collision_free_magic(self):
+        magic = find_magic(27, BISHOP_DIRECTIONS, random.Random(1))
+        table = magic_bitboards.MagicTable([magic] * 64, BISHOP_DIRECTIONS)
+        self.assertEqual(sliding_attacks(27, 1 << 45, BISHOP_DIRECTIONS), table.get_attacks(27, 1 << 45))
+
+    def test_should_load_same_tables_from_disk_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = os.path.join(directory, 'magic.bin')
+            init_magic_tables(cache_path)
+            self.assertTrue(os.path.exists(cache_path))
+            built_attacks = magic_bitboards.rook_table.attacks + magic_bitboards.bishop_table.attacks
+            init_magic_tables(cache_path)
+            self.assertEqual(built_attacks, magic_bitboards.rook_table.attacks + magic_bitboards.bishop_table.attacks)
+            with open(cache_path, 'wb') as file:
+                file.write(b'corrupted')
+            init_magic_tables(cache_path)
+            self.assertEqual(built_attacks, magic_bitboards.rook_table.attacks + magic_bitboards.bishop_table.attacks)
+
+    def test_should_keep_built_tables_when_cache_cannot_be_written(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = os.path.join(directory, 'missing', 'magic.bin')
+            init_magic_tables(cache_path)
+            self.assertFalse(os.path.exists(cache_path))
+            self.assertEqual(0x0000_0000_0000_010E, rook_attacks(0, 1 << 3 | 1 << 8))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,7 @@ import unittest
 
 from chess.board import Board, board_factory
 from chess.data import PieceColor, Position, position_factory, Piece, PieceName
-from chess.game_manager import GameManager
+from chess.game_manager import GameManager, fen_game_manager_factory
 
 
 class TestManage(unittest.TestCase):
@@ -635,4 +635,106 @@ class TestManage(unittest.TestCase):
             position_factory('c8'): Piece(PieceColor.BLACK, PieceName.KING),
             position_factory('d8'): Piece(PieceColor.BLACK, PieceName.ROOK),
             position_factory('h8'): Piece(PieceColor.BLACK, PieceName.ROOK),
-        }, board.get_pieces_position(PieceColor.BLACK))
\ No newline at end of file
+        }, board.get_pieces_position(PieceColor.BLACK))
+
+    def test_59_should_generate_all_white_moves_without_selection_when_board_default_initialized(self):
+        board = board_factory()
+        manager = GameManager(board=board)
+        moves = manager.generate_legal_moves(board, PieceColor.WHITE)
+        self.assertEqual(20, len(moves))
+        self.assertIsNone(manager.get_selected_position())
+
+    def test_60_should_keep_pinned_piece_on_pin_line_when_generating_legal_moves(self):
+        board = board_factory(situation={'e1': 'wk', 'e4': 'wr', 'e8': 'br', 'a8': 'bk'})
+        manager = GameManager(board=board)
+        moves = manager.generate_legal_moves(board, PieceColor.WHITE)
+        self.assertCountEqual([
+            position_factory('e2'),
+            position_factory('e3'),
+            position_factory('e5'),
+            position_factory('e6'),
+            position_factory('e7'),
+            position_factory('e8'),
+        ], [move.target for move in moves if move.source == position_factory('e4')])
+
+    def test_61_should_only_move_king_when_double_check(self):
+        board = board_factory(situation={'e1': 'wk', 'a1': 'wr', 'e8': 'br', 'd3': 'bn', 'a8': 'bk'})
+        manager = GameManager(board=board)
+        moves = manager.generate_legal_moves(board, PieceColor.WHITE)
+        self.assertTrue(all(move.source == position_factory('e1') for move in moves))
+        self.assertCountEqual([
+            position_factory('d1'),
+            position_factory('d2'),
+            position_factory('f1'),
+        ], [move.target for move in moves])
+
+    def test_62_should_not_castle_through_threated_position(self):
+        board = board_factory(situation={'e1': 'wk', 'a1': 'wr', 'h1': 'wr', 'f8': 'br', 'a8': 'bk'})
+        manager = GameManager(board=board)
+        castling_moves = [move for move in manager.generate_legal_moves(board, PieceColor.WHITE) if move.is_left_castling or move.is_right_castling]
+        self.assertEqual([position_factory('c1')], [move.target for move in castling_moves])
+
+    def test_63_should_generate_every_promotion_when_pawn_reaches_last_row(self):
+        board = board_factory(situation={'b7': 'wp', 'a8': 'br', 'h1': 'wk', 'h8': 'bk'})
+        manager = GameManager(board=board)
+        pawn_moves = [move for move in manager.generate_legal_moves(board, PieceColor.WHITE) if move.source == position_factory('b7')]
+        self.assertCountEqual([PieceName.QUEEN, PieceName.ROOK, PieceName.BISHOP, PieceName.NIGHT] * 2, [move.promotion for move in pawn_moves])
+
+    def test_64_should_not_take_en_passant_when_it_exposes_king(self):
+        board = board_factory(situation={'a5': 'wk', 'b5': 'wp', 'c7': 'bp', 'h5': 'br', 'h8': 'bk'})
+        manager = GameManager(board=board, current_player=PieceColor.BLACK)
+        manager.select_position(position_factory('c7'))
+        manager.move(position_factory('c5'))
+        moves = manager.generate_legal_moves(board, PieceColor.WHITE)
+        self.assertNotIn(position_factory('c6'), [move.target for move in moves if move.source == position_factory('b5')])
+
+    def test_65_should_take_en_passant_when_fen_has_en_passant_position(self):
+        manager = fen_game_manager_factory('4k3/8/8/1Pp5/8/8/8/4K3 w - c6 0 2')
+        moves = manager.generate_legal_moves(manager.board, manager.get_current_player())
+        en_passant_moves = [move for move in moves if move.piece_taken_position == position_factory('c5')]
+        self.assertEqual([position_factory('c6')], [move.target for move in en_passant_moves])
+
+    def test_66_should_castle_only_on_side_allowed_by_fen(self):
+        manager = fen_game_manager_factory('r3k2r/8/8/8/8/8/8/R3K2R b Q - 0 1')
+        self.assertEqual(PieceColor.BLACK, manager.get_current_player())
+        black_moves = manager.generate_legal_moves(manager.board, PieceColor.BLACK)
+        self.assertFalse(any(move.is_left_castling or move.is_right_castling for move in black_moves))
+        white_moves = manager.generate_legal_moves(manager.board, PieceColor.WHITE)
+        self.assertEqual([position_factory('c1')], [move.target for move in white_moves if move.is_left_castling or move.is_right_castling])
+
+    def test_67_should_castling_not_available_when_fen_has_no_castling_right(self):
+        manager = fen_game_manager_factory('4k3/8/8/8/8/8/8/R3K2R w K - 0 1')
+        manager.select_position(position_factory('e1'))
+        self.assertCountEqual([
+            position_factory('d1'),
+            position_factory('d2'),
+            position_factory('e2'),
+            position_factory('f2'),
+            position_factory('f1'),
+            position_factory('g1'),
+        ], manager.get_authorized_target_position())
+
+    def test_68_should_return_en_passant_target_when_fen_has_en_passant_position(self):
+        manager = fen_game_manager_factory('4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 2')
+        manager.select_position(position_factory('e5'))
+        self.assertCountEqual([position_factory('e6'), position_factory('d6')], manager.get_authorized_target_position())
+        manager.move(position_factory('d6'))
+        self.assertIsNone(manager.board.get_piece(position_factory('d5')))
+
+    def test_69_should_not_offer_castling_when_king_is_in_check(self):
+        manager = fen_game_manager_factory('4k3/8/8/8/8/8/8/R3K2r w Q - 0 1')
+        manager.select_position(position_factory('e1'))
+        self.assertCountEqual([
+            position_factory('d2'),
+            position_factory('e2'),
+            position_factory('f2'),
+        ], manager.get_authorized_target_position())
+
+    def test_70_should_not_offer_castling_through_threated_position(self):
+        manager = fen_game_manager_factory('3rk3/8/8/8/8/8/8/R3K3 w Q - 0 1')
+        manager.select_position(position_factory('e1'))
+        self.assertCountEqual([
+            position_factory('e2'),
+            position_factory('f2'),
+            position_factory('f1'),
+        ], manager.get_authorized_target_position())
@@ -0,0 +1,65 @@
+import unittest
+
+from chess.board import fen_board_factory
+from chess.data import PieceColor
+from chess.game_manager import fen_game_manager_factory
+from chess.move_ordering import MoveOrdering, MovePicker, mvv_lva_score
+from chess.packed_move import PackedMove, MOVE_KEY_MASK
+from chess.search import SearchEngine, SearchLimits
+
+FEN = '4k3/8/2q5/1P1r4/4N3/8/8/4K2R w K - 0 1'
+
+
+def legal_codes(fen: str):
+    manager = fen_game_manager_factory(fen)
+    return manager.generate_legal_move_codes(manager.board, manager.current_player)
+
+
+def code_by_uci(codes, uci: str) -> int:
+    return next(code for code in codes if PackedMove(code).to_uci() == uci)
+
+
+class TestMoveOrdering(unittest.TestCase):
+
+    def test_should_rank_most_valuable_victim_then_least_valuable_attacker(self):
+        codes = legal_codes(FEN)
+        self.assertGreater(mvv_lva_score(code_by_uci(codes, 'b5c6')), mvv_lva_score(code_by_uci(codes, 'e4c5')))
+        self.assertGreater(mvv_lva_score(code_by_uci(codes, 'b5c6')), mvv_lva_score(code_by_uci(codes, 'e4d6')))
+        self.assertGreater(mvv_lva_score(code_by_uci(codes, 'b5c6')), 0)
+        self.assertEqual(0, mvv_lva_score(code_by_uci(codes, 'e1f2')))
+
+    def test_should_pick_hash_move_then_captures_then_killers_then_history(self):
+        codes = legal_codes(FEN)
+        move_ordering = MoveOrdering(4)
+        move_ordering.store_cutoff(code_by_uci(codes, 'h1h7'), PieceColor.WHITE, 2, 1)
+        move_ordering.store_cutoff(code_by_uci(codes, 'e1f2'), PieceColor.WHITE, 3, 2)
+        hash_move = code_by_uci(codes, 'e4f6')
+        ordered = [PackedMove(code).to_uci() for code in MovePicker(codes, move_ordering, 1, PieceColor.WHITE, hash_move & MOVE_KEY_MASK)]
+        self.assertEqual(['e4f6', 'b5c6'], ordered[:2])
+        self.assertEqual('h1h7', ordered[2])
+        self.assertEqual('e1f2', ordered[3])
+        self.assertCountEqual([PackedMove(code).to_uci() for code in codes], ordered)
+
+    def test_should_pick_losing_captures_last_when_board_given(self):
+        fen = '4k3/8/2p1p3/3p4/8/8/8/3QK3 w - - 0 1'
+        codes = legal_codes(fen)
+        move_ordering = MoveOrdering(4)
+        self.assertEqual('d1d5', PackedMove(next(iter(MovePicker(codes, move_ordering, 0, PieceColor.WHITE)))).to_uci())
+        ordered = [PackedMove(code).to_uci() for code in MovePicker(codes, move_ordering, 0, PieceColor.WHITE, board=fen_board_factory(fen))]
+        self.assertEqual('d1d5', ordered[-1])
+        self.assertCountEqual([PackedMove(code).to_uci() for code in codes], ordered)
+
+    def test_should_not_store_captures_as_killers(self):
+        codes = legal_codes(FEN)
+        move_ordering = MoveOrdering(4)
+        move_ordering.store_cutoff(code_by_uci(codes, 'b5c6'), PieceColor.WHITE, 3, 0)
+        self.assertEqual([0, 0], list(move_ordering.killers[0]))
+        self.assertEqual(0, sum(move_ordering.history))
+
+    def test_should_search_fewer_nodes_than_unordered_search(self):
+        board = fen_board_factory('r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3')
+        self.assertLess(SearchEngine(board, PieceColor.BLACK).search(SearchLimits(depth=3)).nodes, 5000)
+
+
+if __name__ == '__main__':
+    unittest.main()
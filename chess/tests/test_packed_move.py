@@ -0,0 +1,63 @@
+import unittest
+from dataclasses import fields
+
+from chess.data import Move, PieceName, position_factory, piece_factory
+from chess.perft import REFERENCE_POSITIONS, reference_position_manager
+from chess.packed_move import MOVE_CACHE_SIZE, PackedMove, pack_move, pack_moves, unpack_move, unpack_moves
+
+
+class TestPackedMove(unittest.TestCase):
+
+    def test_should_round_trip_every_reference_position_move(self):
+        for reference_position in REFERENCE_POSITIONS:
+            manager = reference_position_manager(reference_position)
+            for move in manager.generate_legal_moves(manager.board, manager.current_player):
+                packed_move = pack_move(move)
+                self.assertEqual(move, unpack_move(packed_move))
+                for move_field in fields(Move):
+                    self.assertEqual(getattr(move, move_field.name), getattr(packed_move, move_field.name))
+                self.assertEqual(move.to_uci(), packed_move.to_uci())
+
+    def test_should_pack_en_passant_and_promotion(self):
+        en_passant = Move(position_factory('e5'), position_factory('d6'), piece_factory('wp'),
+                          piece_taken_position=position_factory('d5'), piece_taken=piece_factory('bp'))
+        promotion = Move(position_factory('b7'), position_factory('a8'), piece_factory('wp'),
+                         piece_taken_position=position_factory('a8'), piece_taken=piece_factory('br'), promotion=PieceName.QUEEN)
+        self.assertEqual(position_factory('d5'), pack_move(en_passant).piece_taken_position)
+        self.assertEqual(en_passant, unpack_move(pack_move(en_passant)))
+        self.assertEqual(PieceName.QUEEN, pack_move(promotion).promotion)
+        self.assertTrue(pack_move(promotion).is_capture)
+        self.assertEqual(promotion, pack_move(promotion).to_move())
+
+    def test_should_intern_unpacked_moves_and_store_lists_as_arrays(self):
+        manager = reference_position_manager(REFERENCE_POSITIONS[0])
+        moves = manager.generate_legal_moves(manager.board, manager.current_player)
+        codes = pack_moves(moves)
+        self.assertEqual(4, codes.itemsize)
+        self.assertEqual(moves, unpack_moves(codes))
+        self.assertIs(moves[0], unpack_move(codes[0]))
+        self.assertEqual(MOVE_CACHE_SIZE, unpack_move.cache_info().maxsize)
+        self.assertIsInstance(pack_move(moves[0]), PackedMove)
+        self.assertFalse(hasattr(pack_move(moves[0]), '__dict__'))
+
+    def test_should_generate_legal_moves_from_move_codes(self):
+        manager = reference_position_manager(REFERENCE_POSITIONS[1])
+        codes = manager.generate_legal_move_codes(manager.board, manager.current_player)
+        self.assertEqual('I', codes.typecode)
+        self.assertEqual(unpack_moves(codes), manager.generate_legal_moves(manager.board, manager.current_player))
+
+    def test_should_make_and_unmake_packed_moves_on_board(self):
+        manager = reference_position_manager(REFERENCE_POSITIONS[1])
+        fen = manager.to_fen()
+        for code in manager.generate_legal_move_codes(manager.board, manager.current_player):
+            undo = manager.board.make_move(unpack_move(code))
+            expected_fen = manager.board.to_fen()
+            manager.board.unmake_move(undo)
+            undo = manager.board.make_move(PackedMove(code))
+            self.assertEqual(expected_fen, manager.board.to_fen())
+            manager.board.unmake_move(undo)
+            self.assertEqual(fen, manager.to_fen())
+
+
+if __name__ == '__main__':
+    unittest.main()
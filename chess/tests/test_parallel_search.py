@@ -0,0 +1,29 @@
+import unittest
+
+from chess.board import board_factory
+from chess.data import PieceColor
+from chess.parallel_search import ParallelSearchEngine, parallel_search
+from chess.search import SearchLimits, MATE_SCORE
+
+
+class TestParallelSearch(unittest.TestCase):
+
+    def test_should_find_back_rank_mate_with_several_workers(self):
+        board = board_factory(situation={'a1': 'wr', 'g1': 'wk', 'g8': 'bk', 'f7': 'bp', 'g7': 'bp', 'h7': 'bp'})
+        result = parallel_search(board, PieceColor.WHITE, SearchLimits(depth=3), threads=2, hash_size_mb=1)
+        self.assertEqual('a1a8', result.best_move.to_uci())
+        self.assertEqual(MATE_SCORE - 1, result.score)
+
+    def test_should_share_transposition_table_with_workers(self):
+        board = board_factory()
+        with ParallelSearchEngine(board, PieceColor.WHITE, threads=2, hash_size_mb=1) as engine:
+            result = engine.search(SearchLimits(depth=2))
+            entry = engine.transposition_table.probe(board.hash)
+        self.assertIsNotNone(entry)
+        self.assertEqual(2, entry.depth)
+        self.assertEqual(2, result.depth)
+        self.assertGreater(result.nodes, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from chess.bitboard import BitBoard
+from chess.board import Board
+from chess.perft import REFERENCE_POSITIONS, reference_position_manager, perft, divide
+
+REFERENCE_POSITION_BY_NAME = {position.name: position for position in REFERENCE_POSITIONS}
+
+
+class TestPerft(unittest.TestCase):
+
+    def assert_perft(self, name: str, depth: int, board_type=Board):
+        reference_position = REFERENCE_POSITION_BY_NAME[name]
+        manager = reference_position_manager(reference_position, board_type=board_type)
+        self.assertEqual(reference_position.node_counts[depth - 1], perft(manager, depth))
+
+    def test_should_count_start_position_nodes(self):
+        self.assert_perft('start', 3)
+
+    def test_should_count_kiwipete_nodes(self):
+        self.assert_perft('kiwipete', 2)
+
+    def test_should_count_en_passant_position_nodes(self):
+        self.assert_perft('en_passant', 3)
+
+    def test_should_count_castling_position_nodes(self):
+        self.assert_perft('castling', 2)
+
+    def test_should_count_promotion_position_nodes(self):
+        self.assert_perft('promotion', 2)
+
+    def test_should_count_same_nodes_with_bitboard(self):
+        self.assert_perft('kiwipete', 2, BitBoard)
+
+    def test_should_divide_nodes_by_root_move(self):
+        manager = reference_position_manager(REFERENCE_POSITION_BY_NAME['start'])
+        result = divide(manager, 2)
+        self.assertEqual(20, len(result))
+        self.assertEqual(20, result['e2e4'])
+        self.assertEqual(400, sum(result.values()))
+
+    def test_should_leave_position_unchanged_after_perft(self):
+        manager = reference_position_manager(REFERENCE_POSITION_BY_NAME['kiwipete'])
+        initial_positions = manager.board.piece_positions.copy()
+        perft(manager, 2)
+        self.assertEqual(initial_positions, manager.board.piece_positions)
+        self.assertEqual([], manager.move_history)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+
+from chess.board import fen_board_factory
+from chess.data import PieceName, position_factory
+from chess.game_manager import fen_game_manager_factory
+from chess.pgn import PgnError, iterate_game_texts, iterate_sans, parse_san, read_game, read_games, read_legal_games
+
+PGN = '''[Event "Opera Game"]
+[Site "Paris"]
+[White "Paul Morphy"]
+[Black "Duke Karl / Count Isouard"]
+[Result "1-0"]
+
+1. e4 e5 2. Nf3 d6 3. d4 Bg4 {This is a weak move already.} 4. dxe5 Bxf3 5. Qxf3 dxe5
+6. Bc4 Nf6 7. Qb3 Qe7 8. Nc3 c6 9. Bg5 b5 10. Nxb5 cxb5 11. Bxb5+ Nbd7 12. O-O-O Rd8
+13. Rxd7 Rxd7 14. Rd1 Qe6 15. Bxd7+ Nxd7 16. Qb8+ Nxb8 17. Rd8# 1-0
+
+[Event "Promotion"]
+[FEN "8/P7/8/8/8/8/8/k6K w - - 0 1"]
+[Result "*"]
+
+1. a8=Q+ (1. a8=N) Kb2 $1 2. Qb7+ *
+'''
+
+
+class TestPgn(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'games.pgn')
+        with open(self.path, 'w') as file:
+            file.write(PGN)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_should_stream_every_game_with_headers_and_moves(self):
+        games = list(read_games(self.path))
+        self.assertEqual(2, len(games))
+        headers, moves = games[0]
+        self.assertEqual('Paul Morphy', headers['White'])
+        self.assertEqual(33, len(moves))
+        self.assertEqual('d1d8', moves[-1].to_uci())
+        self.assertEqual('e1c1', moves[22].to_uci())
+
+    def test_should_start_from_fen_header_and_skip_variations(self):
+        headers, moves = list(read_games(self.path))[1]
+        self.assertEqual('Promotion', headers['Event'])
+        self.assertEqual(['a7a8q', 'a1b2', 'a8b7'], [move.to_uci() for move in moves])
+
+    def test_should_report_illegal_games_to_callback_and_keep_legal_ones(self):
+        with open(self.path, 'a') as file:
+            file.write('\n[Event "Illegal"]\n\n1. e5 *\n')
+        illegal_games = []
+        games = list(read_legal_games(self.path, on_illegal_game=lambda offset, error: illegal_games.append((offset, error))))
+        self.assertEqual(['Opera Game', 'Promotion'], [headers['Event'] for headers, _ in games])
+        self.assertEqual(1, len(illegal_games))
+        self.assertIsInstance(illegal_games[0][1], PgnError)
+
+    def test_should_yield_game_offsets_and_read_from_offset(self):
+        offsets = [offset for offset, _ in iterate_game_texts(self.path)]
+        self.assertEqual([0, PGN.index('[Event "Promotion"]')], offsets)
+        games = list(read_games(self.path, start=offsets[1]))
+        self.assertEqual(['Promotion'], [headers['Event'] for headers, _ in games])
+        games = list(read_games(self.path, end=offsets[1]))
+        self.assertEqual(['Opera Game'], [headers['Event'] for headers, _ in games])
+
+    def test_should_ignore_comments_nags_and_move_numbers(self):
+        self.assertEqual(['e4', 'e5', 'Nf3'], list(iterate_sans('1. e4 {best by test} e5 $2 2.Nf3 ; comment\n 1-0')))
+
+    def test_should_disambiguate_san_by_source_column(self):
+        manager = fen_game_manager_factory('4k3/8/8/8/8/8/4K3/R6R w - - 0 1')
+        move = parse_san(manager, 'Rhf1')
+        self.assertEqual(position_factory('h1'), move.source)
+        with self.assertRaises(PgnError):
+            parse_san(manager, 'Rd1')
+
+    def test_should_raise_pgn_error_when_move_illegal(self):
+        with self.assertRaises(PgnError):
+            read_game('[Event "Illegal"]\n\n1. e5 *\n')
+
+    def test_should_parse_promotion_piece(self):
+        manager = fen_game_manager_factory('8/P7/8/8/8/8/8/k6K w - - 0 1')
+        self.assertEqual(PieceName.NIGHT, parse_san(manager, 'a8=N').promotion)
+        self.assertEqual(fen_board_factory('8/P7/8/8/8/8/8/k6K w - - 0 1').to_fen(), manager.to_fen())
+
+
+if __name__ == '__main__':
+    unittest.main()
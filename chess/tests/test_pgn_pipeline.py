@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+from chess.pgn_pipeline import find_game_starts, read_game_offsets, replay_pgn, replay_shard, split_shards
+
+GAMES = [
+    '[Event "Scholar"]\n[Result "1-0"]\n\n1. e4 e5 2. Bc4 Nc6 3. Qh5 Nf6 4. Qxf7# 1-0\n\n',
+    '[Event "Fool"]\n[Result "0-1"]\n\n1. f3 e5 2. g4 Qh4# 0-1\n\n',
+    '[Event "Illegal"]\n[Result "*"]\n\n1. e4 e5 2. Ke3 *\n\n',
+    '[Event "Draw"]\n[Result "1/2-1/2"]\n\n1. Nf3 Nf6 2. Ng1 Ng8 1/2-1/2\n\n',
+]
+
+
+class TestPgnPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'games.pgn')
+        with open(self.path, 'w') as file:
+            file.write(''.join(GAMES * 3))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_should_split_offsets_into_contiguous_shards(self):
+        self.assertEqual([(0, 30), (30, 60), (60, None)], split_shards([0, 10, 20, 30, 40, 50, 60], 3))
+        self.assertEqual([(0, None)], split_shards([0], 4))
+        self.assertEqual([], split_shards([], 4))
+
+    def test_should_replay_only_games_of_shard(self):
+        offsets = read_game_offsets(self.path)
+        self.assertEqual(12, len(offsets))
+        statistics = replay_shard(self.path, offsets[0], offsets[2])
+        self.assertEqual(2, statistics.games)
+        self.assertEqual({'1-0': 1, '0-1': 1}, statistics.results)
+
+    def test_should_find_game_starts_without_reading_games(self):
+        offsets = read_game_offsets(self.path)
+        starts = find_game_starts(self.path, 5)
+        self.assertEqual(5, len(starts))
+        self.assertEqual(0, starts[0])
+        self.assertEqual(sorted(starts), starts)
+        self.assertLessEqual(set(starts), set(offsets))
+        self.assertEqual([0], find_game_starts(self.path, 1))
+
+    def test_should_aggregate_statistics_of_every_game(self):
+        statistics = replay_pgn(self.path, processes=1)
+        self.assertEqual(12, statistics.games)
+        self.assertEqual(3, statistics.illegal_games)
+        self.assertEqual({'1-0': 3, '0-1': 3, '1/2-1/2': 3, 'illegal': 3}, statistics.results)
+        self.assertEqual(3 * (7 + 4 + 4), statistics.moves)
+        self.assertEqual(3, len(statistics.errors))
+
+    def test_should_count_game_with_invalid_fen_as_illegal(self):
+        with open(self.path, 'w') as file:
+            file.write('[FEN "8/8 w - - 0 1"]\n[Result "*"]\n\n1. e4 *\n\n' + GAMES[0])
+        statistics = replay_pgn(self.path, processes=1)
+        self.assertEqual(2, statistics.games)
+        self.assertEqual(1, statistics.illegal_games)
+        self.assertEqual({'1-0': 1, 'illegal': 1}, statistics.results)
+
+    def test_should_get_same_statistics_across_processes(self):
+        sequential = replay_pgn(self.path, processes=1)
+        parallel = replay_pgn(self.path, processes=2)
+        self.assertEqual(sequential.games, parallel.games)
+        self.assertEqual(sequential.results, parallel.results)
+        self.assertEqual(sequential.errors, parallel.errors)
+        self.assertGreater(parallel.games_per_second(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import random
+import tempfile
+import unittest
+
+from chess.board import START_FEN, fen_board_factory
+from chess.game_manager import fen_game_manager_factory
+from chess.pgn import parse_san, read_game
+from chess.polyglot import PolyglotBook, build_polyglot_book, decode_polyglot_move, encode_polyglot_move, polyglot_key
+from chess.search import SearchEngine, SearchLimits
+
+GAMES = [
+    '[Result "1-0"]\n\n1. e4 e5 2. Nf3 1-0\n',
+    '[Result "1-0"]\n\n1. e4 c5 1-0\n',
+    '[Result "1/2-1/2"]\n\n1. d4 d5 1/2-1/2\n',
+    '[Result "0-1"]\n\n1. c4 e5 0-1\n',
+]
+
+
+class TestPolyglot(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'book.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_should_compute_reference_polyglot_keys(self):
+        self.assertEqual(0x463B96181691FC9C, polyglot_key(fen_board_factory(START_FEN)))
+        self.assertEqual(0x823C9B50FD114196, polyglot_key(fen_board_factory('rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1')))
+        self.assertEqual(0x22A48B5A8E47FF78, polyglot_key(fen_board_factory('rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3')))
+        self.assertEqual(0x00FDD303C946BDD9, polyglot_key(fen_board_factory('rnbq1bnr/ppp1pkpp/8/3pPp2/8/8/PPPPKPPP/RNBQ1BNR w - - 0 4')))
+        self.assertEqual(0x5C3F9B829B279560, polyglot_key(fen_board_factory('rnbqkbnr/p1pppppp/8/8/P6P/R1p5/1P1PPPP1/1NBQKBNR b Kkq - 0 4')))
+
+    def test_should_encode_castling_as_king_takes_rook(self):
+        manager = fen_game_manager_factory('4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1')
+        move = parse_san(manager, 'O-O')
+        self.assertEqual(7 | 4 << 6, encode_polyglot_move(move))
+        self.assertEqual(move, decode_polyglot_move(manager, encode_polyglot_move(move)))
+
+    def test_should_return_weighted_book_moves_built_from_games(self):
+        self.assertGreater(build_polyglot_book([read_game(text) for text in GAMES], self.path), 0)
+        with PolyglotBook(self.path) as book:
+            manager = fen_game_manager_factory(START_FEN)
+            book_moves = book.get_moves(manager)
+            self.assertEqual(['e2e4', 'd2d4'], [book_move.move.to_uci() for book_move in book_moves])
+            self.assertEqual([4, 1], [book_move.weight for book_move in book_moves])
+            self.assertEqual('e2e4', book.best_move(manager).to_uci())
+            self.assertIn(book.choose_move(manager, random.Random(0)).to_uci(), ['e2e4', 'd2d4'])
+            self.assertIsNone(book.best_move(fen_game_manager_factory('4k3/8/8/8/8/8/8/4K3 w - - 0 1')))
+
+    def test_should_skip_search_when_position_is_in_book(self):
+        build_polyglot_book([read_game(text) for text in GAMES], self.path)
+        with PolyglotBook(self.path) as book:
+            board = fen_board_factory(START_FEN)
+            result = SearchEngine(board, board.color_to_move, book=book).search(SearchLimits(depth=3))
+        self.assertEqual('e2e4', result.best_move.to_uci())
+        self.assertEqual(0, result.nodes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+
+from chess.board import START_FEN, fen_board_factory
+from chess.game_record import encode_move
+from chess.pgn import read_game
+from chess.position_index import NO_MOVE, PositionIndex, build_position_index
+
+GAMES = [
+    '[Result "1-0"]\n\n1. e4 e5 2. Nf3 Nc6 1-0\n',
+    '[Result "0-1"]\n\n1. Nf3 e5 2. e4 Nc6 0-1\n',
+    '[Result "1/2-1/2"]\n\n1. d4 d5 1/2-1/2\n',
+]
+AFTER_E4_E5_NF3_NC6 = 'r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3'
+AFTER_NF3_E5_E4 = 'rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq e3 0 2'
+AFTER_E4 = 'rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1'
+
+
+class TestPositionIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'positions.bin')
+        self.games = [read_game(text) for text in GAMES]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_should_return_games_and_move_statistics_of_position(self):
+        self.assertEqual(5 + 5 + 3, build_position_index(self.games, self.path))
+        with PositionIndex(self.path) as index:
+            statistics = index.probe(fen_board_factory(START_FEN))
+            self.assertEqual([0, 1, 2], statistics.games)
+            self.assertEqual({'1-0': 1, '0-1': 1, '1/2-1/2': 1}, statistics.result_counts)
+            self.assertEqual({
+                encode_move(self.games[0][1][0]): 1,
+                encode_move(self.games[1][1][0]): 1,
+                encode_move(self.games[2][1][0]): 1,
+            }, statistics.move_counts)
+
+    def test_should_find_position_reached_by_transposition(self):
+        build_position_index(self.games, self.path)
+        with PositionIndex(self.path) as index:
+            statistics = index.probe(fen_board_factory(AFTER_E4_E5_NF3_NC6))
+        self.assertEqual([0, 1], statistics.games)
+        self.assertEqual({NO_MOVE: 2}, statistics.move_counts)
+        self.assertEqual(2, statistics.occurrences())
+
+    def test_should_find_position_reached_by_transposition_ending_with_two_step_pawn_move(self):
+        build_position_index(self.games, self.path)
+        with PositionIndex(self.path) as index:
+            statistics = index.probe(fen_board_factory(AFTER_NF3_E5_E4))
+        self.assertEqual([0, 1], statistics.games)
+        self.assertEqual({encode_move(self.games[0][1][3]): 2}, statistics.move_counts)
+
+    def test_should_find_position_from_fen_without_en_passant_position(self):
+        build_position_index(self.games, self.path)
+        with PositionIndex(self.path) as index:
+            statistics = index.probe(fen_board_factory(AFTER_E4))
+        self.assertEqual([0], statistics.games)
+        self.assertEqual(1, statistics.occurrences())
+
+    def test_should_merge_sorted_runs_when_index_exceeds_chunk(self):
+        merged_path = os.path.join(self.directory.name, 'merged.bin')
+        build_position_index(self.games, self.path)
+        build_position_index(self.games, merged_path, chunk_records=4)
+        with open(self.path, 'rb') as file, open(merged_path, 'rb') as merged_file:
+            self.assertEqual(file.read(), merged_file.read())
+
+    def test_should_return_no_game_when_position_unknown(self):
+        build_position_index(self.games, self.path)
+        with PositionIndex(self.path) as index:
+            statistics = index.probe(fen_board_factory('4k3/8/8/8/8/8/8/4K3 w - - 0 1'))
+        self.assertEqual([], statistics.games)
+        self.assertEqual(0, statistics.occurrences())
+
+
+if __name__ == '__main__':
+    unittest.main()
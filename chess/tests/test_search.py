@@ -0,0 +1,74 @@
+import unittest
+
+from chess.board import board_factory, fen_board_factory
+from chess.data import PieceColor
+from chess.game_manager import fen_game_manager_factory
+from chess.search import search, SearchEngine, SearchLimits, MATE_SCORE
+
+
+class TestSearch(unittest.TestCase):
+
+    def test_should_find_back_rank_mate_in_one(self):
+        board = board_factory(situation={'a1': 'wr', 'g1': 'wk', 'g8': 'bk', 'f7': 'bp', 'g7': 'bp', 'h7': 'bp'})
+        result = search(board, PieceColor.WHITE, SearchLimits(depth=3))
+        self.assertEqual('a1a8', result.best_move.to_uci())
+        self.assertEqual(MATE_SCORE - 1, result.score)
+
+    def test_should_take_hanging_queen(self):
+        board = board_factory(situation={'e1': 'wk', 'd1': 'wr', 'd5': 'bq', 'e8': 'bk'})
+        result = search(board, PieceColor.WHITE, SearchLimits(depth=2))
+        self.assertEqual('d1d5', result.best_move.to_uci())
+
+    def test_should_search_for_black(self):
+        board = board_factory(situation={'e1': 'wk', 'd4': 'wq', 'd8': 'br', 'e8': 'bk'})
+        result = search(board, PieceColor.BLACK, SearchLimits(depth=2))
+        self.assertEqual('d8d4', result.best_move.to_uci())
+
+    def test_should_return_principal_variation_starting_with_best_move(self):
+        board = board_factory()
+        result = search(board, PieceColor.WHITE, SearchLimits(depth=3))
+        self.assertEqual(3, result.depth)
+        self.assertEqual(result.best_move, result.principal_variation[0])
+        self.assertEqual(3, len(result.principal_variation))
+
+    def test_should_extend_principal_variation_to_completed_depth_after_transposition_cutoffs(self):
+        board = fen_board_factory('8/2k5/8/8/8/8/2K5/8 w - - 0 1')
+        results = []
+        SearchEngine(board, PieceColor.WHITE).search(SearchLimits(depth=6), on_iteration=results.append)
+        self.assertEqual([result.depth for result in results], [len(result.principal_variation) for result in results])
+        manager = fen_game_manager_factory('8/2k5/8/8/8/8/2K5/8 w - - 0 1')
+        for move in results[-1].principal_variation:
+            self.assertIn(move.to_uci(), [legal_move.to_uci() for legal_move in manager.generate_legal_moves(manager.board, manager.get_current_player())])
+            manager.play(move)
+
+    def test_should_stop_when_node_limit_reached(self):
+        board = board_factory()
+        result = search(board, PieceColor.WHITE, SearchLimits(nodes=300))
+        self.assertLessEqual(result.nodes, 300)
+        self.assertIsNotNone(result.best_move)
+
+    def test_should_leave_board_unchanged_after_search(self):
+        board = board_factory()
+        initial_positions = board.piece_positions.copy()
+        initial_hash = board.hash
+        engine = SearchEngine(board, PieceColor.WHITE)
+        engine.search(SearchLimits(depth=3, nodes=200))
+        self.assertEqual(initial_positions, board.piece_positions)
+        self.assertEqual(initial_hash, board.hash)
+        self.assertEqual(PieceColor.WHITE, engine.manager.current_player)
+
+    def test_should_report_stalemate_as_draw(self):
+        board = board_factory(situation={'a8': 'bk', 'b6': 'wq', 'c1': 'wk'})
+        result = search(board, PieceColor.BLACK, SearchLimits(depth=2))
+        self.assertIsNone(result.best_move)
+        self.assertEqual(0, result.score)
+
+    def test_should_not_grab_defended_pawn_beyond_horizon(self):
+        board = fen_board_factory('4k3/8/4p3/3p4/8/8/8/3QK3 w - - 0 1')
+        result = search(board, PieceColor.WHITE, SearchLimits(depth=1))
+        self.assertNotEqual('d1d5', result.best_move.to_uci())
+        self.assertGreater(result.score, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
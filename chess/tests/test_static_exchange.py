@@ -0,0 +1,47 @@
+import unittest
+
+from chess.attacks import least_valuable_attacker
+from chess.board import fen_board_factory
+from chess.data import PieceColor, PieceName, position_factory, square_from_position
+from chess.game_manager import fen_game_manager_factory
+from chess.packed_move import PackedMove
+from chess.static_exchange import is_losing_capture, static_exchange_evaluation
+
+
+def exchange(fen: str, uci: str) -> int:
+    manager = fen_game_manager_factory(fen)
+    codes = manager.generate_legal_move_codes(manager.board, manager.current_player)
+    code = next(code for code in codes if PackedMove(code).to_uci() == uci)
+    return static_exchange_evaluation(manager.board, code)
+
+
+class TestStaticExchange(unittest.TestCase):
+
+    def test_should_win_undefended_piece(self):
+        self.assertEqual(100, exchange('1k1r4/1pp4p/p7/4p3/8/P5P1/1PP4P/2K1R3 w - - 0 1', 'e1e5'))
+
+    def test_should_lose_queen_for_defended_pawn(self):
+        self.assertEqual(100 - 900, exchange('4k3/8/4p3/3p4/8/8/8/3QK3 w - - 0 1', 'd1d5'))
+
+    def test_should_resolve_exchange_with_x_ray_attackers(self):
+        fen = '1k1r3q/1ppn3p/p4b2/4p3/8/P2N2P1/1PP1R1BP/2K1Q3 w - - 0 1'
+        self.assertEqual(-220, exchange(fen, 'd3e5'))
+        manager = fen_game_manager_factory(fen)
+        codes = manager.generate_legal_move_codes(manager.board, manager.current_player)
+        self.assertTrue(is_losing_capture(manager.board, next(code for code in codes if PackedMove(code).to_uci() == 'd3e5')))
+
+    def test_should_count_en_passant_capture(self):
+        self.assertEqual(100, exchange('4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1', 'e5d6'))
+
+    def test_should_find_least_valuable_attacker(self):
+        board = fen_board_factory('4k3/8/8/3p4/2P2N2/8/8/3QK3 w - - 0 1')
+        square = square_from_position(position_factory('d5'))
+        self.assertEqual((square_from_position(position_factory('c4')), PieceName.PAWN),
+                         least_valuable_attacker(board, square, PieceColor.WHITE, board.get_occupancy()))
+        occupancy = board.get_occupancy() & ~(1 << square_from_position(position_factory('c4')))
+        self.assertEqual((square_from_position(position_factory('f4')), PieceName.NIGHT),
+                         least_valuable_attacker(board, square, PieceColor.WHITE, occupancy))
+
+
+if __name__ == '__main__':
+    unittest.main()
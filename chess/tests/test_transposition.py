@@ -0,0 +1,60 @@
+import unittest
+
+from chess.data import Move, PieceName, position_factory, piece_factory
+from chess.transposition import TranspositionTable, Bound, move_key
+
+
+class TestTranspositionTable(unittest.TestCase):
+
+    def test_should_size_table_from_memory_cap(self):
+        table = TranspositionTable(size_mb=1)
+        self.assertEqual(1024 * 1024, (len(table.keys) + len(table.data)) * table.keys.itemsize)
+
+    def test_should_return_stored_entry_when_probed(self):
+        table = TranspositionTable(size_mb=1)
+        table.store(0x1234_5678_9ABC_DEF0, depth=5, score=-150, bound=Bound.UPPER, move_key=321)
+        entry = table.probe(0x1234_5678_9ABC_DEF0)
+        self.assertEqual((5, -150, Bound.UPPER, 321), (entry.depth, entry.score, entry.bound, entry.move_key))
+
+    def test_should_return_none_when_position_not_stored(self):
+        table = TranspositionTable(size_mb=1)
+        table.store(42, depth=1, score=0, bound=Bound.EXACT)
+        self.assertIsNone(table.probe(42 + table.bucket_count))
+
+    def test_should_keep_deeper_entry_and_use_always_replace_slot(self):
+        table = TranspositionTable(size_mb=1)
+        deep_key, shallow_key, other_key = 7, 7 + table.bucket_count, 7 + 2 * table.bucket_count
+        table.store(deep_key, depth=8, score=10, bound=Bound.EXACT)
+        table.store(shallow_key, depth=2, score=20, bound=Bound.EXACT)
+        table.store(other_key, depth=3, score=30, bound=Bound.EXACT)
+        self.assertEqual(8, table.probe(deep_key).depth)
+        self.assertIsNone(table.probe(shallow_key))
+        self.assertEqual(30, table.probe(other_key).score)
+
+    def test_should_replace_deeper_entry_from_previous_search(self):
+        table = TranspositionTable(size_mb=1)
+        table.store(7, depth=8, score=10, bound=Bound.EXACT)
+        table.new_search()
+        table.store(7 + table.bucket_count, depth=2, score=20, bound=Bound.EXACT)
+        self.assertIsNone(table.probe(7))
+        self.assertEqual(20, table.probe(7 + table.bucket_count).score)
+
+    def test_should_keep_best_move_when_stored_again_without_move(self):
+        table = TranspositionTable(size_mb=1)
+        table.store(99, depth=2, score=10, bound=Bound.LOWER, move_key=555)
+        table.store(99, depth=3, score=15, bound=Bound.UPPER)
+        self.assertEqual(555, table.probe(99).move_key)
+
+    def test_should_pack_move_source_target_and_promotion(self):
+        move = Move(position_factory('b7'), position_factory('b8'), piece_factory('wp'), promotion=PieceName.QUEEN)
+        self.assertEqual(49 | 57 << 6 | PieceName.QUEEN.value << 12, move_key(move))
+
+    def test_should_forget_entries_when_cleared(self):
+        table = TranspositionTable(size_mb=1)
+        table.store(99, depth=2, score=10, bound=Bound.LOWER)
+        table.clear()
+        self.assertIsNone(table.probe(99))
+
+
+if __name__ == '__main__':
+    unittest.main()
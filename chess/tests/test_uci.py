@@ -0,0 +1,94 @@
+import io
+import time
+import unittest
+
+from chess.search import MATE_SCORE
+from chess.uci import UciEngine, format_score, go_limits, parse_go_arguments
+from chess.game_manager import fen_game_manager_factory
+
+
+class TestUci(unittest.TestCase):
+
+    def setUp(self):
+        self.output = io.StringIO()
+        self.engine = UciEngine(self.output)
+
+    def tearDown(self):
+        self.engine.close()
+
+    def lines(self):
+        return self.output.getvalue().splitlines()
+
+    def test_should_identify_and_list_options(self):
+        self.engine.handle('uci')
+        self.engine.handle('isready')
+        self.assertIn('option name Hash type spin default 16 min 1 max 1024', self.lines())
+        self.assertEqual(['uciok', 'readyok'], self.lines()[-2:])
+
+    def test_should_search_position_with_moves_to_depth(self):
+        self.engine.handle('position fen 4k3/8/8/8/8/8/8/R5K1 w - - 0 1 moves g1g2 e8d8')
+        self.engine.handle('go depth 2')
+        self.engine.wait()
+        self.assertTrue(self.lines()[0].startswith('info depth 1 score'))
+        self.assertTrue(self.lines()[-1].startswith('bestmove '))
+        self.assertNotEqual('bestmove 0000', self.lines()[-1])
+
+    def test_should_answer_isready_and_stop_during_infinite_search(self):
+        self.engine.handle('position startpos moves e2e4')
+        self.engine.handle('go infinite')
+        self.engine.handle('isready')
+        self.engine.handle('stop')
+        self.assertIn('readyok', self.lines())
+        self.assertTrue(self.lines()[-1].startswith('bestmove '))
+        self.assertNotEqual('bestmove 0000', self.lines()[-1])
+        self.assertIsNone(self.engine.search_thread)
+
+    def test_should_wait_for_stop_before_best_move_when_infinite_search_ends(self):
+        self.engine.handle('position fen 6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1')
+        self.engine.handle('go infinite')
+        time.sleep(0.5)
+        self.assertTrue(self.engine.search_thread.is_alive())
+        self.assertFalse(any(line.startswith('bestmove') for line in self.lines()))
+        self.engine.handle('stop')
+        self.assertEqual('bestmove a1a8', self.lines()[-1])
+
+    def test_should_reuse_parallel_search_engine_between_searches(self):
+        self.engine.handle('setoption name Threads value 2')
+        self.engine.handle('setoption name Hash value 1')
+        parallel_search_engine = self.engine.parallel_search_engine
+        self.assertIs(parallel_search_engine.transposition_table, self.engine.transposition_table)
+        for moves in ['e2e4', 'e2e4 e7e5']:
+            self.engine.handle(f'position startpos moves {moves}')
+            self.engine.handle('go depth 2')
+            self.engine.wait()
+            self.assertIs(parallel_search_engine, self.engine.parallel_search_engine)
+            self.assertEqual(len(moves.split()), len(parallel_search_engine.position_hashes))
+        self.assertIn('info depth 1', ' '.join(self.lines()))
+        self.assertTrue(self.lines()[-1].startswith('bestmove '))
+        self.engine.handle('ucinewgame')
+        self.assertIsNone(parallel_search_engine.transposition_table.probe(self.engine.manager.board.hash))
+
+    def test_should_apply_options_and_report_bad_moves(self):
+        self.engine.handle('setoption name Hash value 2')
+        self.engine.handle('setoption name Threads value 3')
+        self.engine.handle('position startpos moves e2e5')
+        self.assertEqual(2, self.engine.hash_size_mb)
+        self.assertEqual(3, self.engine.threads)
+        self.assertTrue(self.lines()[-1].startswith('info string e2e5 is not a legal move'))
+        self.assertFalse(self.engine.handle('quit'))
+
+    def test_should_report_invalid_fen_and_keep_running(self):
+        self.assertTrue(self.engine.handle('position fen 4k3/8/8/8/8/8/8/4K3 w - z9 0 1'))
+        self.assertTrue(self.lines()[-1].startswith('info string 4k3/8/8/8/8/8/8/4K3 w - z9 0 1 is not a valid FEN'))
+
+    def test_should_convert_go_arguments_to_limits(self):
+        manager = fen_game_manager_factory('4k3/8/8/8/8/8/8/R5K1 b - - 0 1')
+        self.assertEqual(5, go_limits(parse_go_arguments(['depth', '5', 'nodes', '100']), manager).depth)
+        self.assertEqual(0.25, go_limits(parse_go_arguments(['movetime', '250']), manager).time)
+        self.assertEqual(1.0, go_limits(parse_go_arguments(['wtime', '60000', 'btime', '20000', 'movestogo', '20']), manager).time)
+        self.assertEqual('mate 2', format_score(MATE_SCORE - 3))
+        self.assertEqual('mate -1', format_score(-MATE_SCORE + 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
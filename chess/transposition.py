@@ -0,0 +1,135 @@
+from array import array
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Union
+
+from chess.data import Move
+from chess.packed_move import pack_move
+
+SLOT_SIZE = 16
+BUCKET_SLOT_COUNT = 2
+DEPTH_PREFERRED_SLOT = 0
+ALWAYS_REPLACE_SLOT = 1
+
+MOVE_BITS = 16
+SCORE_BITS = 32
+DEPTH_BITS = 8
+BOUND_BITS = 2
+GENERATION_BITS = 6
+SCORE_SHIFT = MOVE_BITS
+DEPTH_SHIFT = SCORE_SHIFT + SCORE_BITS
+BOUND_SHIFT = DEPTH_SHIFT + DEPTH_BITS
+GENERATION_SHIFT = BOUND_SHIFT + BOUND_BITS
+SCORE_OFFSET = 1 << (SCORE_BITS - 1)
+
+
+class Bound(Enum):
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+
+@dataclass(frozen=True)
+class TranspositionEntry:
+    depth: int
+    score: int
+    bound: Bound
+    move_key: int
+
+
+def move_key(move: Optional[Move]) -> int:
+    if move is None:
+        return 0
+    return pack_move(move).key
+
+
+def table_bucket_count(size_mb: int) -> int:
+    bucket_count = max(1, size_mb * 1024 * 1024 // (SLOT_SIZE * BUCKET_SLOT_COUNT))
+    return 1 << (bucket_count.bit_length() - 1)
+
+
+def table_byte_size(size_mb: int) -> int:
+    return table_bucket_count(size_mb) * BUCKET_SLOT_COUNT * SLOT_SIZE
+
+
+class TranspositionTable:
+    keys: Union[array, memoryview]
+    data: Union[array, memoryview]
+    bucket_count: int
+    generation: int
+    shared_memory: Optional[SharedMemory]
+
+    def __init__(self, size_mb: int = 16, shared_memory: Optional[SharedMemory] = None):
+        self.bucket_count = table_bucket_count(size_mb)
+        slot_count = self.bucket_count * BUCKET_SLOT_COUNT
+        self.shared_memory = shared_memory
+        if shared_memory is None:
+            self.keys = array('Q', [0]) * slot_count
+            self.data = array('Q', [0]) * slot_count
+        else:
+            if shared_memory.size < table_byte_size(size_mb):
+                raise ValueError(f'Shared memory {shared_memory.name} is too small for a {size_mb} MB table')
+            words = shared_memory.buf.cast('Q')
+            self.keys = words[:slot_count]
+            self.data = words[slot_count:2 * slot_count]
+            words.release()
+        self.generation = 0
+
+    def close(self):
+        if self.shared_memory is not None:
+            self.keys.release()
+            self.data.release()
+            self.shared_memory.close()
+
+    def clear(self):
+        self.keys[:] = array('Q', [0]) * len(self.keys)
+        self.data[:] = array('Q', [0]) * len(self.data)
+        self.generation = 0
+
+    def new_search(self):
+        self.generation = (self.generation + 1) % (1 << GENERATION_BITS)
+
+    def probe(self, key: int) -> Optional[TranspositionEntry]:
+        index = (key & (self.bucket_count - 1)) * BUCKET_SLOT_COUNT
+        for slot in range(index, index + BUCKET_SLOT_COUNT):
+            data = self.data[slot]
+            if self.keys[slot] ^ data == key and data != 0:
+                return TranspositionEntry(
+                    depth=(data >> DEPTH_SHIFT) & ((1 << DEPTH_BITS) - 1),
+                    score=((data >> SCORE_SHIFT) & ((1 << SCORE_BITS) - 1)) - SCORE_OFFSET,
+                    bound=Bound((data >> BOUND_SHIFT) & ((1 << BOUND_BITS) - 1)),
+                    move_key=data & ((1 << MOVE_BITS) - 1),
+                )
+        return None
+
+    def store(self, key: int, depth: int, score: int, bound: Bound, move_key: int = 0):
+        index = (key & (self.bucket_count - 1)) * BUCKET_SLOT_COUNT
+        depth_slot = index + DEPTH_PREFERRED_SLOT
+        previous_data = self.data[depth_slot]
+        previous_depth = (previous_data >> DEPTH_SHIFT) & ((1 << DEPTH_BITS) - 1)
+        previous_generation = previous_data >> GENERATION_SHIFT
+        is_same_position = self.keys[depth_slot] ^ previous_data == key
+        if previous_data == 0 or is_same_position or depth >= previous_depth or previous_generation != self.generation:
+            slot = depth_slot
+        else:
+            slot = index + ALWAYS_REPLACE_SLOT
+        if move_key == 0 and self.keys[slot] ^ self.data[slot] == key:
+            move_key = self.data[slot] & ((1 << MOVE_BITS) - 1)
+
+        data = (move_key |
+                (max(1 - SCORE_OFFSET, min(score, SCORE_OFFSET - 1)) + SCORE_OFFSET) << SCORE_SHIFT |
+                max(0, min(depth, (1 << DEPTH_BITS) - 1)) << DEPTH_SHIFT |
+                bound.value << BOUND_SHIFT |
+                self.generation << GENERATION_SHIFT)
+        self.keys[slot] = key ^ data
+        self.data[slot] = data
+
+    def hashfull(self) -> int:
+        sample_size = min(1000, len(self.data))
+        used = sum(1 for slot in range(sample_size) if self.data[slot] != 0 and self.data[slot] >> GENERATION_SHIFT == self.generation)
+        return used * 1000 // sample_size
+
+
+def shared_transposition_table(size_mb: int = 16) -> TranspositionTable:
+    return TranspositionTable(size_mb, SharedMemory(create=True, size=table_byte_size(size_mb)))
@@ -0,0 +1,225 @@
+import sys
+import threading
+from typing import Dict, List, Optional, TextIO, Union
+
+from chess.board import START_FEN
+from chess.data import Move, PieceColor
+from chess.game_manager import GameManager, fen_game_manager_factory
+from chess.parallel_search import ParallelSearchEngine
+from chess.search import MATE_SCORE, SearchEngine, SearchLimits, SearchResult, is_mate_score
+from chess.transposition import TranspositionTable
+
+ENGINE_NAME = 'Chess for Nicolas'
+ENGINE_AUTHOR = 'Robin Chalas'
+DEFAULT_HASH_SIZE_MB = 16
+MIN_HASH_SIZE_MB = 1
+MAX_HASH_SIZE_MB = 1024
+DEFAULT_THREADS = 1
+MAX_THREADS = 64
+DEFAULT_MOVES_TO_GO = 30
+STOP_POLL_SECONDS = 0.1
+GO_INTEGER_ARGUMENTS = ['depth', 'nodes', 'movetime', 'wtime', 'btime', 'winc', 'binc', 'movestogo']
+
+
+def parse_uci_move(manager: GameManager, text: str) -> Move:
+    for move in manager.generate_legal_moves(manager.board, manager.current_player):
+        if move.to_uci() == text:
+            return move
+    raise ValueError(f'{text} is not a legal move in {manager.to_fen()}')
+
+
+def format_score(score: int) -> str:
+    if is_mate_score(score):
+        return f'mate {(MATE_SCORE - score + 1) // 2}' if score > 0 else f'mate -{(MATE_SCORE + score) // 2}'
+    return f'cp {score}'
+
+
+def format_info(result: SearchResult) -> str:
+    return (f'info depth {result.depth} score {format_score(result.score)} nodes {result.nodes} '
+            f'nps {result.nodes_per_second()} time {int(result.elapsed * 1000)} '
+            f'pv {" ".join(move.to_uci() for move in result.principal_variation)}').rstrip()
+
+
+def parse_go_arguments(tokens: List[str]) -> Dict[str, int]:
+    arguments = {}
+    for index, token in enumerate(tokens[:-1]):
+        if token in GO_INTEGER_ARGUMENTS:
+            arguments[token] = int(tokens[index + 1])
+    return arguments
+
+
+def go_limits(arguments: Dict[str, int], manager: GameManager) -> SearchLimits:
+    time = arguments['movetime'] / 1000 if 'movetime' in arguments else None
+    is_white = manager.current_player == PieceColor.WHITE
+    remaining_time = arguments.get('wtime' if is_white else 'btime')
+    if time is None and remaining_time is not None:
+        increment = arguments.get('winc' if is_white else 'binc', 0)
+        moves_to_go = arguments.get('movestogo', DEFAULT_MOVES_TO_GO)
+        time = min(remaining_time / 2, remaining_time / moves_to_go + increment / 2) / 1000
+    if 'depth' in arguments:
+        return SearchLimits(depth=arguments['depth'], nodes=arguments.get('nodes'), time=time)
+    return SearchLimits(nodes=arguments.get('nodes'), time=time)
+
+
+class UciEngine:
+    output: TextIO
+    manager: GameManager
+    position_hashes: List[int]
+    hash_size_mb: int
+    threads: int
+    transposition_table: TranspositionTable
+    parallel_search_engine: Optional[ParallelSearchEngine]
+    search_engine: Optional[Union[SearchEngine, ParallelSearchEngine]]
+    search_thread: Optional[threading.Thread]
+    stop_requested: threading.Event
+    output_lock: threading.Lock
+
+    def __init__(self, output: TextIO = sys.stdout):
+        self.output = output
+        self.manager = fen_game_manager_factory(START_FEN)
+        self.position_hashes = []
+        self.hash_size_mb = DEFAULT_HASH_SIZE_MB
+        self.threads = DEFAULT_THREADS
+        self.transposition_table = TranspositionTable(self.hash_size_mb)
+        self.parallel_search_engine = None
+        self.search_engine = None
+        self.search_thread = None
+        self.stop_requested = threading.Event()
+        self.output_lock = threading.Lock()
+
+    def send(self, line: str):
+        with self.output_lock:
+            self.output.write(line + '\n')
+            self.output.flush()
+
+    def run(self, input_stream: TextIO = sys.stdin):
+        for line in input_stream:
+            if not self.handle(line):
+                break
+        self.close()
+
+    def handle(self, line: str) -> bool:
+        tokens = line.split()
+        if len(tokens) == 0:
+            return True
+        try:
+            return self.handle_command(tokens[0], tokens[1:])
+        except ValueError as error:
+            self.send(f'info string {error}')
+            return True
+
+    def handle_command(self, command: str, tokens: List[str]) -> bool:
+        if command == 'uci':
+            self.send(f'id name {ENGINE_NAME}')
+            self.send(f'id author {ENGINE_AUTHOR}')
+            self.send(f'option name Hash type spin default {DEFAULT_HASH_SIZE_MB} min {MIN_HASH_SIZE_MB} max {MAX_HASH_SIZE_MB}')
+            self.send(f'option name Threads type spin default {DEFAULT_THREADS} min 1 max {MAX_THREADS}')
+            self.send('uciok')
+        elif command == 'isready':
+            self.send('readyok')
+        elif command == 'setoption':
+            self.set_option(tokens)
+        elif command == 'ucinewgame':
+            self.stop()
+            self.transposition_table.clear()
+        elif command == 'position':
+            self.stop()
+            self.set_position(tokens)
+        elif command == 'go':
+            self.go(tokens)
+        elif command == 'stop':
+            self.stop()
+        elif command == 'quit':
+            return False
+        return True
+
+    def set_option(self, tokens: List[str]):
+        if 'name' not in tokens or 'value' not in tokens:
+            return
+        name = ' '.join(tokens[tokens.index('name') + 1:tokens.index('value')]).lower()
+        value = ' '.join(tokens[tokens.index('value') + 1:])
+        self.stop()
+        if name == 'hash':
+            self.hash_size_mb = max(MIN_HASH_SIZE_MB, min(int(value), MAX_HASH_SIZE_MB))
+            self.create_search_engine()
+        elif name == 'threads':
+            self.threads = max(1, min(int(value), MAX_THREADS))
+            self.create_search_engine()
+
+    def create_search_engine(self):
+        self.close_parallel_search_engine()
+        if self.threads > 1:
+            self.parallel_search_engine = ParallelSearchEngine(self.manager.board.copy(), self.manager.current_player, self.threads, self.hash_size_mb)
+            self.transposition_table = self.parallel_search_engine.transposition_table
+        else:
+            self.transposition_table = TranspositionTable(self.hash_size_mb)
+
+    def close_parallel_search_engine(self):
+        if self.parallel_search_engine is not None:
+            self.parallel_search_engine.close()
+            self.parallel_search_engine = None
+
+    def set_position(self, tokens: List[str]):
+        moves_index = tokens.index('moves') if 'moves' in tokens else len(tokens)
+        if len(tokens) > 0 and tokens[0] == 'fen':
+            fen = ' '.join(tokens[1:moves_index])
+        else:
+            fen = START_FEN
+        manager = fen_game_manager_factory(fen)
+        position_hashes = []
+        for text in tokens[moves_index + 1:]:
+            position_hashes.append(manager.board.hash)
+            manager.play(parse_uci_move(manager, text))
+        self.manager = manager
+        self.position_hashes = position_hashes
+
+    def go(self, tokens: List[str]):
+        self.stop()
+        limits = go_limits(parse_go_arguments(tokens), self.manager)
+        board = self.manager.board.copy()
+        if self.parallel_search_engine is not None:
+            self.search_engine = self.parallel_search_engine
+            self.search_engine.set_position(board, self.manager.current_player, self.position_hashes)
+        else:
+            self.search_engine = SearchEngine(board, self.manager.current_player, self.transposition_table)
+            self.search_engine.position_hashes = list(self.position_hashes)
+        self.stop_requested.clear()
+        self.search_thread = threading.Thread(target=self.search, args=(self.search_engine, limits, 'infinite' in tokens), daemon=True)
+        self.search_thread.start()
+
+    def search(self, search_engine: Union[SearchEngine, ParallelSearchEngine], limits: SearchLimits, infinite: bool = False):
+        result = search_engine.search(limits, on_iteration=lambda iteration: self.send(format_info(iteration)))
+        if infinite:
+            self.stop_requested.wait()
+        best_move = result.best_move
+        if best_move is None:
+            legal_moves = self.manager.generate_legal_moves(self.manager.board.copy(), self.manager.current_player)
+            best_move = legal_moves[0] if len(legal_moves) > 0 else None
+        self.send(f'bestmove {"0000" if best_move is None else best_move.to_uci()}')
+
+    def stop(self):
+        if self.search_thread is None:
+            return
+        self.stop_requested.set()
+        while self.search_thread.is_alive():
+            self.search_engine.stop()
+            self.search_thread.join(STOP_POLL_SECONDS)
+        self.search_thread = None
+        self.search_engine = None
+
+    def close(self):
+        self.stop()
+        self.close_parallel_search_engine()
+
+    def wait(self):
+        if self.search_thread is not None:
+            self.search_thread.join()
+
+
+def main():
+    with open(sys.stdin.fileno(), closefd=False) as input_stream:
+        UciEngine().run(input_stream)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+import random
+from typing import Optional
+
+from chess.data import Piece, PieceColor, PieceName, Position, square_from_position, BOARD_SIZE
+
+ZOBRIST_SEED = 0x5EED_C4E55
+
+_random = random.Random(ZOBRIST_SEED)
+PIECE_KEYS = [[[_random.getrandbits(64) for _ in range(BOARD_SIZE * BOARD_SIZE)] for _ in PieceName] for _ in PieceColor]
+SIDE_KEY = _random.getrandbits(64)
+CASTLING_RIGHT_KEYS = [_random.getrandbits(64) for _ in range(4)]
+CASTLING_KEYS = [0] * 16
+for _castling_rights in range(16):
+    for _bit, _key in enumerate(CASTLING_RIGHT_KEYS):
+        if _castling_rights & (1 << _bit):
+            CASTLING_KEYS[_castling_rights] ^= _key
+EN_PASSANT_KEYS = [_random.getrandbits(64) for _ in range(BOARD_SIZE)]
+
+
+def piece_key(piece: Piece, position: Position) -> int:
+    return PIECE_KEYS[piece.color.value][piece.name.value][square_from_position(position)]
+
+
+def castling_key(castling_rights: int) -> int:
+    return CASTLING_KEYS[castling_rights]
+
+
+def en_passant_key(en_passant_position: Optional[Position]) -> int:
+    return 0 if en_passant_position is None else EN_PASSANT_KEYS[en_passant_position.col]
+
+
+def side_key(color: PieceColor) -> int:
+    return SIDE_KEY if color == PieceColor.BLACK else 0